@@ -1,10 +1,12 @@
-import numpy as np
-import cv2
+import time
 from PySide6 import QtCore, QtGui, QtWidgets
 
-from src.ui.qt_app import GestureEngine, GESTURE_LABELS, ACTION_CHOICES, DEFAULT_BINDINGS
+from src.ui.qt_app import GestureEngine, GESTURE_LABELS, DEFAULT_BINDINGS, ENGINE_OPTIONS
+from src.system.registry import action_choices
 from src.storage.db import UrlStore
 
+UNBOUND = "(none)"      # combo entry for a gesture without an action (stored as "" so defaults don't return)
+
 # ---------- URL editor dialogs ----------
 
 class UrlEditDialog(QtWidgets.QDialog):
@@ -160,9 +162,13 @@ class MainWindow(QtWidgets.QMainWindow):
         h.addWidget(panel, stretch=2)
         self.setCentralWidget(central)
 
-        # Store + Engine
+        # Store + Engine (saved bindings / thresholds / camera / engine params, loaded in one read)
         self.store = UrlStore()
-        self.engine = GestureEngine(camera_index=0, bindings=self._default_bindings_resolved(), url_store=self.store)
+        cfg = self.store.config
+        engine_opts = {k: v for k, v in cfg.engine.items() if k in ENGINE_OPTIONS}
+        cam = cfg.camera_index if cfg.camera_index is not None else 0
+        self.engine = GestureEngine(camera_index=cam, bindings=self._default_bindings_resolved(), url_store=self.store,
+                                    render_rgb=True, thresholds=dict(cfg.thresholds), **engine_opts)
 
         # Build gesture combos now that store is ready
         self._build_gesture_combos(map_layout)
@@ -176,6 +182,10 @@ class MainWindow(QtWidgets.QMainWindow):
         # Status bar (show DB path)
         self.statusBar().showMessage(f"DB: {self.store.path}")
 
+        # Preview size cache: (label size, frame size) -> target size, recomputed only on change
+        self._fit_key = None
+        self._fit_size = None
+
         # Timer: fetch frame & render
         self.timer = QtCore.QTimer(self)
         self.timer.setInterval(1000 // 30)
@@ -186,18 +196,17 @@ class MainWindow(QtWidgets.QMainWindow):
     def _current_action_choices(self):
         names = self.store.list_names()
         url_actions = [f"OPEN_URL:{n}" for n in names]
-        return ACTION_CHOICES + url_actions
+        return [UNBOUND] + action_choices() + url_actions    # registry read each time: late register() calls show up
 
     def _build_gesture_combos(self, map_layout: QtWidgets.QFormLayout):
         choices = self._current_action_choices()
+        bindings = self.engine.bindings
         for g in GESTURE_LABELS:
             cb = QtWidgets.QComboBox()
             cb.addItems(choices)
-            # set default if provided and present in choices
-            if g in DEFAULT_BINDINGS:
-                idx = cb.findText(DEFAULT_BINDINGS[g])
-                if idx >= 0:
-                    cb.setCurrentIndex(idx)
+            # set saved / default binding if provided and present in choices; otherwise unbound
+            idx = cb.findText(bindings.get(g, UNBOUND))
+            cb.setCurrentIndex(max(idx, 0))
             self.combo_map[g] = cb
             map_layout.addRow(g, cb)
 
@@ -219,14 +228,18 @@ class MainWindow(QtWidgets.QMainWindow):
 
     # ----- Bindings helpers -----
     def _default_bindings_resolved(self):
-        # DEFAULT_BINDINGS already uses OPEN_URL:<DefaultName>
-        return dict(DEFAULT_BINDINGS)
+        # DEFAULT_BINDINGS already uses OPEN_URL:<DefaultName>; saved bindings override it ("" = unbound)
+        merged = {**DEFAULT_BINDINGS, **self.store.config.bindings}
+        return {g: a for g, a in merged.items() if a}
 
     def _collect_bindings(self):
-        return {g: cb.currentText() for g, cb in self.combo_map.items()}
+        return {g: cb.currentText() for g, cb in self.combo_map.items() if cb.currentText() != UNBOUND}
 
     def _update_bindings(self):
-        self.engine.set_bindings(self._collect_bindings())
+        bindings = self._collect_bindings()
+        self.engine.set_bindings(bindings)
+        # debounced: one commit per burst of combo changes
+        self.store.set_bindings({g: bindings.get(g, "") for g in self.combo_map})
 
     # ----- URL manager -----
     def _on_manage_urls(self):
@@ -236,19 +249,27 @@ class MainWindow(QtWidgets.QMainWindow):
         self._refresh_action_choices_on_all_combos()
 
     # ----- Frame rendering -----
+    def _preview_size(self, w: int, h: int):
+        key = (self.video_label.width(), self.video_label.height(), w, h)
+        if key != self._fit_key:
+            fit = QtCore.QSize(w, h).scaled(self.video_label.size(), QtCore.Qt.KeepAspectRatio)
+            self._fit_key, self._fit_size = key, (max(1, fit.width()), max(1, fit.height()))
+        return self._fit_size
+
     def _on_tick(self):
-        frame_bgr, _ = self.engine.step()
-        if frame_bgr is None:
+        # Engine renders in RGB: no colour conversion or extra copy here
+        frame_rgb, _ = self.engine.step()
+        if frame_rgb is None:
             return
-        frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
-        frame_rgb = np.ascontiguousarray(frame_rgb)
-        h, w, ch = frame_rgb.shape
-        qimg = QtGui.QImage(frame_rgb.data, w, h, ch * w, QtGui.QImage.Format.Format_RGB888)
-        pix = QtGui.QPixmap.fromImage(qimg).scaled(
-            self.video_label.width(), self.video_label.height(),
-            QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
-        )
-        self.video_label.setPixmap(pix)
+        t = time.perf_counter()
+        h, w = frame_rgb.shape[:2]
+        tw, th = self._preview_size(w, h)
+        qimg = QtGui.QImage(frame_rgb.data, w, h, frame_rgb.strides[0], QtGui.QImage.Format.Format_RGB888)
+        pixmap = QtGui.QPixmap.fromImage(qimg)        # Qt scales the native-format pixmap
+        if (tw, th) != (w, h):
+            pixmap = pixmap.scaled(tw, th, QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation)
+        self.video_label.setPixmap(pixmap)
+        self.engine.perf.lap("present", t)
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         try: self.timer.stop()
@@ -0,0 +1,83 @@
+"""
+Chunked batch recognition (src/replay/batch) with a stand-in recognizer, so
+it runs without the model: checks that sharded output equals a one-chunk
+run and reports throughput per worker count.
+
+    python -m benchmarks.batch_sharding [--seconds 120] [--workers 1 2 4]
+
+The stand-in reads the gesture from the frame's brightness and burns
+`--cost-ms` of CPU per frame to stand in for the model.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+from src.replay.batch import run_batch
+from src.replay.recording import Recording
+from tests.fixtures import make_result
+
+LABELS = ("None", "Thumb_Up", "Thumb_Down", "Victory", "Open_Palm")
+COST_MS = 2.0
+
+class StandInRecognizer:
+    def __init__(self, cost_ms):
+        self.cost_s = cost_ms / 1000.0
+        self.results = [make_result(1, label=lab, score=0.9, seed=i) for i, lab in enumerate(LABELS)]
+
+    def recognize_for_video(self, image, ts_ms):
+        t_end = time.perf_counter() + self.cost_s
+        while time.perf_counter() < t_end:
+            pass
+        level = int(image.numpy_view()[0, 0, 0]) // 50
+        return self.results[level] if level < len(self.results) else None
+
+    def close(self):
+        pass
+
+def stand_in_factory(model_path, num_hands):
+    return StandInRecognizer(COST_MS)
+
+def make_video(path, seconds, fps=30):
+    w = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), fps, (160, 120))
+    rnd = np.random.default_rng(0)
+    level = 0
+    for i in range(int(seconds * fps)):
+        if i % 20 == 0:
+            level = int(rnd.integers(0, len(LABELS) + 1))
+        w.write(np.full((120, 160, 3), level * 50 + 10, np.uint8))
+    w.release()
+
+def timeline(path):
+    rec = Recording(path)
+    out = [(h.ts_ms, h.top) for h in rec]
+    rec.close()
+    return out
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--seconds", type=float, default=120.0)
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    args = ap.parse_args()
+    with tempfile.TemporaryDirectory() as d:
+        clip = os.path.join(d, "clip.avi")
+        make_video(clip, args.seconds)
+        ref = run_batch([clip], os.path.join(d, "ref"), chunk_s=1e9, workers=1,
+                        recognizer_factory=stand_in_factory)[0]
+        expected = timeline(ref["output"])
+        print(f"one chunk: {ref['frames']} frames, {ref['fires']} fires")
+        for workers in sorted(set(args.workers)):
+            t = time.perf_counter()
+            out = run_batch([clip], os.path.join(d, f"w{workers}"), chunk_s=10, overlap_s=1, workers=workers,
+                            recognizer_factory=stand_in_factory)[0]
+            dt = time.perf_counter() - t
+            assert timeline(out["output"]) == expected, "sharded timeline differs"
+            assert out["fires"] == ref["fires"], (out["fires"], ref["fires"])
+            print(f"workers={workers:<3} chunks={out['chunks']:<3} {out['frames'] / dt:8.0f} frames/s "
+                  f"(timeline == one chunk)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Feeds synthetic result streams through GestureDebouncer at several inference
+rates and prints when the command fires: the hold time to trigger should stay
+put from 15 to 120 FPS, and re-polling a stale result must not change it.
+The second table holds VOL_UP for 2 s with a VolumeRamp: backend calls and
+the final volume should not depend on the FPS either.
+
+    python -m benchmarks.debounce_streams [--hold-ms 100] [--ticks-per-result 3]
+"""
+import argparse
+
+from src.logic.debounce import GestureDebouncer
+from src.logic.ramp import VolumeRamp
+
+def run_stream(fps, hold_sec=1.0, gap_sec=0.5, cycles=3, ticks=1, **kw):
+    """`cycles` x (hold a pose `hold_sec`, then no hand for `gap_sec`); returns fire times (ms from pose start)."""
+    deb, fired = GestureDebouncer(**kw), []
+    period = 1000.0 / fps
+    t, seq = 0.0, 0
+    for c in range(cycles):
+        start = t
+        for cmd, dur in (("VOL_UP", hold_sec), (None, gap_sec)):
+            end = t + dur * 1000
+            while t < end:
+                for _ in range(ticks):       # UI timer polling faster than results arrive
+                    if deb.update(cmd, seq, t) is not None:
+                        fired.append(round(t - start, 1))
+                seq += 1
+                t += period
+    return fired
+
+def run_ramp(fps, hold_sec=2.0, start=50, **kw):
+    """Hold VOL_UP for `hold_sec`, then release; returns the VOL_SET targets sent."""
+    deb, ramp, sent = GestureDebouncer(), VolumeRamp(**kw), []
+    period, t, seq = 1000.0 / fps, 0.0, 0
+    for cmd, dur in (("VOL_UP", hold_sec), (None, 0.3)):
+        end = t + dur * 1000
+        while t < end:
+            fired = deb.update(cmd, seq, t)
+            if fired: start = min(100, start + 6)              # the single step that fired
+            target = ramp.update(deb.held_cmd, deb.held_since_ms, t, start)
+            if target is not None:
+                sent.append(target)
+            seq += 1
+            t += period
+    return sent
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--hold-ms", type=float, default=100.0)
+    ap.add_argument("--ticks-per-result", type=int, default=3)
+    args = ap.parse_args()
+    print(f"{'fps':>5}  fires (ms after the pose appeared)")
+    for fps in (15, 24, 30, 60, 120):
+        fired = run_stream(fps, ticks=args.ticks_per_result, hold_ms=args.hold_ms)
+        print(f"{fps:>5}  {fired}")
+    print(f"\n{'fps':>5}  {'calls':>5}  VOL_SET targets (VOL_UP held 2 s from 50)")
+    for fps in (15, 30, 60, 120):
+        sent = run_ramp(fps)
+        print(f"{fps:>5}  {len(sent):>5}  {sent}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Batched draw_hands vs the previous per-edge / per-point implementation.
+
+    python -m benchmarks.draw_batch [--save-png out_dir]
+"""
+import argparse
+import os
+
+import cv2
+
+from src.paths import C_LINE, C_PT
+from src.vision.draw import HAND_CONNECTIONS, draw_hands
+from tests.fixtures import make_frame, make_hands
+from .harness import bench, report
+
+def draw_hands_per_call(frame_bgr, hands):
+    """Reference: one cv2.line per connection and one cv2.circle per landmark."""
+    if hands is None or not hands.n_hands:
+        return
+    h, w = frame_bgr.shape[:2]
+    for pts in (hands.landmarks[:, :, :2] * (w, h)).astype(int).tolist():
+        pts = [tuple(p) for p in pts]
+        for a, b in HAND_CONNECTIONS:
+            if 0 <= a < len(pts) and 0 <= b < len(pts):
+                cv2.line(frame_bgr, pts[a], pts[b], C_LINE, 2, cv2.LINE_AA)
+        for pt in pts:
+            cv2.circle(frame_bgr, pt, 3, C_PT, -1, cv2.LINE_AA)
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("-n", type=int, default=2000)
+    ap.add_argument("--save-png", default=None, help="write the three renderings here for a visual diff")
+    args = ap.parse_args()
+
+    frame = make_frame()
+    for n_hands in (1, 2):
+        hands = make_hands(n_hands, seed=n_hands)
+        t_old = bench(lambda: draw_hands_per_call(frame, hands), args.n)
+        t_aa = bench(lambda: draw_hands(frame, hands), args.n)
+        t_fast = bench(lambda: draw_hands(frame, hands, aa=False), args.n)
+        report(f"per-call ({n_hands} hand)", t_old)
+        report(f"batched AA ({n_hands} hand)", t_aa)
+        report(f"batched fast ({n_hands} hand)", t_fast)
+        print(f"speedup AA {t_old / t_aa:.2f}x, fast {t_old / t_fast:.2f}x")
+
+    if args.save_png:
+        os.makedirs(args.save_png, exist_ok=True)
+        hands = make_hands(2, seed=0)
+        for name, fn in (("per_call", lambda f: draw_hands_per_call(f, hands)),
+                         ("batched_aa", lambda f: draw_hands(f, hands)),
+                         ("batched_fast", lambda f: draw_hands(f, hands, aa=False))):
+            canvas = frame.copy() * 0
+            fn(canvas)
+            cv2.imwrite(os.path.join(args.save_png, f"{name}.png"), canvas)
+
+if __name__ == "__main__":
+    main()
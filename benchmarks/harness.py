@@ -0,0 +1,79 @@
+"""
+Tiny timing helpers shared by the benchmark scripts.
+"""
+import gc
+import json
+import os
+import time
+import tracemalloc
+
+def bench(fn, number=500, warmup=20):
+    """Call fn() `number` times; returns mean seconds per call."""
+    for _ in range(warmup):
+        fn()
+    t0 = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - t0) / number
+
+def report(name, sec_per_call):
+    print(f"{name:<40} {sec_per_call * 1e6:10.1f} us/call  {1.0 / sec_per_call:10.0f} ops/s")
+
+def _autorange(fn, min_time):
+    number = 1
+    while True:
+        t = bench(fn, number, warmup=0)
+        if t * number >= min_time:
+            return number
+        number *= 2 if t * number > min_time / 10 else 10
+
+def measure(fn, min_time=0.2, repeat=5, alloc_calls=50) -> dict:
+    """
+    ops/s (best of `repeat` runs of ~min_time each) plus allocation stats per call:
+      alloc_bytes:    peak traced heap growth while the call runs (temporaries)
+      retained_bytes: traced heap growth still held after the call returns
+    Allocation stats come from tracemalloc, so they cover Python objects and
+    NumPy buffers but not OpenCV/Qt internal allocations.
+    """
+    for _ in range(10):
+        fn()
+    number = _autorange(fn, min_time)
+    best = min(bench(fn, number, warmup=0) for _ in range(repeat))
+
+    peak, retained = _allocs(fn, alloc_calls)
+    peak0, retained0 = _allocs(_noop, alloc_calls)   # tracemalloc bookkeeping itself
+    return {
+        "ops_per_sec": 1.0 / best,
+        "us_per_call": best * 1e6,
+        "alloc_bytes": max(0.0, peak - peak0),
+        "retained_bytes": max(0.0, retained - retained0),
+    }
+
+def _noop():
+    pass
+
+def _allocs(fn, calls):
+    gc.collect()
+    tracemalloc.start()
+    peak = retained = 0
+    try:
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            fn()
+            cur, pk = tracemalloc.get_traced_memory()
+            peak += pk - base
+            retained += cur - base
+    finally:
+        tracemalloc.stop()
+    return peak / calls, retained / calls
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def save_baseline(path, results: dict):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
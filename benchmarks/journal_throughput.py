@@ -0,0 +1,75 @@
+"""
+Gesture event journal: producer cost, sustained write rate, drops and
+aggregate query time (temp db, synthetic events).
+
+    python -m benchmarks.journal_throughput [-n 200000]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from src.storage.journal import EventJournal
+from .harness import report
+
+LABELS = ("Thumb_Up", "Thumb_Down", "Open_Palm", "Victory", "Closed_Fist")
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("-n", type=int, default=200_000)
+    args = ap.parse_args()
+    rnd = random.Random(0)
+    events = [(rnd.choice(("seen", "seen", "near", "fire")), rnd.choice(LABELS), rnd.random())
+              for _ in range(1000)]
+    with tempfile.TemporaryDirectory() as d:
+        j = EventJournal(os.path.join(d, "events.db"), max_buffer=1 << 20, flush_ms=100)
+        t0_ms = int(time.time() * 1000)
+        t0 = time.perf_counter()
+        for i in range(args.n):
+            kind, label, score = events[i % 1000]
+            j.record(kind, label, "VOL_UP", score)
+        report("record() (producer side)", (time.perf_counter() - t0) / args.n)
+        j.flush().result()
+        dt = time.perf_counter() - t0
+        print(f"{args.n} events durable in {dt:.2f}s ({args.n / dt:,.0f}/s), stats {j.stats()}")
+
+        t = time.perf_counter()
+        summary = j.summary(t0_ms).result()
+        report("summary() query", time.perf_counter() - t)
+        t = time.perf_counter()
+        near = j.near_misses(t0_ms).result()
+        report("near_misses() query", time.perf_counter() - t)
+        t = time.perf_counter()
+        j.timeline(t0_ms, bucket_ms=1000).result()
+        report("timeline() query", time.perf_counter() - t)
+        assert sum(r["n"] for r in summary) == args.n, summary
+        print("near-miss rates:", {r["label"]: round(r["near_rate"], 3) for r in near})
+        j.close()
+
+        # Tiny buffer, no time to flush: record() must drop instead of blocking
+        j = EventJournal(os.path.join(d, "small.db"), max_buffer=1000, flush_ms=10_000, batch=10_000)
+        t = time.perf_counter()
+        for i in range(20_000):
+            j.record("seen", "Victory", None, 0.9)
+        report("record() with full buffer", (time.perf_counter() - t) / 20_000)
+        print("bounded buffer:", j.stats())
+        j.close()
+
+        # Stalled disk: nothing leaves the buffer until its insert commits, so memory stays bounded
+        j = EventJournal(os.path.join(d, "slow.db"), max_buffer=5000, flush_ms=5, batch=100)
+        j._writer.submit(lambda c: time.sleep(1.0))
+        for i in range(50_000):
+            j.record("seen", "Victory", None, 0.9)
+            if i % 1000 == 0:
+                time.sleep(0.01)
+        stalled = j.stats()
+        assert stalled["buffered"] <= 5000 and stalled["dropped"] > 0, stalled
+        j.flush().result()
+        done = j.stats()
+        assert done["written"] == done["recorded"] and done["buffered"] == 0, done
+        print("stalled writer:", stalled, "-> after flush:", done)
+        j.close()
+
+if __name__ == "__main__":
+    main()
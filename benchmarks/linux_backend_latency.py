@@ -0,0 +1,50 @@
+"""
+Per-action latency of the Linux backend against stand-in commands (no audio
+server or desktop needed): fake pactl / xdg-open / xset scripts in a temp dir.
+
+    python -m benchmarks.linux_backend_latency [-n 200]
+
+Every CLI action is one subprocess.run (killed after the backend timeout);
+launchers are detached Popen calls.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from src.system.actions_linux import LinuxActions
+from tests.linux_tools import make_tools
+from .harness import report
+
+def timed(fn, n):
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) / n
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("-n", type=int, default=200)
+    args = ap.parse_args()
+    with tempfile.TemporaryDirectory() as d:
+        tools = make_tools(d)
+        act = LinuxActions(tools=tools)
+        act.set_volume(40)
+        act.volume_up()
+        assert act.get_volume() == 46, act.get_volume()
+        with open(os.path.join(d, "volume"), "w") as f:
+            f.write("20\n")                       # changed behind the backend's back
+        act.volume_up()
+        assert act.get_volume() == 26, act.get_volume()
+        print("stand-in volume round trip ok:", act.volume)
+
+        report("volume_up (one relative call)", timed(act.volume_up, args.n))
+        report("get_volume", timed(act.get_volume, args.n))
+        report("mute_toggle", timed(act.mute_toggle, args.n))
+        report("display_sleep", timed(act.display_sleep, args.n))
+        report("open_url (detached)", timed(lambda: act.open_url("https://example.com"), args.n))
+        act.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Micro-benchmarks for the per-frame decision and drawing hot paths.
+
+    python -m benchmarks.micro                 # run and print ops/s + allocations
+    python -m benchmarks.micro --save          # also store results as the baseline
+    python -m benchmarks.micro --compare       # fail (exit 1) on regressions vs the baseline
+    python -m benchmarks.micro -k draw         # only cases whose name contains "draw"
+
+Baselines are machine-specific: save them on the box used for release checks.
+"""
+import argparse
+import itertools
+import os
+import sys
+
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import QtGui
+
+from src.app import MediaPipeGestureApp
+from src.bindings import DEFAULT_BINDINGS
+from src.logic.choose import choose_command
+from src.logic.debounce import make_debouncer
+from src.logic.handframe import HandFrame
+from src.logic.geometry import hand_geometry, index_is_straight, infer_pointing_direction
+from src.perf.trace import Tracer
+from src.vision.draw import HudLayer, draw_hands, draw_hud
+from tests.fixtures import make_frame, make_result
+from .harness import load_baseline, measure, save_baseline
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+def _debounce_app():
+    """MediaPipeGestureApp without recognizer/camera: just the state _maybe_fire() touches."""
+    app = MediaPipeGestureApp.__new__(MediaPipeGestureApp)
+    app.bindings, app.thresholds = dict(DEFAULT_BINDINGS), {}
+    app.last_hands, app.last_ctx = None, None
+    app.debounce = make_debouncer()
+    app.ramp = app.journal = None
+    app.dry_run, app.fired = True, []
+    app.tracer = Tracer(log=False)
+    return app
+
+def cases():
+    raw_two = make_result(2, seed=2)
+    one = HandFrame.from_result(make_result(1, seed=1))
+    two = HandFrame.from_result(raw_two)
+    down = HandFrame.from_result(make_result(1, label="None", index_dir=(0.0, 1.0), seed=3))
+    weak = HandFrame.from_result(make_result(2, score=0.5, seed=4))
+    lm = one.landmarks[0]
+    recording = np.repeat(two.landmarks[None], 1000, axis=0)    # (1000 frames, 2 hands, 21, 3)
+
+    def pointing(hf):
+        hf.geom = None                  # live result: scalar path
+        return infer_pointing_direction(hf)
+    bulk = HandFrame.from_result(raw_two)
+    bulk.geom = hand_geometry(bulk.landmarks)      # replay frame: geometry computed in bulk
+    bindings = dict(DEFAULT_BINDINGS, Pointing_Down="VOL_DOWN")
+    choose = lambda hf: choose_command(hf, bindings)
+
+    app = _debounce_app()
+    stream = itertools.cycle([one] * 6 + [HandFrame.empty()] * 4)
+    clock = itertools.count(0, 33)      # distinct results, ~30 FPS
+    def debounce():
+        hf = app.last_hands = next(stream)
+        hf.ts_ms = next(clock)
+        app._maybe_fire()
+        app.fired.clear()
+
+    frame = make_frame()
+    canvas = frame.copy()
+    hud = HudLayer()
+    rgb = make_frame()
+    qapp = QtGui.QGuiApplication.instance() or QtGui.QGuiApplication([])
+    h, w = rgb.shape[:2]
+    def qt_image():
+        qimg = QtGui.QImage(rgb.data, w, h, rgb.strides[0], QtGui.QImage.Format.Format_RGB888)
+        return QtGui.QPixmap.fromImage(qimg)
+
+    return {
+        "handframe.from_result.2hands": lambda: HandFrame.from_result(raw_two),
+        "geometry.index_is_straight": lambda: index_is_straight(lm),
+        "geometry.infer_pointing.1hand_up": lambda: pointing(one),
+        "geometry.infer_pointing.1hand_down": lambda: pointing(down),
+        "geometry.infer_pointing.2hands": lambda: pointing(two),
+        "geometry.infer_pointing.bulk_geom": lambda: infer_pointing_direction(bulk),
+        "geometry.hand_geometry.1000frames": lambda: hand_geometry(recording),
+        "choose_command.1hand": lambda: choose(one),
+        "choose_command.2hands": lambda: choose(two),
+        "choose_command.2hands_low_score": lambda: choose(weak),
+        "choose_command.pointing_down": lambda: choose(down),
+        "debounce.stream": debounce,
+        "draw.hands.1hand": lambda: draw_hands(canvas, one),
+        "draw.hands.2hands": lambda: draw_hands(canvas, two),
+        "draw.hands.2hands_fast": lambda: draw_hands(canvas, two, aa=False),
+        "draw.hud": lambda: draw_hud(canvas, "Thumb_Up 0.90", 29.7, "Volume +"),
+        "draw.hud_layer": lambda: hud.draw(canvas, "Thumb_Up 0.90", 29.7, "Volume +"),
+        "qt.image_to_pixmap": qt_image,
+    }, qapp
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("-k", default="", help="substring filter on case names")
+    ap.add_argument("--baseline", default=BASELINE)
+    ap.add_argument("--save", action="store_true", help="write results to the baseline file")
+    ap.add_argument("--compare", action="store_true", help="exit 1 if any case regressed")
+    ap.add_argument("--threshold", type=float, default=0.25, help="allowed ops/s drop (fraction)")
+    ap.add_argument("--min-time", type=float, default=0.2)
+    args = ap.parse_args()
+
+    table, _qapp = cases()
+    base = load_baseline(args.baseline)
+    results, regressions = {}, []
+    print(f"{'case':<36} {'ops/s':>12} {'us/call':>10} {'alloc B':>10} {'kept B':>8} {'vs base':>8}")
+    for name, fn in table.items():
+        if args.k not in name:
+            continue
+        r = results[name] = measure(fn, min_time=args.min_time)
+        delta = ""
+        if name in base:
+            ratio = r["ops_per_sec"] / base[name]["ops_per_sec"]
+            delta = f"{(ratio - 1) * 100:+.0f}%"
+            if ratio < 1.0 - args.threshold:
+                regressions.append(name)
+                delta += " !"
+        print(f"{name:<36} {r['ops_per_sec']:12.0f} {r['us_per_call']:10.2f} "
+              f"{r['alloc_bytes']:10.0f} {r['retained_bytes']:8.0f} {delta:>8}")
+
+    if args.save:
+        save_baseline(args.baseline, {**base, **results})
+        print("baseline saved:", args.baseline)
+    if args.compare and regressions:
+        print("REGRESSIONS:", ", ".join(regressions))
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Throughput of the full recognize -> decide -> draw loop on recorded input (no camera needed).
+
+    python -m benchmarks.pipeline_throughput clip.mp4
+    python -m benchmarks.pipeline_throughput frames_dir/ --realtime --max-frames 300
+
+Commands are recorded (dry run), never executed. The motion gate is off so
+every frame is a recognition; without --realtime each frame waits for a free
+inference slot, and results_per_s counts completed recognitions (with the
+skipped count next to it; non-zero only when paced input outruns the model).
+"""
+import argparse
+import json
+
+from src.app import MediaPipeGestureApp
+from src.bindings import DEFAULT_BINDINGS
+from src.vision.sources import make_source
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("source", help="video file or directory of frames")
+    ap.add_argument("--realtime", action="store_true", help="pace replay at the recorded fps")
+    ap.add_argument("--max-frames", type=int, default=None)
+    args = ap.parse_args()
+
+    app = MediaPipeGestureApp(
+        bindings=DEFAULT_BINDINGS,
+        opts={"dry_run": True, "motion_gate": False},
+        source=make_source(args.source, realtime=args.realtime),
+    )
+    stats = app.run(show=False, max_frames=args.max_frames)
+    stats["fired"] = len(app.fired)
+    inf = stats["inference"]
+    stats["results_per_s"] = inf["completed"] / stats["elapsed_s"] if stats["elapsed_s"] > 0 else 0.0
+    print(json.dumps(stats, indent=2))
+    print(f"{stats['results_per_s']:.1f} results/s ({inf['completed']} completed, {inf['skipped']} skipped, "
+          f"{inf['expired']} expired) over {stats['frames']} frames")
+
+if __name__ == "__main__":
+    main()
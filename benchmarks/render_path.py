@@ -0,0 +1,63 @@
+"""
+Per-frame cost of the engine -> Qt preview path, legacy vs single-conversion RGB mode.
+
+    python -m benchmarks.render_path [--label 860x645]
+"""
+import argparse
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import cv2
+import numpy as np
+from PySide6 import QtCore, QtGui
+
+from src.vision.draw import draw_hands, draw_hud
+from tests.fixtures import make_frame, make_hands
+from .harness import bench, report
+
+def legacy(frame, result, label_w, label_h):
+    frame_bgr = frame.copy()                                   # stands in for a fresh camera frame
+    cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)                  # for MediaPipe
+    draw_hands(frame_bgr, result)
+    draw_hud(frame_bgr, "Thumb_Up 0.90", 30.0, "🔊 Volume +")
+    frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)      # again for Qt
+    frame_rgb = np.ascontiguousarray(frame_rgb)
+    h, w, ch = frame_rgb.shape
+    qimg = QtGui.QImage(frame_rgb.data, w, h, ch * w, QtGui.QImage.Format.Format_RGB888)
+    return QtGui.QPixmap.fromImage(qimg).scaled(label_w, label_h, QtCore.Qt.KeepAspectRatio,
+                                                QtCore.Qt.SmoothTransformation)
+
+def single_rgb(frame, result, target):
+    frame_bgr = frame.copy()
+    frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)      # shared by MediaPipe and drawing
+    draw_hands(frame_rgb, result, rgb=True)
+    draw_hud(frame_rgb, "Thumb_Up 0.90", 30.0, "🔊 Volume +", rgb=True)
+    h, w = frame_rgb.shape[:2]
+    tw, th = target
+    qimg = QtGui.QImage(frame_rgb.data, w, h, frame_rgb.strides[0], QtGui.QImage.Format.Format_RGB888)
+    pixmap = QtGui.QPixmap.fromImage(qimg)
+    if (tw, th) != (w, h):
+        pixmap = pixmap.scaled(tw, th, QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation)
+    return pixmap
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--label", default="640x480", help="preview label size WxH")
+    ap.add_argument("-n", type=int, default=300)
+    args = ap.parse_args()
+    lw, lh = (int(v) for v in args.label.split("x"))
+
+    QtGui.QGuiApplication([])      # QPixmap needs an application instance
+    frame, result = make_frame(), make_hands(n_hands=2, seed=0)
+    fit = QtCore.QSize(frame.shape[1], frame.shape[0]).scaled(QtCore.QSize(lw, lh), QtCore.Qt.KeepAspectRatio)
+    target = (fit.width(), fit.height())
+
+    t_old = bench(lambda: legacy(frame, result, lw, lh), args.n)
+    t_new = bench(lambda: single_rgb(frame, result, target), args.n)
+    report(f"legacy BGR path (label {lw}x{lh})", t_old)
+    report(f"single RGB path (label {lw}x{lh})", t_new)
+    print(f"speedup: {t_old / t_new:.2f}x")
+
+if __name__ == "__main__":
+    main()
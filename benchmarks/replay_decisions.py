@@ -0,0 +1,93 @@
+"""
+Record / replay round trip on a synthetic session (no model or camera):
+writes `--minutes` of 30 FPS results to a .gcr file, then replays them
+through choose_command + debouncer and checks the fires against the live
+path (per-result geometry, no recording).
+
+    python -m benchmarks.replay_decisions [--minutes 60]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from src.bindings import DEFAULT_BINDINGS
+from src.logic.choose import choose_command
+from src.logic.debounce import make_debouncer
+from src.logic.handframe import HandFrame
+from src.replay.recording import Recorder, Recording
+from src.replay.replay import replay
+from tests.fixtures import make_hands
+
+POSES = [make_hands(1, label=lab, score=sc, seed=i)
+         for i, (lab, sc) in enumerate([("Thumb_Up", 0.9), ("Thumb_Down", 0.8), ("Victory", 0.55),
+                                        ("Open_Palm", 0.7), ("None", 0.9)])]
+POSES += [make_hands(2, label="Closed_Fist", score=0.85, seed=9),
+          make_hands(1, label="None", index_dir=(0.0, 1.0), seed=10)]    # geometric Pointing_Down
+
+def session(n_frames, seed=0):
+    """(ts_ms, HandFrame) stream: poses held 0.1-2 s with empty gaps, ~33 ms apart."""
+    rnd = random.Random(seed)
+    ts, out = 0, []
+    while len(out) < n_frames:
+        pose = rnd.choice(POSES + [None])
+        for _ in range(rnd.randint(3, 60)):
+            ts += rnd.randint(28, 40)
+            out.append((ts, pose))
+    return out[:n_frames]
+
+def frame_at(ts, pose):
+    if pose is None:
+        return HandFrame.empty(ts)
+    return HandFrame(ts, pose.landmarks, pose.handedness, pose.labels, pose.scores)
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--minutes", type=float, default=60.0)
+    args = ap.parse_args()
+    n = int(args.minutes * 60 * 30)
+    stream = session(n)
+    bindings = dict(DEFAULT_BINDINGS, Pointing_Down="VOL_DOWN")
+
+    # Live path: geometry per result, as in the app
+    t = time.perf_counter()
+    d, live = make_debouncer(), []
+    for ts, pose in stream:
+        hf = frame_at(ts, pose)
+        cmd = d.update(choose_command(hf, bindings), ts, ts)
+        if cmd is not None:
+            live.append((ts, cmd))
+    live_s = time.perf_counter() - t
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "session.gcr")
+        rec = Recorder(path)
+        t = time.perf_counter()
+        for ts, pose in stream:
+            rec.write(frame_at(ts, pose))
+        rec.close()
+        write_s = time.perf_counter() - t
+        size = os.path.getsize(path)
+
+        t = time.perf_counter()
+        recording = Recording(path)
+        open_s = time.perf_counter() - t
+        out = replay(recording, bindings)
+        replayed = [(ts, cmd) for ts, cmd, _ in out["fires"]]
+
+        first = recording.frame(0)
+        ts0, pose0 = stream[0]
+        assert first.ts_ms == ts0 and first.n_hands == (pose0.n_hands if pose0 else 0)
+        assert replayed == live, (len(replayed), len(live))
+        span_s = (recording.ts_ms[-1] - recording.ts_ms[0]) / 1000.0
+        recording.close()
+
+    print(f"session: {n} results, {span_s / 60:.1f} min, {len(live)} fires (replay == live path)")
+    print(f"file:    {size / 1e6:.1f} MB ({size / n:.0f} B/result), write {write_s / n * 1e6:.1f} us/result, "
+          f"open {open_s * 1e3:.1f} ms")
+    print(f"replay:  {out['elapsed_s']:.2f} s ({span_s / out['elapsed_s']:.0f}x real time); "
+          f"live path {live_s:.2f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Persistent ScriptHost vs one process per script, on the stand-in host
+(tests/stub_script_host.py), plus the batch, timeout and restart paths.
+
+    python -m benchmarks.script_host_latency [-n 200]
+
+On macOS, --osascript also times the real JXA host against `osascript -e`.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+from src.system.script_host import HostError, ScriptHost
+from .harness import report
+
+STUB = [sys.executable, os.path.join(os.path.dirname(__file__), os.pardir, "tests", "stub_script_host.py")]
+
+def per_call(argv_for, n):
+    t0 = time.perf_counter()
+    for i in range(n):
+        subprocess.run(argv_for(f"echo {i}"), check=True, stdout=subprocess.DEVNULL)
+    return (time.perf_counter() - t0) / n
+
+def via_host(host, n, batch=1):
+    host.run("echo warm")
+    t0 = time.perf_counter()
+    for i in range(0, n, batch):
+        host.run_batch([f"echo {i + k}" for k in range(batch)])
+    return (time.perf_counter() - t0) / n
+
+def check_failures():
+    host = ScriptHost(STUB, timeout=0.3, max_restarts=2)
+    assert host.run("echo hi") == (True, "hi")
+    assert host.run("fail nope") == (False, "nope")
+    for script in ("crash", "sleep 1"):
+        try:
+            host.run(script)
+            raise AssertionError(f"{script}: expected HostError")
+        except HostError as e:
+            assert e.sent, e
+        assert host.run("echo back") == (True, "back")     # restarted transparently
+    print("failure paths ok:", host.stats())
+    host.close()
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("-n", type=int, default=200)
+    ap.add_argument("--osascript", action="store_true", help="also time the real osascript host (macOS)")
+    args = ap.parse_args()
+
+    check_failures()
+    host = ScriptHost(STUB)
+    t_fork = per_call(lambda s: STUB + ["--once", s], args.n)
+    t_host = via_host(host, args.n)
+    t_batch = via_host(host, args.n, batch=10)
+    host.close()
+    report("stub: process per script", t_fork)
+    report("stub: persistent host", t_host)
+    report("stub: persistent host, batch=10", t_batch)
+    print(f"speedup host {t_fork / t_host:.0f}x, batched {t_fork / t_batch:.0f}x")
+
+    if args.osascript:
+        from src.system.actions_mac import OSA_HOST_ARGV
+        script = 'return "ok"'
+        osa = ScriptHost(OSA_HOST_ARGV)
+        t_fork = per_call(lambda s: ["osascript", "-e", script], min(args.n, 50))
+        osa.run(script)
+        t0 = time.perf_counter()
+        for _ in range(args.n):
+            osa.run(script)
+        t_host = (time.perf_counter() - t0) / args.n
+        osa.close()
+        report("osascript -e per call", t_fork)
+        report("osascript host", t_host)
+
+if __name__ == "__main__":
+    main()
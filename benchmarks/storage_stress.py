@@ -0,0 +1,114 @@
+"""
+Concurrent readers and writers against one UrlStore in a temp dir.
+
+    python -m benchmarks.storage_stress [--seconds 3] [--readers 4] [--writers 4]
+
+Writers add / rename / delete / re-select random entries (expected
+ValueError / IntegrityError rejections are counted, anything else fails the
+run); readers hit the snapshot (get_active_url, list_names) and the read
+pool (query). Checks afterwards: count <= LIMIT at every read, the snapshot
+equals the database contents, and the active name exists.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+
+from src.storage.db import UrlStore
+
+def writer(store, stop, stats, seed):
+    rnd = random.Random(seed)
+    while not stop.is_set():
+        names = store.list_names()
+        name = f"n{rnd.randrange(20)}"
+        op = rnd.random()
+        try:
+            if op < 0.4:
+                store.add_url(name, f"https://{name}.example")
+            elif op < 0.6 and names:
+                store.update_url(rnd.choice(names), name, f"https://{name}.example/r")
+            elif op < 0.8 and names:
+                store.delete_url(rnd.choice(names))
+            elif names:
+                store.set_active_name(rnd.choice(names))
+            stats["writes"] += 1
+        except (ValueError, sqlite3.IntegrityError):
+            stats["rejected"] += 1
+        except Exception as e:
+            stats["errors"].append(repr(e))
+
+def reader(store, stop, stats):
+    lat = stats["lat"]
+    n = 0
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        store.get_active_url()
+        names = store.list_names()
+        lat.append(time.perf_counter() - t0)
+        if len(names) > store.LIMIT:
+            stats["errors"].append(f"count {len(names)} > LIMIT")
+        n += 1
+        if n % 50 == 0:
+            try:
+                rows = store.query("SELECT COUNT(*) AS c FROM urls").result()
+                if rows[0]["c"] > store.LIMIT:
+                    stats["errors"].append(f"pool count {rows[0]['c']} > LIMIT")
+            except Exception as e:
+                stats["errors"].append(repr(e))
+        stats["reads"] += 1
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--seconds", type=float, default=3.0)
+    ap.add_argument("--readers", type=int, default=4)
+    ap.add_argument("--writers", type=int, default=4)
+    args = ap.parse_args()
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "gesture.db")
+        store = UrlStore(path)
+        stop = threading.Event()
+        wstats = [{"writes": 0, "rejected": 0, "errors": []} for _ in range(args.writers)]
+        rstats = [{"reads": 0, "lat": [], "errors": []} for _ in range(args.readers)]
+        threads = [threading.Thread(target=writer, args=(store, stop, s, i)) for i, s in enumerate(wstats)]
+        threads += [threading.Thread(target=reader, args=(store, stop, s)) for s in rstats]
+        for t in threads:
+            t.start()
+        time.sleep(args.seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+
+        writes = sum(s["writes"] for s in wstats)
+        rejected = sum(s["rejected"] for s in wstats)
+        reads = sum(s["reads"] for s in rstats)
+        lat = sorted(x for s in rstats for x in s["lat"])
+        errors = [e for s in wstats + rstats for e in s["errors"]]
+        batches, jobs = store._writer.batches, store._writer.jobs
+        snap_rows, active = store.list_urls(), store.get_active_name()
+        store.close()
+
+        conn = sqlite3.connect(path)
+        conn.row_factory = sqlite3.Row
+        db_rows = [dict(r) for r in conn.execute("SELECT id,name,url FROM urls ORDER BY id ASC")]
+        conn.close()
+        if db_rows != snap_rows:
+            errors.append("snapshot differs from database")
+        if snap_rows and active not in {r["name"] for r in snap_rows}:
+            errors.append(f"active {active!r} missing")
+
+        s = args.seconds
+        print(f"writes    {writes / s:10.0f}/s  ({rejected} rejected, {jobs} jobs in {batches} commits, "
+              f"{jobs / max(1, batches):.1f} per commit)")
+        print(f"reads     {reads / s:10.0f}/s  snapshot p50 {lat[len(lat) // 2] * 1e6:.1f} us  "
+              f"p99 {lat[int(len(lat) * 0.99)] * 1e6:.1f} us")
+        print("final rows:", len(db_rows), "active:", active)
+        if errors:
+            print(f"FAILED ({len(errors)}):", *sorted(set(errors))[:10], sep="\n  ")
+            raise SystemExit(1)
+        print("ok")
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import sys
 from src.mediapipe_gesture import MediaPipeGestureApp
 
 """
@@ -40,7 +41,9 @@ OPTS = {
 }
 
 def main():
-    app = MediaPipeGestureApp(camera_index=0, bindings=GESTURE_BINDINGS, opts=OPTS)
+    # 可選：python main.py <影片檔 | 影格資料夾 | 鏡頭編號> 以重播取代即時鏡頭
+    source = sys.argv[1] if len(sys.argv) > 1 else None
+    app = MediaPipeGestureApp(camera_index=0, bindings=GESTURE_BINDINGS, opts=OPTS, source=source)
     app.run()
 
 if __name__ == "__main__":
@@ -1,12 +1,24 @@
 import time
-import threading
-import queue
 import cv2
 import mediapipe as mp
 from .paths import MODEL_PATH, WINDOW_NAME
 from .system.system_controller import SystemController
-from .logic.geometry import infer_pointing_direction
-from .vision.draw import draw_hands, draw_hud
+from .system.registry import ActionDispatcher
+from .system.executor import ActionExecutor
+from .logic.choose import MIN_SCORE, choose_command
+from .logic.handframe import HandFrame
+from .logic.debounce import make_debouncer
+from .logic.ramp import make_ramp
+from .storage.journal import make_journal
+from .replay.recording import make_recorder
+from .vision.draw import HudLayer, draw_hands, draw_perf
+from .vision.capture import make_reader
+from .vision.sources import open_source
+from .vision.inference import InferenceScheduler
+from .vision.motion import make_gate
+from .vision.roi import make_tracker
+from .perf.stages import StageTimer
+from .perf.trace import Tracer
 
 # MediaPipe aliases
 BaseOptions = mp.tasks.BaseOptions
@@ -15,39 +27,68 @@ GestureRecognizerOptions = mp.tasks.vision.GestureRecognizerOptions
 GestureRecognizerResult = mp.tasks.vision.GestureRecognizerResult
 VisionRunningMode = mp.tasks.vision.RunningMode
 
-# Param
-MIN_SCORE = 0.60
-STABLE_FRAMES = 3
-COOLDOWN_SEC = 0.5
-
 class MediaPipeGestureApp:
     """
     bindings: dict[label -> command]
     opts:
       - open_url_default (str)
+      - backend (str): force an action backend ("mac", "linux", "stub"); default: detect
+      - dry_run (bool): record fired commands in `self.fired` instead of executing them
+      - max_in_flight (int): recognize_async calls allowed without a result yet (default 1)
+      - motion_gate (bool | dict): idle the recognizer on static scenes (MotionGate kwargs; default on)
+      - roi (bool | dict): recognize on a crop around the tracked hands (RoiTracker kwargs; default off)
+      - fast_draw (bool): draw the hand skeleton without anti-aliasing (~3x cheaper)
+      - hud_fps_hz (float): how often the FPS text is refreshed (default 2)
+      - max_pending_actions (int): queued commands before new ones are dropped (default 4)
+      - debounce (dict): GestureDebouncer kwargs (hold_ms, release_ms, cooldown_ms, cooldowns)
+      - continuous (bool | dict): holding a fired volume gesture ramps the volume (VolumeRamp kwargs; default off)
+      - perf_hud (bool): draw per-stage p50/p95 timings on the frame
+      - perf_dump (str): append per-stage timing snapshots as JSON lines to this path
+      - trace_log (str): write per-fire latency traces as JSON lines here instead of printing them
+      - thresholds (dict): per-gesture minimum score (label -> 0..1; default MIN_SCORE)
+      - journal (bool | str | dict): log seen / near-miss / fire events to SQLite (db path or EventJournal kwargs)
+      - record (str): record every result to this .gcr file for offline replay (src/replay)
+    source: optional FrameSource / video path / frames dir (defaults to camera_index)
     """
-    def __init__(self, camera_index=0, bindings=None, opts=None):
+    def __init__(self, camera_index=0, bindings=None, opts=None, source=None):
         import os
         if not os.path.exists(MODEL_PATH):
             raise FileNotFoundError(f"Model not found: {MODEL_PATH}")
 
         self.camera_index = camera_index
+        self.source = source
         self.bindings = bindings or {}
         self.opts = opts or {}
+        self.thresholds = dict(self.opts.get("thresholds") or {})
         self.url_default = self.opts.get("open_url_default", "https://www.google.com")
+        self.dry_run = bool(self.opts.get("dry_run", False))
+        self.fired: list[str] = []
 
-        self.sys = SystemController()
+        self.sys = SystemController(self.opts.get("backend"))
+        self.actions = ActionDispatcher(self.sys, url_default=self.url_default)   # resolved once
 
-        self.last_result: GestureRecognizerResult | None = None
+        self.last_hands: HandFrame | None = None   # latest result, converted once in _on_result
         self.last_label: str | None = None
 
-        self.prev_cmd, self.same_count, self.none_count = None, 0, 0
-        self.armed, self.last_fire_ts = True, 0.0
+        self.perf = StageTimer(dump_path=self.opts.get("perf_dump"))
+        self.perf_hud = bool(self.opts.get("perf_hud", False))
+        self.fast_draw = bool(self.opts.get("fast_draw", False))
+        self.hud = HudLayer(fps_hz=self.opts.get("hud_fps_hz", 2.0))   # cached text sprites
+        # Gesture -> action tracing (trace id = recognizer timestamp); see self.tracer.recent()
+        self.tracer = Tracer(log_path=self.opts.get("trace_log"))
+        self.last_ctx = None
+
+        # Hold / release / per-command cooldown over distinct results (FPS-independent)
+        self.debounce = make_debouncer(self.opts.get("debounce"))
+        self.ramp = make_ramp(self.opts.get("continuous", False))
+        self.journal = make_journal(self.opts.get("journal", False))   # batched, off-thread writes
+        self.recorder = make_recorder(self.opts.get("record"))
         self.overlay_msg, self.overlay_until = None, 0.0
 
-        self.cmd_q: "queue.Queue[str]" = queue.Queue()
-        self.worker = threading.Thread(target=self._worker, daemon=True)
-        self.worker.start()
+        # Bounded, coalescing background execution with per-action timeouts
+        self.executor = ActionExecutor(self.actions.perform, on_done=self._action_done,
+                                       max_pending=self.opts.get("max_pending_actions", 4),
+                                       timeout_for=self._action_timeout)
 
         base_options = BaseOptions(model_asset_path=MODEL_PATH)
         options = GestureRecognizerOptions(
@@ -57,148 +98,156 @@ class MediaPipeGestureApp:
             num_hands=2
         )
         self.recognizer = GestureRecognizer.create_from_options(options)
-
-    # Background command execution
-    def _worker(self):
-        while True:
-            cmd = self.cmd_q.get()
-            try:
-                self._perform(cmd)
-            except Exception as e:
-                print("[perform ERROR]", e)
-            finally:
-                self.cmd_q.task_done()
+        self.infer = InferenceScheduler(self.recognizer, max_in_flight=self.opts.get("max_in_flight", 1))
+        self.gate = make_gate(self.opts.get("motion_gate", True))
+        self.roi = make_tracker(self.opts.get("roi", False))
+
+    # Background command execution (executor worker thread)
+    def _action_timeout(self, cmd: str) -> float:
+        action = self.actions.action(cmd)
+        return action.timeout if action else 5.0
+
+    def _action_done(self, cmd, ok, result, trace, start_t):
+        self.perf.lap("action", start_t)
+        if ok and result:
+            self._flash(*result)
+        elif not ok:
+            self._flash(f"⚠️ {cmd} failed", 1.2)
+        self.tracer.performed(trace, start_t, ok)
 
     # Mediapipe callback
     def _on_result(self, result: GestureRecognizerResult, output_image: mp.Image, timestamp_ms: int):
-        self.last_result = result
-        label = None
-        if result and result.gestures:
-            for glist in result.gestures:
-                if not glist: continue
-                top = glist[0]
-                if top.score >= MIN_SCORE:
-                    label = f"{top.category_name} {top.score:.2f}"
-                    break
-        self.last_label = label
+        lat = self.infer.on_result(timestamp_ms)
+        if lat is not None: self.perf.add("callback", lat)
+        hands = HandFrame.from_result(result, timestamp_ms)
+        if self.roi: self.roi.map_frame(hands, timestamp_ms)
+        if self.recorder: self.recorder.write(hands)
+        self.last_ctx = self.tracer.on_result(timestamp_ms)
+        self.last_hands = hands
+        self.last_label = hands.label(MIN_SCORE)
+        if self.journal: self.journal.on_result(hands, self.bindings, self.thresholds, MIN_SCORE)
 
     # Selection Command (with Pointing_Down geometry fallback)
-    def _choose_command(self, result: GestureRecognizerResult):
-        # 1) Geometric backup: If Pointing_Down is inferred, the corresponding
-        pd = infer_pointing_direction(result)
-        if pd == "Pointing_Down":
-            cmd = self.bindings.get("Pointing_Down")
-            if cmd:
-                return cmd
-
-        # 2) Take the bound gesture with the highest score
-        if not result or not result.gestures:
-            return None
-        best_cmd, best_score = None, 0.0
-        for glist in result.gestures:
-            if not glist: continue
-            top = glist[0]
-            if top.score < MIN_SCORE: continue
-            label = top.category_name
-            cmd = self.bindings.get(label)
-            if cmd and top.score > best_score:
-                best_cmd, best_score = cmd, top.score
-        return best_cmd
+    def _choose_command(self, hands: HandFrame | None):
+        return choose_command(hands, self.bindings, self.thresholds, MIN_SCORE)
 
     # Vision Prompt
     def _flash(self, msg, duration=0.7):
         self.overlay_msg, self.overlay_until = msg, time.time() + duration
 
-    # Excute Order（in worker threads）
-    def _perform(self, cmd: str):
-        s = self.sys
-        # Volume
-        if   cmd == "VOL_UP":               s.volume_up();            self._flash("🔊 Volume +")
-        elif cmd == "VOL_DOWN":             s.volume_down();          self._flash("🔉 Volume −")
-        elif cmd == "MUTE_TOGGLE":          s.mute_toggle();          self._flash("🔇 Mute")
-
-        # Open App
-        elif cmd == "OPEN_CALCULATOR":      s.open_calculator();      self._flash("🧮 Calculator")
-        elif cmd == "OPEN_CLOCK":           s.open_clock();           self._flash("⏰ Clock")
-        elif cmd == "OPEN_NOTES":           s.open_notes();           self._flash("📝 Notes")
-        elif cmd == "OPEN_CALENDAR":        s.open_calendar();        self._flash("📅 Calendar")
-        elif cmd == "OPEN_REMINDERS":       s.open_reminders();       self._flash("✅ Reminders")
-        elif cmd == "OPEN_SAFARI":          s.open_safari();          self._flash("🧭 Safari")
-        elif cmd == "OPEN_MAIL":            s.open_mail();            self._flash("✉️ Mail")
-        elif cmd == "OPEN_MAPS":            s.open_maps();            self._flash("🗺 Maps")
-        elif cmd == "OPEN_PHOTOS":          s.open_photos();          self._flash("🖼 Photos")
-        elif cmd == "OPEN_MUSIC":           s.open_music();           self._flash("🎵 Music")
-        elif cmd == "OPEN_LAUNCHPAD":       s.open_launchpad();       self._flash("🟦 Launchpad")
-
-        # System
-        elif cmd == "START_SCREENSAVER":    s.start_screensaver();    self._flash("🛡 Screensaver")
-        elif cmd == "DISPLAY_SLEEP":        s.display_sleep();        self._flash("🌙 Display sleep")
-        elif cmd == "WIFI_ON":              s.wifi_on();              self._flash("📶 Wi-Fi ON")
-        elif cmd == "WIFI_OFF":             s.wifi_off();             self._flash("📶 Wi-Fi OFF")
-        elif cmd == "BT_ON":                s.bt_on();                self._flash("🅱️ Bluetooth ON")
-        elif cmd == "BT_OFF":               s.bt_off();               self._flash("🅱️ Bluetooth OFF")
-        elif cmd == "DARKMODE_TOGGLE":      s.darkmode_toggle();      self._flash("🌗 Dark Mode")
-
-        # URL
-        elif cmd == "OPEN_URL":             s.open_url(self.url_default); self._flash("🌐 Open URL")
-
-        else:
-            self._flash(f"(noop) {cmd}", 0.4)
-
     # Debounce + Cooldown + Load
     def _maybe_fire(self):
-        cmd = self._choose_command(self.last_result)
-        if cmd is None:
-            self.none_count += 1
-            if self.none_count >= STABLE_FRAMES:
-                self.armed = True
-            self.prev_cmd, self.same_count = None, 0
-            return
-        self.none_count = 0
-        self.same_count = self.same_count + 1 if cmd == self.prev_cmd else 1
-        self.prev_cmd = cmd
-        if not self.armed:
+        hands = self.last_hands
+        if hands is None:
             return
-        if self.same_count >= STABLE_FRAMES and (time.time() - self.last_fire_ts) >= COOLDOWN_SEC:
-            self.cmd_q.put(cmd)
-            self.last_fire_ts, self.armed = time.time(), False
+        d = self.debounce
+        cmd = d.update(self._choose_command(hands), hands.ts_ms, hands.ts_ms)
+        if cmd is not None:
+            self._submit(cmd, self.tracer.fire(cmd, self.last_ctx, d.first_seen_t))
+            if self.journal: self.journal.on_fire(cmd, hands, self.bindings)
+        if self.ramp:
+            # Continuous control: a held volume gesture keeps moving the volume, starting
+            # from the level its fired step leaves (not before that step has run)
+            current = None if self.executor.busy(d.held_cmd) else self.sys.volume
+            held = d.held_cmd if self.actions.repeatable(d.held_cmd) else None
+            target = self.ramp.update(held, d.held_since_ms, hands.ts_ms, current)
+            if target is not None:
+                self._submit(f"VOL_SET:{target}", key="VOL_SET")
+
+    def _submit(self, cmd, trace=None, key=None):
+        if self.dry_run:
+            self.fired.append(cmd)
+            self.tracer.performed(trace, time.perf_counter())
+        else: self.executor.submit(cmd, trace, key)
 
     # Main loop
-    def run(self):
-        cap = cv2.VideoCapture(self.camera_index)
-        if not cap.isOpened():
-            self.recognizer.close()
-            raise RuntimeError("Can not open camera")
-        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-
-        prev_time, fps = time.perf_counter(), 0.0
+    def _release(self):
+        # Recognizer, action worker, backend helpers, journal and recorder (source / reader are per run)
+        try: self.recognizer.close()
+        except Exception: pass
+        self.executor.stop()
+        self.sys.close()
+        if self.journal: self.journal.close()
+        if self.recorder: self.recorder.close()
+
+    def run(self, show=True, max_frames=None):
+        """
+        Process frames until Q/ESC, window close, end of a replay source or `max_frames`.
+        show=False runs headless (no cv2 window). Returns loop stats.
+        """
         try:
-            while True:
-                ok, frame_bgr = cap.read()
-                if not ok: continue
-                now = time.perf_counter(); dt = now - prev_time; prev_time = now
+            source = open_source(self.source if self.source is not None else self.camera_index)
+        except Exception:
+            self._release()
+            raise
+        reader = make_reader(source)
+
+        prev_time, fps, last_ts_ms, frames = time.perf_counter(), 0.0, -1, 0
+        perf, snap, snap_t = self.perf, {}, 0.0
+        t_start = time.perf_counter()
+        try:
+            while max_frames is None or frames < max_frames:
+                t = time.perf_counter()
+                frame_bgr, cap_ts = reader.latest(timeout=0.1)
+                if frame_bgr is None:
+                    if reader.finished: break
+                    continue
+                frames += 1
+                t = now = perf.lap("capture", t)
+                dt = now - prev_time; prev_time = now
                 if dt > 0: fps = 0.9 * fps + 0.1 * (1.0 / dt)
 
-                frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
-                ts_ms = int(time.perf_counter() * 1000)
-                mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame_rgb)
-                self.recognizer.recognize_async(mp_image, ts_ms)
+                hands = bool(self.last_hands and self.last_hands.n_hands)
+                if self.gate is None or self.gate.should_infer(frame_bgr, hands):
+                    frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
+                    t = perf.lap("convert", t)
+                    # Timestamp = capture time (must be strictly increasing for LIVE_STREAM)
+                    ts_ms = max(int(cap_ts * 1000), last_ts_ms + 1); last_ts_ms = ts_ms
+                    if self.roi: frame_rgb = self.roi.crop(frame_rgb, self.last_hands, ts_ms)
+                    self.tracer.on_submit(ts_ms, cap_ts if source.live else now)
+                    # Unpaced replay waits for a free slot: every frame is recognized, none skipped
+                    if (self.infer.submit(frame_rgb, ts_ms, cap_ts if source.live else None, wait=not source.paced)
+                            and self.roi):
+                        self.roi.commit(ts_ms)
+                t = perf.lap("submit", t)
 
                 self._maybe_fire()
+                t = perf.lap("choose", t)
 
-                if self.last_result: draw_hands(frame_bgr, self.last_result)
+                draw_hands(frame_bgr, self.last_hands, aa=not self.fast_draw)
                 hint = self.overlay_msg if time.time() <= self.overlay_until else None
-                draw_hud(frame_bgr, self.last_label, fps, hint)
-
+                self.hud.draw(frame_bgr, self.last_label, fps, hint, now=now)
+                if self.perf_hud:
+                    if now - snap_t > 0.5: snap, snap_t = perf.snapshot(), now
+                    draw_perf(frame_bgr, snap)
+                t = perf.lap("draw", t)
+                perf.maybe_dump()
+
+                if not show: continue
                 cv2.imshow(WINDOW_NAME, frame_bgr)
                 key = cv2.waitKey(1) & 0xFF
+                perf.lap("present", t)
                 if key in (ord('q'), ord('Q'), 27): break
                 if cv2.getWindowProperty(WINDOW_NAME, cv2.WND_PROP_VISIBLE) < 1: break
         finally:
-            try: self.recognizer.close()
-            except Exception: pass
-            cap.release()
-            cv2.destroyAllWindows()
-            cv2.waitKey(1)
+            reader.stop()
+            source.release()
+            self._release()
+            if show:
+                cv2.destroyAllWindows()
+                cv2.waitKey(1)
             time.sleep(0.05)
+
+        elapsed = time.perf_counter() - t_start
+        return {
+            "frames": frames,
+            "elapsed_s": elapsed,
+            "fps": frames / elapsed if elapsed > 0 else 0.0,
+            **reader.stats(),
+            "inference": self.infer.stats(),
+            "motion_gate": self.gate.stats() if self.gate else None,
+            "roi": self.roi.stats() if self.roi else None,
+            "actions": self.executor.stats(),
+            "journal": self.journal.stats() if self.journal else None,
+            "stages": self.perf.snapshot(),
+        }
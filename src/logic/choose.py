@@ -0,0 +1,30 @@
+from .geometry import infer_pointing_direction
+from .handframe import HandFrame
+
+MIN_SCORE = 0.60
+
+def choose_command(hands: HandFrame | None, bindings: dict, thresholds: dict | None = None,
+                   min_score: float = MIN_SCORE) -> str | None:
+    """
+    Command for one result: a bound geometric Pointing_Down wins, otherwise
+    the bound gesture with the highest score at or above its threshold
+    (thresholds[label], default min_score). Shared by both front-ends and
+    the replayer.
+    """
+    pd = infer_pointing_direction(hands)
+    if pd == "Pointing_Down":
+        cmd = bindings.get("Pointing_Down")
+        if cmd:
+            return cmd
+
+    if hands is None:
+        return None
+    thresholds = thresholds or {}
+    best_cmd, best_score = None, 0.0
+    for label, score in hands.top:
+        if score < thresholds.get(label, min_score):
+            continue
+        cmd = bindings.get(label)
+        if cmd and score > best_score:
+            best_cmd, best_score = cmd, score
+    return best_cmd
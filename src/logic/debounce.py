@@ -0,0 +1,68 @@
+import time
+
+class GestureDebouncer:
+    """
+    Decides when a chosen command fires, based on distinct inference results
+    rather than frames or timer ticks, so the hold time does not depend on the
+    camera FPS or the UI timer rate.
+
+    update(cmd, seq, t_ms) is called with the command chosen for one result:
+      seq   result id (the recognizer timestamp); a repeated seq is ignored,
+            so re-evaluating a stale result never counts as more agreement
+      t_ms  monotonic result time in ms (capture / media time)
+
+    A command fires once it has been the choice of every result for at least
+    `hold_ms`, provided the debouncer is armed and the command's cooldown has
+    passed. After firing it disarms until no command has been chosen for
+    `release_ms` (the hand has to drop or change pose). `cooldowns` maps a
+    command to its own cooldown in ms; others use `cooldown_ms`.
+
+    held_cmd / held_since_ms: the command that fired and is still being
+    held (same choice on every result since), for continuous control.
+    """
+    def __init__(self, hold_ms: float = 100.0, release_ms: float = 100.0,
+                 cooldown_ms: float = 500.0, cooldowns: dict | None = None):
+        self.hold_ms = hold_ms
+        self.release_ms = release_ms
+        self.cooldown_ms = cooldown_ms
+        self.cooldowns = dict(cooldowns or {})
+        self.reset()
+
+    def reset(self):
+        self.cmd, self.since_ms = None, None     # current candidate and its first result time
+        self.first_seen_t = None                 # perf_counter() when the candidate appeared (tracing)
+        self.none_since_ms = None
+        self.armed = True
+        self.last_seq = None
+        self.last_fire_ms: dict[str, float] = {}
+        self.held_cmd, self.held_since_ms = None, None
+
+    def update(self, cmd: str | None, seq, t_ms: float) -> str | None:
+        """Feed the command chosen for result `seq`; returns the command to fire, or None."""
+        if seq == self.last_seq:
+            return None
+        self.last_seq = seq
+        if cmd is None:
+            if self.none_since_ms is None:
+                self.none_since_ms = t_ms
+            if t_ms - self.none_since_ms >= self.release_ms:
+                self.armed = True
+            self.cmd, self.since_ms = None, None
+            self.held_cmd, self.held_since_ms = None, None
+            return None
+        self.none_since_ms = None
+        if cmd != self.cmd:
+            self.cmd, self.since_ms, self.first_seen_t = cmd, t_ms, time.perf_counter()
+            self.held_cmd, self.held_since_ms = None, None
+        if not self.armed or t_ms - self.since_ms < self.hold_ms:
+            return None
+        last = self.last_fire_ms.get(cmd)
+        if last is not None and t_ms - last < self.cooldowns.get(cmd, self.cooldown_ms):
+            return None
+        self.last_fire_ms[cmd], self.armed = t_ms, False
+        self.held_cmd, self.held_since_ms = cmd, t_ms
+        return cmd
+
+def make_debouncer(cfg=None) -> GestureDebouncer:
+    """cfg: None -> defaults, dict -> GestureDebouncer kwargs."""
+    return GestureDebouncer(**(cfg or {}))
@@ -1,44 +1,119 @@
 import math
+
+import numpy as np
 from mediapipe import solutions as mp_solutions
-from mediapipe.tasks.python.vision import GestureRecognizerResult
+from .handframe import HandFrame
 
 HAND_CONNECTIONS = mp_solutions.hands.HAND_CONNECTIONS
 
 # Geometric redundancy parameters
-ORIENT_THRESH = 0.05       # Y-axis threshold (image coordinate y is positive downwards)
-STRAIGHT_COS = -0.85       # An angle close to 180° is considered straight
-
-def _cos_between(ax, ay, bx, by):
-    na = math.hypot(ax, ay)
-    nb = math.hypot(bx, by)
-    if na == 0 or nb == 0:
-        return 1.0
-    return (ax*bx + ay*by) / (na*nb)
-
-def index_is_straight(lm):
-    # Determine by PIP angle (MCP->PIP and PIP->DIP)
-    mcp = lm[5]; pip = lm[6]; dip = lm[7]
-    v1x, v1y = (pip.x - mcp.x), (pip.y - mcp.y)
-    v2x, v2y = (dip.x - pip.x), (dip.y - pip.y)
-    cospip = _cos_between(v1x, v1y, v2x, v2y)
-    return cospip <= STRAIGHT_COS
-
-def infer_pointing_direction(result: GestureRecognizerResult) -> str | None:
+ORIENT_THRESH = 0.05       # Minimum MCP->tip offset (normalized) for a direction; image y is positive downwards
+STRAIGHT_COS = -0.85       # A joint angle close to 180° (cos close to -1) is considered straight
+
+FINGERS = ("thumb", "index", "middle", "ring", "pinky")
+DIRECTIONS = ("", "Up", "Down", "Left", "Right")   # direction codes 0..4 (image coordinates)
+DIR_NONE, DIR_UP, DIR_DOWN, DIR_LEFT, DIR_RIGHT = range(5)
+
+# Per finger: wrist + 4 landmarks from base to tip -> 3 joints (MCP, PIP, DIP; thumb: CMC, MCP, IP)
+_CHAINS = np.array([
+    [0, 1, 2, 3, 4],
+    [0, 5, 6, 7, 8],
+    [0, 9, 10, 11, 12],
+    [0, 13, 14, 15, 16],
+    [0, 17, 18, 19, 20],
+])
+# [vertical][sign] -> direction code; sign 0 = below threshold, 1 = positive, 2 = negative
+_DIR_TABLE = np.array([[DIR_NONE, DIR_RIGHT, DIR_LEFT], [DIR_NONE, DIR_DOWN, DIR_UP]], dtype=np.int8)
+
+class HandGeometry:
+    """
+    Batched finger geometry for landmarks of shape (..., 21, 3).
+
+      cos:       (..., 5, 3) cosine of each joint angle (-1 = straight, 0 for coincident points)
+      extended:  (..., 5) True when the two distal joints are straight
+      vectors:   (..., 5, 2) base -> tip offset per finger (normalized x, y)
+      direction: (..., 5) int8 DIR_* code of each extended finger, DIR_NONE otherwise
+    """
+    __slots__ = ("cos", "extended", "vectors", "direction")
+
+    def __init__(self, cos, extended, vectors, direction):
+        self.cos, self.extended, self.vectors, self.direction = cos, extended, vectors, direction
+
+    def angles(self):
+        """Joint angles in degrees, (..., 5, 3)."""
+        return np.degrees(np.arccos(np.clip(self.cos, -1.0, 1.0)))
+
+def hand_geometry(landmarks, orient_thresh: float = ORIENT_THRESH, straight_cos: float = STRAIGHT_COS) -> HandGeometry:
+    """
+    Compute joint angles, extension flags and pointing direction for every
+    finger of every hand in one call. Works on a single HandFrame array
+    (hands, 21, 3) as well as on stacked recordings (frames, hands, 21, 3).
+    """
+    xy = np.asarray(landmarks, dtype=np.float32)[..., :2]
+    p = xy[..., _CHAINS, :]                      # (..., 5, 5, 2)
+    a = p[..., :-2, :] - p[..., 1:-1, :]         # joint -> previous point
+    b = p[..., 2:, :] - p[..., 1:-1, :]          # joint -> next point
+    denom = np.sqrt((a * a).sum(-1) * (b * b).sum(-1))
+    cos = (a * b).sum(-1) / np.maximum(denom, 1e-12)   # degenerate joint -> 0 (never "straight")
+
+    extended = (cos[..., 1:] <= straight_cos).all(axis=-1)
+    vectors = p[..., 4, :] - p[..., 1, :]
+    mag = np.abs(vectors)
+    vertical = mag[..., 1] >= mag[..., 0]
+    along = np.where(vertical, vectors[..., 1], vectors[..., 0])
+    sign = (along > orient_thresh) + 2 * (along < -orient_thresh)
+    direction = _DIR_TABLE[vertical.view(np.int8) * extended, sign * extended]
+    return HandGeometry(cos, extended, vectors, direction)
+
+def frame_geometry(frame: HandFrame) -> HandGeometry:
+    """hand_geometry() of a HandFrame, computed once per result and cached on it."""
+    if frame.geom is None:
+        frame.geom = hand_geometry(frame.landmarks)
+    return frame.geom
+
+def _joint_cos(px, py, jx, jy, nx, ny):
+    # Cosine of the angle at joint j between j->p and j->n (-1 = straight, 0 for coincident points)
+    ax, ay, bx, by = px - jx, py - jy, nx - jx, ny - jy
+    d = math.sqrt((ax*ax + ay*ay) * (bx*bx + by*by))
+    return (ax*bx + ay*by) / d if d > 1e-12 else 0.0
+
+def _index_straight(mcp, pip, dip, tip):
+    # Straight when both PIP and DIP are close to 180°; points are (x, y) floats
+    return (_joint_cos(*mcp, *pip, *dip) <= STRAIGHT_COS
+            and _joint_cos(*pip, *dip, *tip) <= STRAIGHT_COS)
+
+def index_is_straight(lm) -> bool:
+    # lm: (21, 3) landmark array of one hand
+    return _index_straight(*lm[5:9, :2].tolist())
+
+def _pointing(dy: float) -> str | None:
+    if dy < -ORIENT_THRESH:
+        return "Pointing_Up"
+    if dy > ORIENT_THRESH:
+        return "Pointing_Down"
+    return None
+
+def infer_pointing_direction(frame: HandFrame) -> str | None:
     """
     Returns "Pointing_Up" / "Pointing_Down" / None
-    Performs fallback inference when the model doesn't have a Pointing_Down state.
+    Performs fallback inference when the model doesn't have a Pointing_Down state:
+    the first hand whose index finger is straight and clearly vertical wins.
+
+    A live result holds one or two hands, where plain float math beats an
+    array pass; frames that already carry bulk geometry (replay) reuse it.
     """
-    if not result or not result.hand_landmarks:
+    if frame is None or not frame.n_hands:
+        return None
+    g = frame.geom
+    if g is None:
+        # One conversion for all hands: MCP, PIP, DIP, TIP of the index finger
+        for mcp, pip, dip, tip in frame.landmarks[:, 5:9, :2].tolist():
+            if _index_straight(mcp, pip, dip, tip):
+                d = _pointing(tip[1] - mcp[1])
+                if d: return d
         return None
-    for lm in result.hand_landmarks:
-        if len(lm) < 21:
-            continue
-        if not index_is_straight(lm):
-            continue
-        tip = lm[8]; mcp = lm[5]
-        dy = tip.y - mcp.y
-        if dy < -ORIENT_THRESH:
-            return "Pointing_Up"
-        if dy > ORIENT_THRESH:
-            return "Pointing_Down"
+    for straight, dy in zip(g.extended[:, 1].tolist(), g.vectors[:, 1, 1].tolist()):
+        if straight:
+            d = _pointing(dy)
+            if d: return d
     return None
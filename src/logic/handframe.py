@@ -0,0 +1,63 @@
+import numpy as np
+
+N_LANDMARKS = 21
+
+class HandFrame:
+    """
+    Compact, read-only view of one GestureRecognizerResult, built once in the
+    result callback and shared by geometry, drawing and command choice.
+
+      landmarks:  (hands, 21, 3) float32, normalized x / y / z
+      handedness: tuple of "Left" / "Right" per hand
+      labels:     per hand, the top-k gesture names (padded with "")
+      scores:     (hands, k) float32, matching `labels`
+      top:        per hand, (top label, top score as float) for the hot path
+      geom:       finger geometry, filled lazily by geometry.frame_geometry()
+    """
+    __slots__ = ("ts_ms", "landmarks", "handedness", "labels", "scores", "top", "geom")
+
+    def __init__(self, ts_ms, landmarks, handedness, labels, scores):
+        self.ts_ms = ts_ms
+        self.landmarks = landmarks
+        self.handedness = handedness
+        self.labels = labels
+        self.scores = scores
+        self.top = tuple((lab[0], float(sc[0])) for lab, sc in zip(labels, scores))
+        self.geom = None
+
+    @classmethod
+    def from_result(cls, result, ts_ms: int = 0, top_k: int = 3) -> "HandFrame":
+        hands = result.hand_landmarks if result else []
+        gestures = result.gestures if result else []
+        handed = result.handedness if result else []
+        idx = [i for i, hand in enumerate(hands) if len(hand) == N_LANDMARKS]
+
+        landmarks = np.empty((len(idx), N_LANDMARKS, 3), dtype=np.float32)
+        scores = np.zeros((len(idx), top_k), dtype=np.float32)
+        labels = []
+        for row, i in enumerate(idx):
+            landmarks[row] = [(lm.x, lm.y, lm.z or 0.0) for lm in hands[i]]
+            cats = gestures[i][:top_k] if i < len(gestures) else []
+            names = [c.category_name for c in cats]
+            scores[row, :len(cats)] = [c.score for c in cats]
+            labels.append(tuple(names + [""] * (top_k - len(names))))
+        handedness = tuple(
+            handed[i][0].category_name if i < len(handed) and handed[i] else "" for i in idx
+        )
+        return cls(ts_ms, landmarks, handedness, tuple(labels), scores)
+
+    @classmethod
+    def empty(cls, ts_ms: int = 0, top_k: int = 3) -> "HandFrame":
+        return cls(ts_ms, np.empty((0, N_LANDMARKS, 3), np.float32), (), (),
+                   np.zeros((0, top_k), np.float32))
+
+    @property
+    def n_hands(self) -> int:
+        return self.landmarks.shape[0]
+
+    def label(self, min_score: float) -> str | None:
+        """HUD text for the first hand whose top gesture clears `min_score`."""
+        for name, score in self.top:
+            if score >= min_score:
+                return f"{name} {score:.2f}"
+        return None
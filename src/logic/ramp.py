@@ -0,0 +1,59 @@
+class VolumeRamp:
+    """
+    Continuous control: while a fired VOL_UP / VOL_DOWN stays held (the
+    front-ends pass only commands whose registry Action is `repeatable`), the
+    volume moves at `rate` percent per second. The ramp starts `delay_ms`
+    after the command fired (a short gesture stays a single step) and
+    integrates a float target per result; at most `max_hz` absolute targets
+    per second are emitted, plus the final one when the gesture is released.
+
+    update() returns the integer target to send (VOL_SET:<n>) or None.
+    `current` is the volume to start from; pass None while it is not known
+    yet or the fired step is still queued / running (the ramp then waits, so
+    its first target cannot undo that step).
+    """
+    DIRS = {"VOL_UP": 1.0, "VOL_DOWN": -1.0}
+
+    def __init__(self, rate: float = 40.0, max_hz: float = 5.0, delay_ms: float = 350.0):
+        self.rate = rate
+        self.min_gap_ms = 1000.0 / max_hz
+        self.delay_ms = delay_ms
+        self._t = 0.0
+        self.emitted = 0
+        self.reset()
+
+    def reset(self):
+        self._value, self._sent, self._sent_t = None, None, float("-inf")
+
+    def update(self, held_cmd: str | None, held_since_ms, t_ms: float, current: int | None):
+        d = self.DIRS.get(held_cmd)
+        if d is None or held_since_ms is None or t_ms - held_since_ms < self.delay_ms:
+            return self._release()
+        if self._value is None:
+            if current is None:
+                return None
+            self._value, self._t, self._sent = float(current), t_ms, int(current)
+            return None
+        self._value = max(0.0, min(100.0, self._value + d * self.rate * (t_ms - self._t) / 1000.0))
+        self._t = t_ms
+        target = int(round(self._value))
+        if target == self._sent or t_ms - self._sent_t < self.min_gap_ms:
+            return None
+        return self._emit(target, t_ms)
+
+    def _release(self):
+        value, self._value = self._value, None
+        if value is None or int(round(value)) == self._sent:
+            return None
+        return self._emit(int(round(value)), self._t)
+
+    def _emit(self, target: int, t_ms: float) -> int:
+        self._sent, self._sent_t = target, t_ms
+        self.emitted += 1
+        return target
+
+def make_ramp(cfg=False) -> VolumeRamp | None:
+    """cfg: True -> defaults, False/None -> disabled, dict -> VolumeRamp kwargs."""
+    if isinstance(cfg, dict):
+        return VolumeRamp(**cfg)
+    return VolumeRamp() if cfg else None
@@ -0,0 +1,86 @@
+import json
+import threading
+import time
+from collections import deque
+
+# Frame-loop stages, in pipeline order
+STAGES = ("capture", "convert", "submit", "callback", "choose", "draw", "present", "action")
+
+class RollingHistogram:
+    """Last `window` samples (ms) with percentile queries."""
+    def __init__(self, window: int = 300):
+        self.samples: deque[float] = deque(maxlen=window)
+        self.total = 0
+
+    def add(self, ms: float):
+        self.samples.append(ms)
+        self.total += 1
+
+    def summary(self) -> dict:
+        xs = sorted(self.samples)
+        n = len(xs)
+        if not n:
+            return {"n": 0, "total": self.total, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        pick = lambda q: xs[min(n - 1, int(q * n))]
+        return {
+            "n": n,
+            "total": self.total,
+            "mean": sum(xs) / n,
+            "p50": pick(0.50),
+            "p95": pick(0.95),
+            "p99": pick(0.99),
+            "max": xs[-1],
+        }
+
+class StageTimer:
+    """
+    Per-stage rolling timings for the frame loop.
+
+    Usage in the loop (no context managers on the hot path):
+        t = time.perf_counter()
+        ...convert...
+        t = timer.lap("convert", t)
+
+    snapshot() gives {stage: {p50, p95, p99, ...}} in ms. With `dump_path`
+    set, maybe_dump() appends a snapshot as one JSON line every `dump_every` s.
+    """
+    def __init__(self, window: int = 300, dump_path: str | None = None, dump_every: float = 5.0):
+        self._lock = threading.Lock()
+        self._hists = {s: RollingHistogram(window) for s in STAGES}
+        self._window = window
+        self.dump_path = dump_path
+        self.dump_every = dump_every
+        self._last_dump = time.time()
+
+    def add(self, stage: str, ms: float):
+        with self._lock:
+            h = self._hists.get(stage)
+            if h is None:
+                h = self._hists[stage] = RollingHistogram(self._window)
+            h.add(ms)
+
+    def lap(self, stage: str, t0: float) -> float:
+        """Record perf_counter() - t0 under `stage`; returns the new perf_counter() for chaining."""
+        now = time.perf_counter()
+        self.add(stage, (now - t0) * 1000.0)
+        return now
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {s: h.summary() for s, h in self._hists.items() if h.total}
+
+    def maybe_dump(self, now: float | None = None) -> bool:
+        if not self.dump_path:
+            return False
+        now = time.time() if now is None else now
+        if now - self._last_dump < self.dump_every:
+            return False
+        self._last_dump = now
+        line = json.dumps({"ts": round(now, 3), "stages": self.snapshot()})
+        try:
+            with open(self.dump_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            print("[perf dump] failed:", e)
+            return False
+        return True
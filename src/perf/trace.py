@@ -0,0 +1,92 @@
+import json
+import threading
+import time
+from collections import deque
+
+class FireTrace:
+    """
+    One fired command, keyed by the recognizer timestamp (trace_id) of the
+    result that triggered it. All times are perf_counter() seconds.
+    """
+    __slots__ = ("trace_id", "cmd", "capture_t", "submit_t", "result_t",
+                 "first_seen_t", "decide_t", "start_t", "end_t", "ok")
+
+    def __init__(self, trace_id, cmd, capture_t, submit_t, result_t, first_seen_t, decide_t):
+        self.trace_id, self.cmd = trace_id, cmd
+        self.capture_t, self.submit_t, self.result_t = capture_t, submit_t, result_t
+        self.first_seen_t, self.decide_t = first_seen_t, decide_t
+        self.start_t = self.end_t = None
+        self.ok = None
+
+    def spans(self) -> dict:
+        """Per-span breakdown in ms (action spans are None until the command has run)."""
+        ms = lambda a, b: None if a is None or b is None else round((b - a) * 1000.0, 2)
+        return {
+            "capture": ms(self.capture_t, self.submit_t),     # frame age + convert until submit
+            "inference": ms(self.submit_t, self.result_t),    # MediaPipe, submit -> callback
+            "pickup": ms(self.result_t, self.decide_t),       # callback -> loop evaluates it
+            "debounce": ms(self.first_seen_t, self.decide_t), # hold time until the debounce fired
+            "queue": ms(self.decide_t, self.start_t),         # decision -> action starts
+            "action": ms(self.start_t, self.end_t),           # backend call
+            "total": ms(self.capture_t, self.end_t),          # triggering frame -> action done
+        }
+
+    def as_dict(self) -> dict:
+        return {"trace_id": self.trace_id, "cmd": self.cmd, "ok": self.ok, "spans": self.spans()}
+
+class Tracer:
+    """
+    Carries a trace id (the LIVE_STREAM timestamp in ms) from submission to
+    result, and turns fires into FireTrace records.
+
+    on_submit() / on_result() are called per frame; fire() when the debounce
+    decides; performed() when the action finished. Finished traces are kept
+    in `recent()` and printed (or appended as JSON lines to `log_path`).
+    """
+    def __init__(self, keep: int = 100, log: bool = True, log_path: str | None = None):
+        self._lock = threading.Lock()
+        self._pending: dict[int, tuple] = {}   # ts_ms -> (capture_t, submit_t)
+        self._done: deque[FireTrace] = deque(maxlen=keep)
+        self.log = log
+        self.log_path = log_path
+
+    def on_submit(self, ts_ms: int, capture_t: float, submit_t: float | None = None):
+        submit_t = time.perf_counter() if submit_t is None else submit_t
+        with self._lock:
+            self._pending[ts_ms] = (capture_t, submit_t)
+            if len(self._pending) > 64:
+                for ts in sorted(self._pending)[:-64]:
+                    del self._pending[ts]
+
+    def on_result(self, ts_ms: int):
+        """Returns the (trace_id, capture_t, submit_t, result_t) context for this result."""
+        now = time.perf_counter()
+        with self._lock:
+            capture_t, submit_t = self._pending.pop(ts_ms, (None, None))
+        return (ts_ms, capture_t, submit_t, now)
+
+    def fire(self, cmd: str, ctx, first_seen_t: float | None = None) -> FireTrace:
+        trace_id, capture_t, submit_t, result_t = ctx or (None, None, None, None)
+        return FireTrace(trace_id, cmd, capture_t, submit_t, result_t, first_seen_t, time.perf_counter())
+
+    def performed(self, trace: FireTrace | None, start_t: float, ok: bool = True):
+        if trace is None:
+            return
+        trace.start_t, trace.end_t, trace.ok = start_t, time.perf_counter(), ok
+        with self._lock:
+            self._done.append(trace)
+        if self.log_path:
+            try:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(trace.as_dict()) + "\n")
+            except OSError as e:
+                print("[trace] log failed:", e)
+        elif self.log:
+            sp = trace.spans()
+            parts = " ".join(f"{k}={v}" for k, v in sp.items() if k != "total" and v is not None)
+            print(f"[trace {trace.trace_id}] {trace.cmd} total={sp['total']}ms {parts}")
+
+    def recent(self, n: int | None = None) -> list[dict]:
+        with self._lock:
+            items = list(self._done)
+        return [t.as_dict() for t in (items[-n:] if n else items)]
@@ -0,0 +1,217 @@
+"""
+Headless batch recognition over video files (MediaPipe VIDEO mode), using
+every core: each file is cut into chunks of `chunk_s` seconds that are
+recognized in a process pool. A chunk starts `overlap_s` early so the
+recognizer's hand tracking has settled by its first kept frame; the
+warm-up results are discarded and the chunks are merged back in order.
+Timestamps are media time (frame index / fps), so results do not depend
+on the chunking.
+
+Per input the output is a .gcr recording (replayable with other bindings /
+thresholds via src.replay.replay) or a CSV timeline of results, chosen
+commands and fires.
+
+    python -m src.replay.batch clips/*.mp4 --out-dir out/ [--format gcr|csv] [--workers N]
+                               [--bindings b.json] [--threshold Victory=0.8] [--debounce '{...}']
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import cv2
+
+from ..bindings import DEFAULT_BINDINGS
+from ..logic.choose import MIN_SCORE, choose_command
+from ..logic.debounce import make_debouncer
+from ..logic.handframe import HandFrame
+from ..paths import MODEL_PATH
+from .recording import Recorder, Recording
+from .replay import parse_thresholds, replay
+
+def probe(path: str) -> tuple[float, int]:
+    """(fps, frame count) from the container; count may be approximate or 0."""
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise RuntimeError(f"Cannot open video: {path}")
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    n = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+    cap.release()
+    return fps, n
+
+def plan_chunks(n_frames: int, fps: float, chunk_s: float = 60.0, overlap_s: float = 2.0):
+    """[(warm_start, start, end)] frame ranges; the last end is None (read to EOF, counts can be short)."""
+    size = max(1, int(chunk_s * fps))
+    warm = int(overlap_s * fps)
+    starts = list(range(0, max(n_frames, 1), size))
+    return [(max(0, s - warm), s, starts[i + 1] if i + 1 < len(starts) else None)
+            for i, s in enumerate(starts)]
+
+def _make_recognizer(model_path: str, num_hands: int):
+    import mediapipe as mp
+    vision = mp.tasks.vision
+    options = vision.GestureRecognizerOptions(
+        base_options=mp.tasks.BaseOptions(model_asset_path=model_path),
+        running_mode=vision.RunningMode.VIDEO,
+        num_hands=num_hands,
+    )
+    return vision.GestureRecognizer.create_from_options(options)
+
+def _seek(cap, frame: int, fps: float):
+    """
+    Decode up to `frame` and return it (None past EOF). The decoded frame's
+    timestamp is compared with the target instead of trusting the container
+    seek: a seek that lands early is decoded forward, one that overshoots
+    (keyframe snapping) restarts from the first frame.
+    """
+    target, half = frame * 1000.0 / fps, 500.0 / fps
+    if frame:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame)
+    ok = cap.grab()
+    if ok and cap.get(cv2.CAP_PROP_POS_MSEC) > target + half:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        ok = cap.grab()
+    while ok and cap.get(cv2.CAP_PROP_POS_MSEC) < target - half:
+        ok = cap.grab()
+    return cap.retrieve()[1] if ok else None
+
+def recognize_chunk(path: str, fps: float, warm_start: int, start: int, end: int | None,
+                    out_path: str, model_path: str = MODEL_PATH, num_hands: int = 2,
+                    recognizer_factory=_make_recognizer) -> tuple[str, int]:
+    """Worker: recognize frames [warm_start, end) and record [start, end) to out_path. Returns (out_path, frames)."""
+    import mediapipe as mp
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise RuntimeError(f"Cannot open video: {path}")
+    recognizer = recognizer_factory(model_path, num_hands)
+    rec = Recorder(out_path)
+    try:
+        frame = _seek(cap, warm_start, fps)
+        i = warm_start
+        while frame is not None and (end is None or i < end):
+            ts_ms = int(round(i * 1000.0 / fps))
+            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            result = recognizer.recognize_for_video(mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb), ts_ms)
+            if i >= start:
+                rec.write(HandFrame.from_result(result, ts_ms))
+            i += 1
+            frame = cap.read()[1]
+    finally:
+        rec.close()
+        recognizer.close()
+        cap.release()
+    return out_path, rec.frames
+
+def _output_base(path: str, used: set) -> str:
+    """Output name for `path`: the clip name, numbered when another input already took it."""
+    stem = base = os.path.splitext(os.path.basename(path))[0]
+    n = 1
+    while base in used:     # same clip name from different folders
+        base = f"{stem}_{n}"
+        n += 1
+    used.add(base)
+    return base
+
+def merge(parts: list[str], out_path: str) -> int:
+    """Concatenate chunk recordings in order (labels re-interned); returns frames written."""
+    out = Recorder(out_path)
+    last_ts = -1
+    try:
+        for part in parts:
+            for hands in Recording(part):
+                if hands.ts_ms > last_ts:       # guard against overlapping chunks from inexact seeks
+                    out.write(hands)
+                    last_ts = hands.ts_ms
+    finally:
+        out.close()
+    return out.frames
+
+def write_csv(recording: Recording, out_path: str, bindings: dict, thresholds=None, debounce=None,
+              min_score: float = MIN_SCORE) -> int:
+    """One row per result: ts_ms, hands, top label / score, chosen command, fired command. Returns fires."""
+    d = make_debouncer(debounce)
+    fires = 0
+    with open(out_path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(("ts_ms", "hands", "label", "score", "chosen", "fired"))
+        for hands in recording:
+            cmd = choose_command(hands, bindings, thresholds, min_score)
+            fired = d.update(cmd, hands.ts_ms, hands.ts_ms)
+            fires += fired is not None
+            label, score = max(hands.top, key=lambda t: t[1]) if hands.top else ("", None)
+            w.writerow((hands.ts_ms, hands.n_hands, label, "" if score is None else f"{score:.3f}",
+                        cmd or "", fired or ""))
+    return fires
+
+def run_batch(inputs: list[str], out_dir: str, fmt: str = "gcr", workers: int | None = None,
+              chunk_s: float = 60.0, overlap_s: float = 2.0, bindings: dict | None = None,
+              thresholds=None, debounce=None, min_score: float = MIN_SCORE, model_path: str = MODEL_PATH,
+              recognizer_factory=_make_recognizer) -> list[dict]:
+    """Recognize every input with all chunks of all files in one pool; returns per-file stats."""
+    os.makedirs(out_dir, exist_ok=True)
+    bindings = DEFAULT_BINDINGS if bindings is None else bindings
+    workers = workers or os.cpu_count() or 1
+    stats, used = [], set()
+    with tempfile.TemporaryDirectory(dir=out_dir) as tmp, \
+            ProcessPoolExecutor(workers, mp_context=get_context("spawn")) as pool:
+        jobs = []
+        for k, path in enumerate(inputs):
+            fps, n = probe(path)
+            futs = [pool.submit(recognize_chunk, path, fps, w, s, e,
+                                os.path.join(tmp, f"{k}_{j}.gcr"), model_path, 2, recognizer_factory)
+                    for j, (w, s, e) in enumerate(plan_chunks(n, fps, chunk_s, overlap_s))]
+            jobs.append((path, fps, futs))
+        for path, fps, futs in jobs:
+            parts = [fut.result()[0] for fut in futs]
+            t0 = time.perf_counter()
+            base = _output_base(path, used)
+            merged = os.path.join(tmp if fmt == "csv" else out_dir, base + ".gcr")
+            frames = merge(parts, merged)
+            rec = Recording(merged)
+            if fmt == "csv":
+                out = os.path.join(out_dir, base + ".csv")
+                fires = write_csv(rec, out, bindings, thresholds, debounce, min_score)
+            else:
+                out = merged
+                fires = len(replay(rec, bindings, thresholds, debounce, min_score)["fires"])
+            rec.close()
+            stats.append({"input": path, "output": out, "frames": frames, "chunks": len(parts),
+                          "fps": fps, "fires": fires, "merge_s": round(time.perf_counter() - t0, 3)})
+    return stats
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Recognize gestures in video files (headless, all cores).")
+    ap.add_argument("inputs", nargs="+", help="video files")
+    ap.add_argument("--out-dir", default="batch_out")
+    ap.add_argument("--format", choices=("gcr", "csv"), default="gcr")
+    ap.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    ap.add_argument("--chunk-s", type=float, default=60.0)
+    ap.add_argument("--overlap-s", type=float, default=2.0)
+    ap.add_argument("--bindings", help="JSON file {gesture: command} (default: src.bindings.DEFAULT_BINDINGS)")
+    ap.add_argument("--threshold", action="append", metavar="LABEL=SCORE", help="per-gesture minimum score")
+    ap.add_argument("--min-score", type=float, default=MIN_SCORE)
+    ap.add_argument("--debounce", type=json.loads, help="GestureDebouncer kwargs as JSON")
+    args = ap.parse_args(argv)
+
+    if not os.path.exists(MODEL_PATH):
+        raise FileNotFoundError(f"Model not found: {MODEL_PATH}")
+    bindings = None
+    if args.bindings:
+        with open(args.bindings, encoding="utf-8") as f:
+            bindings = json.load(f)
+    t0 = time.perf_counter()
+    stats = run_batch(args.inputs, args.out_dir, args.format, args.workers, args.chunk_s, args.overlap_s,
+                      bindings, parse_thresholds(args.threshold), args.debounce, args.min_score)
+    for s in stats:
+        print(json.dumps(s))
+    frames = sum(s["frames"] for s in stats)
+    dt = time.perf_counter() - t0
+    print(f"{len(stats)} files, {frames} frames in {dt:.1f} s ({frames / dt:.0f} frames/s)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
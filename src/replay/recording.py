@@ -0,0 +1,174 @@
+"""
+Compact, memory-mappable recordings of recognizer output (.gcr).
+
+Layout (little-endian):
+  header   64 bytes: magic, version, top_k, record size, label table offset
+  records  fixed-size numpy records, one per hand (one with n_hands=0 for a
+           frame without hands), appended as results arrive
+  labels   JSON list of gesture names, written on close()
+
+Records are usable without the label table (e.g. after a crash): the
+names MediaPipe ships are pre-seeded, only extra labels then read as "#id".
+"""
+import json
+import os
+import struct
+import threading
+
+import numpy as np
+
+from ..logic.geometry import HandGeometry, hand_geometry
+from ..logic.handframe import N_LANDMARKS, HandFrame
+
+MAGIC = b"GCREC\x00\x00\x01"
+VERSION = 1
+_HEADER = struct.Struct("<8sIIIQ")      # magic, version, top_k, record size, label table offset
+HEADER_SIZE = 64
+
+# Label ids 0.. are fixed; later labels are appended per recording
+BASE_LABELS = ("", "None", "Closed_Fist", "Open_Palm", "Pointing_Up", "Thumb_Down", "Thumb_Up",
+               "Victory", "ILoveYou")
+HANDEDNESS = ("", "Left", "Right")
+
+def record_dtype(top_k: int = 3) -> np.dtype:
+    return np.dtype([
+        ("ts_ms", "<i8"),
+        ("n_hands", "u1"),       # hands in this frame (0: placeholder record)
+        ("hand", "u1"),          # index within the frame
+        ("handed", "u1"),        # HANDEDNESS id
+        ("_pad", "u1"),
+        ("labels", "<u2", (top_k,)),
+        ("scores", "<f4", (top_k,)),
+        ("landmarks", "<f4", (N_LANDMARKS, 3)),
+    ])
+
+class Recorder:
+    """
+    Appends HandFrames to a .gcr file. write() costs one small buffered file
+    write, so it can run in the result callback; close() adds the label table.
+    """
+    def __init__(self, path: str, top_k: int = 3):
+        self.path, self.top_k = path, top_k
+        self.dtype = record_dtype(top_k)
+        self._ids = {name: i for i, name in enumerate(BASE_LABELS)}
+        self._hand_ids = {name: i for i, name in enumerate(HANDEDNESS)}
+        self._lock = threading.Lock()
+        self._f = open(path, "wb")
+        self._f.write(self._header(0))
+        self.frames = self.records = 0
+
+    def _header(self, labels_at: int) -> bytes:
+        return _HEADER.pack(MAGIC, VERSION, self.top_k, self.dtype.itemsize, labels_at).ljust(HEADER_SIZE, b"\0")
+
+    def _label_id(self, name: str) -> int:
+        i = self._ids.get(name)
+        if i is None:
+            i = self._ids[name] = len(self._ids)
+        return i
+
+    def write(self, hands: HandFrame):
+        n = hands.n_hands
+        rec = np.zeros(max(1, n), self.dtype)
+        rec["ts_ms"] = hands.ts_ms
+        rec["n_hands"] = n
+        if n:
+            k = min(self.top_k, hands.scores.shape[1])
+            rec["hand"] = np.arange(n)
+            rec["handed"] = [self._hand_ids.get(h, 0) for h in hands.handedness]
+            rec["labels"][:, :k] = [[self._label_id(name) for name in labs[:k]] for labs in hands.labels]
+            rec["scores"][:, :k] = hands.scores[:, :k]
+            rec["landmarks"] = hands.landmarks
+        with self._lock:
+            if self._f is None:
+                return
+            self._f.write(rec.tobytes())
+            self.frames += 1
+            self.records += len(rec)
+
+    def close(self):
+        with self._lock:
+            f, self._f = self._f, None
+            if f is None:
+                return
+            labels_at = f.tell()
+            f.write(json.dumps(list(self._ids)).encode("utf-8"))
+            f.seek(0)
+            f.write(self._header(labels_at))
+            f.close()
+
+class Recording:
+    """
+    Read side: the records are an np.memmap (no copy, any size), with a
+    frame index built in one vectorized pass.
+
+      records: structured array, see record_dtype()
+      labels:  label id -> name
+      ts_ms:   (frames,) timestamps
+    """
+    def __init__(self, path: str):
+        self.path = path
+        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            magic, version, top_k, rec_size, labels_at = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"not a gesture recording (v{VERSION}): {path}")
+            end = labels_at or size
+            self.labels = list(BASE_LABELS)
+            if labels_at:
+                f.seek(labels_at)
+                self.labels = json.loads(f.read().decode("utf-8"))
+        self.top_k = top_k
+        self.dtype = record_dtype(top_k)
+        if self.dtype.itemsize != rec_size:
+            raise ValueError(f"record size mismatch in {path}")
+        n = (end - HEADER_SIZE) // rec_size       # a torn last record is ignored
+        self.records = (np.memmap(path, self.dtype, "r", HEADER_SIZE, (n,)) if n
+                        else np.zeros(0, self.dtype))
+        self._starts = np.flatnonzero(self.records["hand"] == 0)
+        self._counts = self.records["n_hands"][self._starts].astype(np.intp)
+        if n and self._starts[-1] + max(1, self._counts[-1]) > n:    # frame cut short by a crash
+            self._starts, self._counts = self._starts[:-1], self._counts[:-1]
+        self.ts_ms = self.records["ts_ms"][self._starts]
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def _name(self, i: int) -> str:
+        return self.labels[i] if i < len(self.labels) else f"#{i}"
+
+    def frame(self, i: int) -> HandFrame:
+        s, n = int(self._starts[i]), int(self._counts[i])
+        if not n:
+            return HandFrame.empty(int(self.ts_ms[i]), self.top_k)
+        r = self.records[s:s + n]
+        labels = tuple(tuple(self._name(j) for j in row) for row in r["labels"].tolist())
+        handed = tuple(HANDEDNESS[h] if h < len(HANDEDNESS) else "" for h in r["handed"].tolist())
+        return HandFrame(int(r["ts_ms"][0]), np.asarray(r["landmarks"]), handed, labels, np.asarray(r["scores"]))
+
+    def __iter__(self):
+        """HandFrames in order, with finger geometry computed in bulk (chunk_frames frames per pass)."""
+        return self.frames()
+
+    def frames(self, chunk_frames: int = 16384):
+        for c0 in range(0, len(self), chunk_frames):
+            c1 = min(c0 + chunk_frames, len(self))
+            r0 = int(self._starts[c0])
+            r1 = int(self._starts[c1]) if c1 < len(self) else len(self.records)
+            g = hand_geometry(self.records["landmarks"][r0:r1])
+            for i in range(c0, c1):
+                hf = self.frame(i)
+                if hf.n_hands:
+                    s = int(self._starts[i]) - r0
+                    e = s + hf.n_hands
+                    hf.geom = HandGeometry(g.cos[s:e], g.extended[s:e], g.vectors[s:e], g.direction[s:e])
+                yield hf
+
+    def close(self):
+        # The mapping goes away with the last view (frames handed out may still use it)
+        self.records = np.zeros(0, self.dtype)
+
+def make_recorder(cfg=None) -> Recorder | None:
+    """cfg: None/False -> disabled, str -> output path, dict -> Recorder kwargs."""
+    if isinstance(cfg, dict):
+        return Recorder(**cfg)
+    return Recorder(cfg) if cfg else None
@@ -0,0 +1,80 @@
+"""
+Replays a recording through the decision logic (choose_command, the
+debouncer, Pointing_Down geometry) as fast as it runs: no MediaPipe, camera
+or action backend. Hold / cooldown timing uses the recorded timestamps, so
+the result matches what the live loop would have fired.
+
+    python -m src.replay.replay session.gcr [--bindings b.json] [--threshold Victory=0.8]
+                                            [--debounce '{"hold_ms": 150}'] [--csv fires.csv]
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+
+from ..bindings import DEFAULT_BINDINGS
+from ..logic.choose import MIN_SCORE, choose_command
+from ..logic.debounce import make_debouncer
+from .recording import Recording
+
+def replay(recording, bindings: dict, thresholds: dict | None = None, debounce: dict | None = None,
+           min_score: float = MIN_SCORE) -> dict:
+    """
+    recording: Recording, path, or any iterable of HandFrames.
+    Returns {"fires": [(ts_ms, cmd, label)], "frames", "chosen", "elapsed_s"}
+    (chosen = results that mapped to a command before debouncing).
+    """
+    if isinstance(recording, str):
+        recording = Recording(recording)
+    d = make_debouncer(debounce)
+    fires, frames, chosen = [], 0, 0
+    t0 = time.perf_counter()
+    for hands in recording:
+        frames += 1
+        cmd = choose_command(hands, bindings, thresholds, min_score)
+        if cmd is not None:
+            chosen += 1
+        fired = d.update(cmd, hands.ts_ms, hands.ts_ms)
+        if fired is not None:
+            top = max(hands.top, key=lambda t: t[1])[0] if hands.top else None
+            fires.append((hands.ts_ms, fired, top))
+    return {"fires": fires, "frames": frames, "chosen": chosen, "elapsed_s": time.perf_counter() - t0}
+
+def parse_thresholds(items):
+    out = {}
+    for item in items or ():
+        label, _, score = item.partition("=")
+        out[label] = float(score)
+    return out
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Replay a .gcr recording through the gesture decision logic.")
+    ap.add_argument("recording")
+    ap.add_argument("--bindings", help="JSON file {gesture: command} (default: src.bindings.DEFAULT_BINDINGS)")
+    ap.add_argument("--threshold", action="append", metavar="LABEL=SCORE", help="per-gesture minimum score")
+    ap.add_argument("--min-score", type=float, default=MIN_SCORE)
+    ap.add_argument("--debounce", type=json.loads, help="GestureDebouncer kwargs as JSON")
+    ap.add_argument("--csv", help="write fires here (ts_ms,cmd,label) instead of printing them")
+    args = ap.parse_args(argv)
+
+    bindings = DEFAULT_BINDINGS
+    if args.bindings:
+        with open(args.bindings, encoding="utf-8") as f:
+            bindings = json.load(f)
+    rec = Recording(args.recording)
+    out = replay(rec, bindings, parse_thresholds(args.threshold), args.debounce, args.min_score)
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(("ts_ms", "cmd", "label"))
+            w.writerows(out["fires"])
+    else:
+        for ts, cmd, label in out["fires"]:
+            print(f"{ts:>12} {cmd:<24} {label or ''}")
+    span_s = (rec.ts_ms[-1] - rec.ts_ms[0]) / 1000.0 if len(rec) > 1 else 0.0
+    print(f"{out['frames']} frames ({span_s:.0f} s recorded) -> {len(out['fires'])} fires "
+          f"in {out['elapsed_s']:.2f} s", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
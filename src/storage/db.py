@@ -1,8 +1,13 @@
+import json
 import os
-import sqlite3
 import platform
+import threading
+from concurrent.futures import Future
+from types import MappingProxyType
 from typing import List, Optional
 
+from .sqlite_io import ReadPool, Writer
+
 APP_DIR_NAME = "gesture-ctrl"
 
 def _app_data_dir() -> str:
@@ -20,123 +25,331 @@ def _app_data_dir() -> str:
 def _db_path() -> str:
     return os.path.join(_app_data_dir(), "gesture.db")
 
-_SCHEMA = """
-PRAGMA journal_mode=WAL;
-CREATE TABLE IF NOT EXISTS urls (
-  id INTEGER PRIMARY KEY AUTOINCREMENT,
-  name TEXT UNIQUE NOT NULL,
-  url  TEXT NOT NULL
-);
-CREATE TABLE IF NOT EXISTS settings (
-  key TEXT PRIMARY KEY,
-  value TEXT
-);
+# Schema migrations: _MIGRATIONS[i] takes the database from version i to i + 1
+# (PRAGMA user_version). Append only; never edit a shipped step.
+_MIGRATIONS = (
+    # 1: URL presets + key/value settings (IF NOT EXISTS: pre-versioning databases are v0 with these tables)
+    """
+    CREATE TABLE IF NOT EXISTS urls (
+      id INTEGER PRIMARY KEY AUTOINCREMENT,
+      name TEXT UNIQUE NOT NULL,
+      url  TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS settings (
+      key TEXT PRIMARY KEY,
+      value TEXT
+    );
+    """,
+    # 2: gesture bindings and per-gesture score thresholds
+    """
+    CREATE TABLE bindings (
+      gesture TEXT PRIMARY KEY,
+      action  TEXT NOT NULL
+    );
+    CREATE TABLE thresholds (
+      gesture   TEXT PRIMARY KEY,
+      min_score REAL NOT NULL CHECK (min_score BETWEEN 0 AND 1)
+    );
+    """,
+)
+SCHEMA_VERSION = len(_MIGRATIONS)
+
+def _migrate(conn) -> int:
+    """Bring the database to SCHEMA_VERSION, one transaction per step. Returns the version found."""
+    conn.execute("PRAGMA journal_mode=WAL")
+    found = conn.execute("PRAGMA user_version").fetchone()[0]
+    if found > SCHEMA_VERSION:
+        print(f"[DB] schema v{found} is newer than this build (v{SCHEMA_VERSION}); newer data is ignored")
+    for v in range(found, SCHEMA_VERSION):
+        try:
+            conn.executescript(f"BEGIN IMMEDIATE; {_MIGRATIONS[v]} PRAGMA user_version={v + 1}; COMMIT;")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+    return found
+
+# Whole state in one statement (startup and every snapshot refresh)
+_LOAD_SQL = """
+SELECT 'u' AS kind, id, name AS k, url AS v FROM urls
+UNION ALL SELECT 's', 0, key, value FROM settings
+UNION ALL SELECT 'b', 0, gesture, action FROM bindings
+UNION ALL SELECT 't', 0, gesture, min_score FROM thresholds
+ORDER BY 1, 2
 """
 
+# settings keys holding JSON (everything else, e.g. active_url, is plain text)
+CAMERA_KEY = "camera_index"
+ENGINE_PREFIX = "engine."
+
+class Config:
+    """
+    Read-only view of the persisted app configuration (one per snapshot).
+      bindings:     {gesture: action}, only gestures bound in the database
+      thresholds:   {gesture: min score}
+      camera_index: int or None (not chosen yet)
+      engine:       {GestureEngine kwarg: JSON value}
+    """
+    __slots__ = ("bindings", "thresholds", "camera_index", "engine")
+
+    def __init__(self, bindings, thresholds, settings):
+        set_ = object.__setattr__
+        set_(self, "bindings", MappingProxyType(dict(bindings)))
+        set_(self, "thresholds", MappingProxyType(dict(thresholds)))
+        set_(self, "camera_index", _json(settings.get(CAMERA_KEY)))
+        set_(self, "engine", MappingProxyType({k[len(ENGINE_PREFIX):]: _json(v) for k, v in settings.items()
+                                               if k.startswith(ENGINE_PREFIX)}))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Config is read-only")
+
+    def __repr__(self):
+        return (f"Config(bindings={dict(self.bindings)}, thresholds={dict(self.thresholds)}, "
+                f"camera_index={self.camera_index}, engine={dict(self.engine)})")
+
+def _json(text):
+    if text is None:
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        print("[DB] bad JSON setting:", text)
+        return None
+
+class _Snapshot:
+    """Immutable view of all tables; swapped as a whole after every commit."""
+    __slots__ = ("rows", "by_name", "settings", "config")
+
+    def __init__(self, rows, settings, bindings=(), thresholds=()):
+        self.rows = tuple(rows)                                   # ({"id", "name", "url"}, ...) by id
+        self.by_name = {r["name"]: r["url"] for r in self.rows}
+        self.settings = dict(settings)
+        self.config = Config(bindings, thresholds, self.settings)
+
+def _report_save_error(fut):
+    if fut.exception() is not None:
+        print("[DB] saving settings failed:", fut.exception())
+
 class UrlStore:
-    """SQLite-backed URL presets with an active selection (limit 10 entries)."""
+    """
+    SQLite-backed app state: URL presets with an active selection (limit 10
+    entries), gesture bindings, per-gesture thresholds, camera and engine
+    parameters (schema versioned, see _MIGRATIONS).
+
+    Reads (get_url, list_names, config, ...) are served from an in-memory
+    snapshot and never touch a connection, from any thread. The snapshot is
+    loaded with a single query, at startup and after every commit. Every
+    write goes to the single writer thread (src/storage/sqlite_io.Writer):
+    writes queued at the same time are committed in one transaction, and the
+    snapshot is re-read in that transaction and swapped in after COMMIT.
+    URL mutators wait for their result by default; wait=False returns a
+    Future instead. Config setters (set_binding, set_threshold, ...) return
+    at once: changes are coalesced for `save_delay` seconds and written as one
+    job, so scrolling through a combo box costs one commit; flush() forces it.
+    Ad-hoc queries run on a pool of read-only WAL connections: query() /
+    read() -> Future, with an optional callback (called on the pool thread).
+    """
     LIMIT = 10
     DEFAULT_NAME = "YouTube"
     DEFAULT_URL = "https://www.youtube.com/"
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, readers: int = 2, save_delay: float = 0.5):
         self.db_path = db_path or _db_path()
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
-        self._init_db()
+        self.save_delay = save_delay
+        self._snap = _Snapshot((), {})
+        self._pending = {}     # (table, key) -> value (None = delete), written by flush()
+        self._plock = threading.Lock()
+        self._timer = None
+        self._writer = Writer(self.db_path, setup=self._setup, on_commit=self._read_snapshot,
+                              after_commit=self._swap)
+        self._pool = ReadPool(self.db_path, size=readers)
+        # Seed defaults if empty
+        if not self.list_urls():
+            self.ensure(self.DEFAULT_NAME, self.DEFAULT_URL)
+            self.set_active_name(self.DEFAULT_NAME)
 
     @property
     def path(self) -> str:
         """Absolute filesystem path to the SQLite database file."""
         return self.db_path
 
-    def _init_db(self):
-        with self.conn:
-            self.conn.executescript(_SCHEMA)
-        # Seed defaults if empty
-        if not self.list_urls():
-            self.add_url(self.DEFAULT_NAME, self.DEFAULT_URL)
-            self.set_active_name(self.DEFAULT_NAME)
+    # ---------- writer thread ----------
+    def _setup(self, conn):
+        _migrate(conn)
+        self._swap(self._read_snapshot(conn))
 
-    # ---------- CRUD ----------
+    @staticmethod
+    def _read_snapshot(conn) -> "_Snapshot":
+        parts = {"u": [], "s": [], "b": [], "t": []}
+        for kind, id_, k, v in conn.execute(_LOAD_SQL):
+            parts[kind].append({"id": id_, "name": k, "url": v} if kind == "u" else (k, v))
+        return _Snapshot(parts["u"], parts["s"], parts["b"], parts["t"])
+
+    def _swap(self, snap):
+        self._snap = snap
+
+    def _write(self, fn, wait: bool):
+        fut = self._writer.submit(fn)
+        return fut.result() if wait else fut
+
+    @staticmethod
+    def _set_setting(conn, key: str, value: str) -> None:
+        conn.execute(
+            "INSERT INTO settings(key,value) VALUES(?,?) "
+            "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+            (key, value),
+        )
+
+    @staticmethod
+    def _active(conn) -> Optional[str]:
+        row = conn.execute("SELECT value FROM settings WHERE key='active_url'").fetchone()
+        return row["value"] if row else None
+
+    # ---------- reads (snapshot) ----------
     def list_urls(self):
-        cur = self.conn.execute("SELECT id,name,url FROM urls ORDER BY id ASC")
-        return cur.fetchall()
+        return list(self._snap.rows)
 
     def list_names(self) -> List[str]:
-        return [row["name"] for row in self.list_urls()]
+        return [row["name"] for row in self._snap.rows]
 
     def get_url(self, name: str) -> Optional[str]:
-        cur = self.conn.execute("SELECT url FROM urls WHERE name = ?", (name,))
-        row = cur.fetchone()
-        return row["url"] if row else None
+        return self._snap.by_name.get(name)
 
     def count(self) -> int:
-        cur = self.conn.execute("SELECT COUNT(*) AS c FROM urls")
-        return cur.fetchone()["c"]
-
-    def add_url(self, name: str, url: str) -> None:
-        if self.count() >= self.LIMIT:
-            raise ValueError(f"Maximum of {self.LIMIT} URLs reached")
-        with self.conn:
-            self.conn.execute("INSERT INTO urls(name,url) VALUES(?,?)", (name, url))
-
-    def update_url(self, old_name: str, new_name: str, new_url: str) -> None:
-        with self.conn:
-            if old_name != new_name:
-                cur = self.conn.execute("SELECT 1 FROM urls WHERE name=?", (new_name,))
-                if cur.fetchone():
-                    raise ValueError("Name already exists")
-            self.conn.execute(
-                "UPDATE urls SET name=?, url=? WHERE name=?",
-                (new_name, new_url, old_name),
-            )
+        return len(self._snap.rows)
+
+    @property
+    def config(self) -> Config:
+        """Committed configuration (pending debounced changes not included until flushed)."""
+        return self._snap.config
+
+    # ---------- reads (pool) ----------
+    def query(self, sql: str, params=(), callback=None) -> Future:
+        return self._pool.query(sql, params, callback)
+
+    def read(self, fn, callback=None) -> Future:
+        return self._pool.read(fn, callback)
+
+    # ---------- CRUD (writer) ----------
+    def add_url(self, name: str, url: str, wait: bool = True):
+        def job(c):
+            if c.execute("SELECT COUNT(*) FROM urls").fetchone()[0] >= self.LIMIT:
+                raise ValueError(f"Maximum of {self.LIMIT} URLs reached")
+            c.execute("INSERT INTO urls(name,url) VALUES(?,?)", (name, url))
+        return self._write(job, wait)
+
+    def update_url(self, old_name: str, new_name: str, new_url: str, wait: bool = True):
+        def job(c):
+            if old_name != new_name and c.execute("SELECT 1 FROM urls WHERE name=?", (new_name,)).fetchone():
+                raise ValueError("Name already exists")
+            c.execute("UPDATE urls SET name=?, url=? WHERE name=?", (new_name, new_url, old_name))
             # Keep active selection consistent if renamed
-            cur = self.conn.execute("SELECT value FROM settings WHERE key='active_url'")
-            row = cur.fetchone()
-            if row and row["value"] == old_name:
-                self.set_active_name(new_name)
-
-    def delete_url(self, name: str) -> None:
-        with self.conn:
-            self.conn.execute("DELETE FROM urls WHERE name=?", (name,))
+            if self._active(c) == old_name:
+                self._set_setting(c, "active_url", new_name)
+        return self._write(job, wait)
+
+    def delete_url(self, name: str, wait: bool = True):
+        def job(c):
+            c.execute("DELETE FROM urls WHERE name=?", (name,))
             # If deleting active, fall back to first remaining row
-            cur = self.conn.execute("SELECT value FROM settings WHERE key='active_url'")
-            row = cur.fetchone()
-            if row and row["value"] == name:
-                names = self.list_names()
-                self.set_active_name(names[0] if names else self.DEFAULT_NAME)
+            if self._active(c) == name:
+                row = c.execute("SELECT name FROM urls ORDER BY id ASC LIMIT 1").fetchone()
+                self._set_setting(c, "active_url", row["name"] if row else self.DEFAULT_NAME)
+        return self._write(job, wait)
 
     # ---------- active selection ----------
-    def set_active_name(self, name: str) -> None:
-        if not self.get_url(name):
-            raise ValueError("URL name not found")
-        with self.conn:
-            self.conn.execute(
-                "INSERT INTO settings(key,value) VALUES('active_url',?) "
-                "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
-                (name,),
-            )
+    def set_active_name(self, name: str, wait: bool = True):
+        def job(c):
+            if not c.execute("SELECT 1 FROM urls WHERE name=?", (name,)).fetchone():
+                raise ValueError("URL name not found")
+            self._set_setting(c, "active_url", name)
+        return self._write(job, wait)
 
     def get_active_name(self) -> str:
-        cur = self.conn.execute("SELECT value FROM settings WHERE key='active_url'")
-        row = cur.fetchone()
-        return row["value"] if row else self.DEFAULT_NAME
+        return self._snap.settings.get("active_url") or self.DEFAULT_NAME
 
     def get_active_url(self) -> str:
-        name = self.get_active_name()
-        url = self.get_url(name)
-        return url or self.DEFAULT_URL
+        snap = self._snap     # one snapshot for both lookups
+        return snap.by_name.get(snap.settings.get("active_url") or self.DEFAULT_NAME) or self.DEFAULT_URL
 
     # ---------- utils ----------
-    def ensure(self, name: str, url: str) -> None:
+    def ensure(self, name: str, url: str, wait: bool = True):
         """Ensure a (name,url) exists; create if missing (respects LIMIT)."""
-        if self.get_url(name):
-            return
-        self.add_url(name, url)
+        def job(c):
+            if c.execute("SELECT 1 FROM urls WHERE name=?", (name,)).fetchone():
+                return
+            if c.execute("SELECT COUNT(*) FROM urls").fetchone()[0] >= self.LIMIT:
+                raise ValueError(f"Maximum of {self.LIMIT} URLs reached")
+            c.execute("INSERT INTO urls(name,url) VALUES(?,?)", (name, url))
+        return self._write(job, wait)
+
+    # ---------- config (debounced writer) ----------
+    def set_binding(self, gesture: str, action: Optional[str]):
+        """Bind `gesture` to `action` (None = unbind)."""
+        self._stage("bindings", gesture, action, self._snap.config.bindings.get(gesture))
+
+    def set_bindings(self, bindings: dict):
+        for gesture, action in bindings.items():
+            self.set_binding(gesture, action)
+
+    def set_threshold(self, gesture: str, min_score: Optional[float]):
+        """Minimum recognizer score for `gesture` (None = engine default)."""
+        if min_score is not None and not 0.0 <= min_score <= 1.0:
+            raise ValueError("min_score must be within 0..1")
+        self._stage("thresholds", gesture, min_score, self._snap.config.thresholds.get(gesture))
+
+    def set_camera(self, index: Optional[int]):
+        self._stage("settings", CAMERA_KEY, index, self._snap.config.camera_index)
+
+    def set_engine_param(self, name: str, value):
+        """Persist a GestureEngine keyword argument (JSON-serialisable; None = default)."""
+        json.dumps(value)    # fail here, not on the writer thread
+        self._stage("settings", ENGINE_PREFIX + name, value, self._snap.config.engine.get(name))
+
+    def _stage(self, table: str, key: str, value, committed):
+        with self._plock:
+            if (table, key) not in self._pending and value == committed:
+                return    # no-op change, nothing to write
+            self._pending[(table, key)] = value
+            if self._timer is None:
+                self._timer = threading.Timer(self.save_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self, wait: bool = False):
+        """Write pending config changes now, as one writer job (None if nothing was pending)."""
+        with self._plock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not pending:
+            return None
+
+        def job(c):
+            for (table, key), value in pending.items():
+                if table == "bindings":
+                    if value is None: c.execute("DELETE FROM bindings WHERE gesture=?", (key,))
+                    else: c.execute("INSERT INTO bindings(gesture,action) VALUES(?,?) "
+                                    "ON CONFLICT(gesture) DO UPDATE SET action=excluded.action", (key, value))
+                elif table == "thresholds":
+                    if value is None: c.execute("DELETE FROM thresholds WHERE gesture=?", (key,))
+                    else: c.execute("INSERT INTO thresholds(gesture,min_score) VALUES(?,?) "
+                                    "ON CONFLICT(gesture) DO UPDATE SET min_score=excluded.min_score",
+                                    (key, float(value)))
+                elif value is None:
+                    c.execute("DELETE FROM settings WHERE key=?", (key,))
+                else:
+                    self._set_setting(c, key, json.dumps(value))
+        if wait:
+            return self._write(job, True)
+        return self._writer.submit(job, callback=_report_save_error)
 
     def close(self):
+        """Flush pending and queued writes, then close the writer and the read pool."""
         try:
-            self.conn.close()
+            self.flush()
+            self._writer.close()
+            self._pool.close()
         except Exception:
             pass
@@ -0,0 +1,199 @@
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from itertools import islice
+
+from .db import _app_data_dir
+from .sqlite_io import ReadPool, Writer
+
+_SCHEMA = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+CREATE TABLE IF NOT EXISTS events (
+  t_ms  INTEGER NOT NULL,    -- wall clock, ms since epoch
+  kind  TEXT NOT NULL,       -- seen / near / fire
+  label TEXT,
+  cmd   TEXT,
+  score REAL
+);
+CREATE INDEX IF NOT EXISTS events_t ON events(t_ms);
+"""
+
+_INSERT = "INSERT INTO events(t_ms,kind,label,cmd,score) VALUES(?,?,?,?,?)"
+
+def _journal_path() -> str:
+    return os.path.join(_app_data_dir(), "events.db")
+
+class EventJournal:
+    """
+    Append-only gesture event log (SQLite WAL, separate from the settings db).
+
+    record() only appends a tuple to an in-memory buffer, so it is safe to
+    call from the MediaPipe callback / frame loop; when the buffer holds
+    `max_buffer` events new ones are dropped (and counted) instead of
+    waiting. A background thread hands the new part of the buffer to the
+    writer thread every `flush_ms` (or once `batch` events are waiting) as
+    one executemany(), with at most one such insert in flight. Rows leave
+    the buffer only once their insert has committed, so `max_buffer` bounds
+    memory even when the disk is slow. flush() returns a Future that is done
+    once everything recorded before the call is on disk.
+
+    Event kinds:
+      seen: best recognized gesture of a result, at or above its threshold
+      near: bound gesture scored below its threshold by at most near_margin
+      fire: a command was fired (label / score of the triggering result)
+
+    Aggregates run on read-only connections and return Futures; times are
+    wall-clock ms (None = open range).
+    """
+    def __init__(self, path: str | None = None, max_buffer: int = 8192, flush_ms: int = 500,
+                 batch: int = 1024, near_margin: float = 0.15):
+        self.path = path or _journal_path()
+        self.max_buffer, self.batch = max_buffer, batch
+        self.flush_s = flush_ms / 1000.0
+        self.near_margin = near_margin
+        self._buf: deque = deque()      # head: handed to the writer, not yet committed
+        self._submitted = 0             # rows at the head of _buf already handed to the writer
+        self._inflight = 0              # inserts queued / running on the writer
+        self.recorded = self.dropped = self.written = self.failed = 0
+        self._lock = threading.Lock()   # buffer + counters (frame thread, callback thread, writer thread)
+        self._writer = Writer(self.path, setup=lambda c: c.executescript(_SCHEMA))
+        self._pool = ReadPool(self.path, size=1)
+        self._wake = threading.Event()
+        self._stop = False
+        self._thread = threading.Thread(target=self._run, daemon=True, name="journal-flush")
+        self._thread.start()
+
+    # ---- producers (any thread, never block) ----
+    def record(self, kind: str, label: str | None = None, cmd: str | None = None,
+               score: float | None = None, t_ms: int | None = None):
+        row = (int(time.time() * 1000) if t_ms is None else t_ms, kind, label, cmd, score)
+        with self._lock:
+            buf = self._buf
+            if len(buf) >= self.max_buffer:
+                self.dropped += 1
+                return
+            buf.append(row)
+            self.recorded += 1
+            waiting = len(buf) - self._submitted
+        if waiting >= self.batch:
+            self._wake.set()
+
+    def on_result(self, hands, bindings: dict, thresholds: dict, default_min: float):
+        """Log the best gesture of a result as seen / near (nothing when no hand or far below threshold)."""
+        if hands is None or not hands.top:
+            return
+        label, score = max(hands.top, key=lambda t: t[1])
+        min_score = thresholds.get(label, default_min)
+        if score >= min_score:
+            self.record("seen", label, bindings.get(label), score)
+        elif score >= min_score - self.near_margin and label in bindings:
+            self.record("near", label, bindings[label], score)
+
+    def on_fire(self, cmd: str, hands, bindings: dict):
+        """Log a fired command with the best-scoring result gesture bound to it (Pointing_Down: no score)."""
+        label, score = None, None
+        for name, sc in (hands.top if hands is not None else ()):
+            if bindings.get(name) == cmd and (score is None or sc > score):
+                label, score = name, sc
+        if label is None and bindings.get("Pointing_Down") == cmd:
+            label = "Pointing_Down"
+        self.record("fire", label, cmd, score)
+
+    # ---- background flush ----
+    def _submit_rows(self):
+        """Hand the not yet submitted rows to the writer (caller holds _lock)."""
+        rows = list(islice(self._buf, self._submitted, None))
+        if not rows:
+            return
+        self._submitted += len(rows)
+        self._inflight += 1
+        self._writer.submit(lambda c: c.executemany(_INSERT, rows),
+                            callback=lambda fut, n=len(rows): self._committed(fut, n))
+
+    def _committed(self, fut, n: int):
+        # Writer thread, after COMMIT (or failure): only now release the rows
+        err = fut.exception()
+        with self._lock:
+            for _ in range(n):
+                self._buf.popleft()
+            self._submitted -= n
+            self._inflight -= 1
+            if err is None: self.written += n
+            else: self.failed += n
+        if err is not None:
+            print("[journal] write failed:", err)
+
+    def _drain(self):
+        with self._lock:
+            if not self._inflight:    # one insert at a time; the rest waits in the bounded buffer
+                self._submit_rows()
+
+    def _run(self):
+        while not self._stop:
+            self._wake.wait(self.flush_s)
+            self._wake.clear()
+            self._drain()
+
+    def flush(self) -> Future:
+        """Submit what is buffered plus a barrier job; its Future is done once all earlier events are committed."""
+        with self._lock:
+            self._submit_rows()
+            return self._writer.submit(lambda c: None)
+
+    # ---- aggregates (read pool) ----
+    @staticmethod
+    def _range(since_ms, until_ms):
+        return (-1 if since_ms is None else since_ms, 2**62 if until_ms is None else until_ms)
+
+    def summary(self, since_ms=None, until_ms=None, callback=None) -> Future:
+        """[{kind, label, cmd, n, avg_score, first_ms, last_ms}] per kind / label / command."""
+        return self._pool.query(
+            "SELECT kind, label, cmd, COUNT(*) AS n, AVG(score) AS avg_score, "
+            "MIN(t_ms) AS first_ms, MAX(t_ms) AS last_ms FROM events "
+            "WHERE t_ms >= ? AND t_ms < ? GROUP BY kind, label, cmd ORDER BY n DESC",
+            self._range(since_ms, until_ms), callback)
+
+    def near_misses(self, since_ms=None, until_ms=None, callback=None) -> Future:
+        """[{label, seen, near, fires, near_rate}] per gesture; near_rate = near / (seen + near)."""
+        return self._pool.query(
+            "SELECT label, SUM(kind='seen') AS seen, SUM(kind='near') AS near, SUM(kind='fire') AS fires, "
+            "CAST(SUM(kind='near') AS REAL) / MAX(1, SUM(kind IN ('seen','near'))) AS near_rate "
+            "FROM events WHERE t_ms >= ? AND t_ms < ? AND label IS NOT NULL "
+            "GROUP BY label ORDER BY near_rate DESC",
+            self._range(since_ms, until_ms), callback)
+
+    def timeline(self, since_ms=None, until_ms=None, bucket_ms: int = 60_000, kind: str = "fire",
+                 callback=None) -> Future:
+        """[{bucket_ms, cmd, n}] counts of `kind` events per time bucket and command."""
+        return self._pool.query(
+            "SELECT (t_ms / ?) * ? AS bucket_ms, cmd, COUNT(*) AS n FROM events "
+            "WHERE kind = ? AND t_ms >= ? AND t_ms < ? GROUP BY bucket_ms, cmd ORDER BY bucket_ms",
+            (bucket_ms, bucket_ms, kind, *self._range(since_ms, until_ms)), callback)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"recorded": self.recorded, "dropped": self.dropped, "written": self.written,
+                    "failed": self.failed, "buffered": len(self._buf), "commits": self._writer.batches}
+
+    def close(self):
+        """Stop the flush thread, write what is left, close the connections."""
+        self._stop = True
+        self._wake.set()
+        self._thread.join(timeout=2.0)
+        try:
+            self.flush().result(timeout=5.0)
+        except Exception as e:
+            print("[journal] final flush failed:", e)
+        self._writer.close()
+        self._pool.close()
+
+def make_journal(cfg=False) -> EventJournal | None:
+    """cfg: True -> default path, False/None -> disabled, str -> db path, dict -> EventJournal kwargs."""
+    if isinstance(cfg, dict):
+        return EventJournal(**cfg)
+    if isinstance(cfg, str):
+        return EventJournal(cfg)
+    return EventJournal() if cfg else None
@@ -0,0 +1,152 @@
+"""
+SQLite access split by role: one writer thread owning the only read-write
+connection, and a small pool of read-only WAL connections for queries.
+Both hand out concurrent.futures.Future objects (or call a callback).
+"""
+import os
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+
+class Writer:
+    """
+    Serializes every mutation on one thread / connection.
+
+    submit(fn) queues fn(conn); jobs that are waiting when the writer wakes up
+    are committed together in one transaction (up to `max_batch`), each in
+    its own savepoint, so a failing job only rolls back itself and fails its
+    own future. on_commit(conn) runs inside the transaction after the batch
+    and its return value is passed to after_commit() once COMMIT succeeded
+    (snapshot refresh). setup(conn) runs once on the writer thread at start.
+    """
+    def __init__(self, path: str, setup=None, on_commit=None, after_commit=None, max_batch: int = 64):
+        self.path = path
+        self.setup, self.on_commit, self.after_commit = setup, on_commit, after_commit
+        self.max_batch = max_batch
+        self._q: queue.Queue = queue.Queue()
+        self.batches = self.jobs = 0
+        self._ready = Future()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="sqlite-writer")
+        self._thread.start()
+        self._ready.result()        # setup errors surface in the constructor
+
+    def submit(self, fn, callback=None) -> Future:
+        fut = Future()
+        if callback is not None:
+            fut.add_done_callback(callback)
+        self._q.put((fn, fut))
+        return fut
+
+    def _run(self):
+        try:
+            conn = sqlite3.connect(self.path, isolation_level=None)   # explicit BEGIN / COMMIT
+            conn.row_factory = sqlite3.Row
+            if self.setup:
+                self.setup(conn)
+        except Exception as e:
+            self._ready.set_exception(e)
+            return
+        self._ready.set_result(True)
+        while True:
+            job = self._q.get()
+            if job is None:
+                break
+            batch = [job]
+            while len(batch) < self.max_batch:
+                try:
+                    job = self._q.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    self._q.put(None)    # stop after this batch
+                    break
+                batch.append(job)
+            self._commit(conn, batch)
+        conn.close()
+
+    def _commit(self, conn, batch):
+        results = []
+        state = None
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for fn, fut in batch:
+                if not fut.set_running_or_notify_cancel():
+                    continue    # cancelled while queued
+                conn.execute("SAVEPOINT job")
+                try:
+                    results.append((fut, fn(conn), None))
+                    conn.execute("RELEASE job")
+                except Exception as e:
+                    conn.execute("ROLLBACK TO job")
+                    conn.execute("RELEASE job")
+                    results.append((fut, None, e))
+            if self.on_commit:
+                state = self.on_commit(conn)
+            conn.execute("COMMIT")
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            results = [(fut, None, e) for _, fut in batch if fut.running()]
+        else:
+            if self.after_commit:
+                self.after_commit(state)
+        self.batches += 1
+        self.jobs += len(batch)
+        for fut, res, err in results:
+            if err is None: fut.set_result(res)
+            else: fut.set_exception(err)
+
+    def close(self, timeout: float = 5.0):
+        """Commit what is queued, then stop."""
+        self._q.put(None)
+        self._thread.join(timeout)
+
+class ReadPool:
+    """
+    `size` read-only connections (WAL readers never block the writer) served
+    by the same number of threads. read(fn) runs fn(conn) on one of them.
+    """
+    def __init__(self, path: str, size: int = 2):
+        self.uri = f"file:{os.path.abspath(path)}?mode=ro"
+        self._jobs: queue.Queue = queue.Queue()
+        self._threads = [threading.Thread(target=self._run, daemon=True, name=f"sqlite-reader-{i}")
+                         for i in range(size)]
+        for t in self._threads:
+            t.start()
+
+    def read(self, fn, callback=None) -> Future:
+        fut = Future()
+        if callback is not None:
+            fut.add_done_callback(callback)
+        self._jobs.put((fn, fut))
+        return fut
+
+    def query(self, sql: str, params=(), callback=None) -> Future:
+        """Future of [dict] rows."""
+        return self.read(lambda c: [dict(r) for r in c.execute(sql, params)], callback)
+
+    def _run(self):
+        conn = None
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            fn, fut = job
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                if conn is None:
+                    conn = sqlite3.connect(self.uri, uri=True)
+                    conn.row_factory = sqlite3.Row
+                fut.set_result(fn(conn))
+            except Exception as e:
+                fut.set_exception(e)
+        if conn is not None:
+            conn.close()
+
+    def close(self, timeout: float = 1.0):
+        for _ in self._threads:
+            self._jobs.put(None)
+        for t in self._threads:
+            t.join(timeout)
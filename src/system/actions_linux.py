@@ -0,0 +1,230 @@
+import re
+import shutil
+import subprocess
+import threading
+
+from .backends import StubActions
+from .executor import action_timeout
+
+try:
+    import pulsectl    # optional: in-process PulseAudio / PipeWire-pulse control
+except ImportError:
+    pulsectl = None
+
+# Desktop apps tried in order for each "open app" action
+APP_CANDIDATES = {
+    "open_calculator": ("gnome-calculator", "kcalc", "galculator", "mate-calc"),
+    "open_clock":      ("gnome-clocks",),
+    "open_notes":      ("gnome-text-editor", "gedit", "kate", "mousepad"),
+    "open_calendar":   ("gnome-calendar", "korganizer"),
+    "open_mail":       ("thunderbird", "evolution", "geary"),
+    "open_maps":       ("gnome-maps",),
+    "open_photos":     ("shotwell", "eog", "gwenview"),
+    "open_music":      ("rhythmbox", "elisa", "lollypop"),
+    "open_safari":     ("firefox", "chromium", "google-chrome"),
+}
+
+class _PulseVolume:
+    """Volume / mute through one open pulsectl connection (no process per call)."""
+    def __init__(self):
+        self._pulse = pulsectl.Pulse("gesture-ctrl")
+        self._lock = threading.Lock()     # pulsectl connections are not thread-safe
+
+    def _sink(self):
+        return self._pulse.get_sink_by_name(self._pulse.server_info().default_sink_name)
+
+    def get(self) -> int | None:
+        with self._lock:
+            return int(round(self._pulse.volume_get_all_chans(self._sink()) * 100))
+
+    def set(self, percent: int):
+        with self._lock:
+            self._pulse.volume_set_all_chans(self._sink(), percent / 100.0)
+
+    def step(self, delta: int, known: int | None = None) -> int:
+        # Re-read and set on the same connection: nothing else is in between
+        with self._lock:
+            sink = self._sink()
+            level = max(0, min(100, int(round(self._pulse.volume_get_all_chans(sink) * 100)) + delta))
+            self._pulse.volume_set_all_chans(sink, level / 100.0)
+            return level
+
+    def mute_toggle(self):
+        with self._lock:
+            sink = self._sink()
+            self._pulse.mute(sink, not sink.mute)
+
+    def close(self):
+        self._pulse.close()
+
+def _run(argv: list[str], timeout: float) -> tuple[int, str]:
+    """(returncode, stdout); the child is killed after `timeout` s (-1, "")."""
+    try:
+        done = subprocess.run(argv, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        print("[Linux] timed out:", argv[0])
+        return -1, ""
+    except OSError as e:
+        print("[Linux]", e)
+        return -1, ""
+    return done.returncode, done.stdout
+
+class _CliVolume:
+    """Volume / mute through wpctl (PipeWire) or pactl, one process per call."""
+    def __init__(self, tool: str, path: str, timeout: float):
+        self.tool, self.path, self.timeout = tool, path, timeout
+
+    def _run(self, *args) -> tuple[int, str]:
+        return _run([self.path, *args], action_timeout(self.timeout))
+
+    def get(self) -> int | None:
+        if self.tool == "wpctl":
+            rc, out = self._run("get-volume", "@DEFAULT_AUDIO_SINK@")   # "Volume: 0.55"
+            m = re.search(r"(\d+(?:\.\d+)?)", out)
+            return int(round(float(m.group(1)) * 100)) if rc == 0 and m else None
+        rc, out = self._run("get-sink-volume", "@DEFAULT_SINK@")           # "... / 55% / ..."
+        m = re.search(r"(\d+)%", out)
+        return int(m.group(1)) if rc == 0 and m else None
+
+    def set(self, percent: int):
+        if self.tool == "wpctl":
+            self._run("set-volume", "@DEFAULT_AUDIO_SINK@", f"{percent / 100:.2f}")
+        else:
+            self._run("set-sink-volume", "@DEFAULT_SINK@", f"{percent}%")
+
+    def step(self, delta: int, known: int | None) -> int | None:
+        """
+        One relative call, so the step applies to the live level; returns the
+        new level estimated from `known` (last level read or set; None: unknown).
+        """
+        if self.tool == "wpctl":
+            # Relative set, capped at 100% by wpctl itself
+            self._run("set-volume", "-l", "1.0", "@DEFAULT_AUDIO_SINK@", f"{abs(delta)}%{'+' if delta >= 0 else '-'}")
+        elif delta > 0 and (known is None or known + delta > 100):
+            # pactl's relative form can boost past 100%: near the top (or unknown), set the capped level
+            known = self.get() if known is None else known
+            if known is None:
+                return None
+            self.set(min(100, known + delta))
+        else:
+            self._run("set-sink-volume", "@DEFAULT_SINK@", f"{delta:+d}%")
+        return None if known is None else max(0, min(100, known + delta))
+
+    def mute_toggle(self):
+        if self.tool == "wpctl":
+            self._run("set-mute", "@DEFAULT_AUDIO_SINK@", "toggle")
+        else:
+            self._run("set-sink-mute", "@DEFAULT_SINK@", "toggle")
+
+    def close(self):
+        pass
+
+class LinuxActions(StubActions):
+    """
+    Volume, mute, URL / app launch, screensaver and display sleep on Linux.
+
+    Volume goes in-process through pulsectl (a Linux requirement), otherwise
+    through wpctl / pactl (subprocess, killed after the running action's
+    registry timeout, or `timeout` s for direct calls) with one
+    relative call per step; `volume` then follows the backend's own changes
+    and get_volume() re-reads the live level. Launchers
+    are started detached and reaped on later launches. Tools are looked up once;
+    `tools` maps a tool name ("pactl", "xdg-open", ...) to a command path,
+    e.g. stand-in scripts for testing (pulsectl is then not used).
+    Unsupported actions stay stubs.
+    """
+    def __init__(self, vol_step: int = 6, tools: dict | None = None, use_pulse: bool = True,
+                 timeout: float = 3.0):
+        self._vol_step = vol_step
+        self._tools = dict(tools or {})
+        self.timeout = timeout
+        self._children: list[subprocess.Popen] = []
+        self.volume = None
+        self._vol = None
+        if use_pulse and pulsectl is not None and not self._tools:
+            try:
+                self._vol = _PulseVolume()
+            except Exception as e:
+                print("[Linux] pulsectl unavailable, using CLI tools:", e)
+        if self._vol is None:
+            for tool in ("wpctl", "pactl"):
+                path = self._tool(tool)
+                if path:
+                    self._vol = _CliVolume(tool, path, timeout)
+                    break
+        if self._vol is not None:
+            self.volume = self._vol.get()     # starting level for steps and continuous control
+        self._apps = {m: next(filter(None, map(self._tool, names)), None) for m, names in APP_CANDIDATES.items()}
+
+    def _tool(self, name: str) -> str | None:
+        return self._tools.get(name) or shutil.which(name)
+
+    # Volume
+    def set_volume(self, percent):
+        percent = max(0, min(100, int(round(float(percent)))))
+        if self._vol is None:
+            print("[Volume] no wpctl / pactl / pulsectl")
+            return
+        self._vol.set(percent)
+        self.volume = percent
+
+    def get_volume(self) -> int | None:
+        if self._vol is not None:
+            self.volume = self._vol.get()
+        return self.volume
+
+    def volume_step(self, delta: int) -> int | None:
+        # Relative to the live level (keyboard keys / other apps may have changed it); returns the new level
+        if self._vol is None:
+            print("[Volume] no wpctl / pactl / pulsectl")
+            return None
+        self.volume = self._vol.step(delta, self.volume)
+        return self.volume
+
+    def volume_up(self):   self.volume_step(+self._vol_step)
+    def volume_down(self): self.volume_step(-self._vol_step)
+
+    def mute_toggle(self):
+        if self._vol is not None: self._vol.mute_toggle()
+        else: print("[Mute] no wpctl / pactl / pulsectl")
+
+    # Launch (detached)
+    def _spawn(self, tag: str, argv: list[str] | None):
+        if not argv or not argv[0]:
+            print(f"[{tag}] not available")
+            return
+        self._children = [p for p in self._children if p.poll() is None]   # reap finished launchers
+        try:
+            self._children.append(subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                                   stderr=subprocess.DEVNULL, start_new_session=True))
+        except OSError as e:
+            print(f"[{tag}] launch failed:", e)
+
+    def open_url(self, url: str):
+        self._spawn("Open URL", [self._tool("xdg-open"), url])
+
+    def _open_app(self, method: str):
+        self._spawn(method, [self._apps.get(method)])
+
+    def open_calculator(self): self._open_app("open_calculator")
+    def open_clock(self):      self._open_app("open_clock")
+    def open_notes(self):      self._open_app("open_notes")
+    def open_calendar(self):   self._open_app("open_calendar")
+    def open_mail(self):       self._open_app("open_mail")
+    def open_maps(self):       self._open_app("open_maps")
+    def open_photos(self):     self._open_app("open_photos")
+    def open_music(self):      self._open_app("open_music")
+    def open_safari(self):     self._open_app("open_safari")
+
+    # Display
+    def start_screensaver(self):
+        self._spawn("Screensaver", [self._tool("xdg-screensaver"), "activate"])
+
+    def display_sleep(self):
+        rc, _ = _run([self._tool("xset") or "xset", "dpms", "force", "off"], action_timeout(self.timeout))
+        if rc != 0: print("[DisplaySleep] failed (X11 xset needed)")
+
+    def close(self):
+        if self._vol is not None: self._vol.close()
+        self._children = [p for p in self._children if p.poll() is None]
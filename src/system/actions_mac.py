@@ -1,29 +1,132 @@
 import os
 import subprocess
+from .executor import action_timeout
+from .script_host import HostError, ScriptHost
+
+# JXA program kept alive by ScriptHost: compiles each AppleScript source once
+# (NSAppleScript, cached by source text) and answers the JSON-lines protocol.
+_OSA_HOST_JS = r"""
+ObjC.import('Foundation');
+const stdin = $.NSFileHandle.fileHandleWithStandardInput;
+const stdout = $.NSFileHandle.fileHandleWithStandardOutput;
+const cache = {};
+function send(obj) {
+  const s = $.NSString.alloc.initWithUTF8String(JSON.stringify(obj) + "\n");
+  stdout.writeData(s.dataUsingEncoding($.NSUTF8StringEncoding));
+}
+function runScript(src) {
+  try {
+    let script = cache[src];
+    if (!script) script = cache[src] = $.NSAppleScript.alloc.initWithSource(src);
+    const err = Ref();
+    const desc = script.executeAndReturnError(err);
+    if (desc.isNil()) return {ok: false, error: JSON.stringify(ObjC.deepUnwrap(err[0]))};
+    return {ok: true, out: ObjC.unwrap(desc.stringValue) || ""};
+  } catch (e) {
+    return {ok: false, error: String(e)};
+  }
+}
+function run() {
+  send({ready: true});
+  let buf = "";
+  while (true) {
+    const data = stdin.availableData;
+    if (data.length == 0) break;
+    buf += ObjC.unwrap($.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding));
+    let i;
+    while ((i = buf.indexOf("\n")) >= 0) {
+      const line = buf.slice(0, i);
+      buf = buf.slice(i + 1);
+      if (!line) continue;
+      const req = JSON.parse(line);
+      send({id: req.id, results: req.scripts.map(runScript)});
+    }
+  }
+}
+"""
+OSA_HOST_ARGV = ["osascript", "-l", "JavaScript", "-e", _OSA_HOST_JS]
 
 class MacActions:
-    def __init__(self, vol_step=6.25):
+    """
+    use_host=True runs AppleScript through one persistent osascript process
+    (ScriptHost); if it cannot be started or keeps failing, scripts fall back
+    to one `osascript -e` process per call. A request that reached the host
+    and then failed is not re-run. Every child process or host reply is
+    bounded by the running action's registry timeout (action_timeout());
+    `timeout` / `slow_timeout` (network toggles) apply to direct calls.
+    """
+    def __init__(self, vol_step=6.25, use_host: bool = True, host_argv=None,
+                 timeout: float = 5.0, slow_timeout: float = 10.0):
         self._vol_step = vol_step  # each ≈ 6.25%
+        self.volume = None         # last known output volume (0-100), updated by every volume action
+        self.timeout, self.slow_timeout = timeout, slow_timeout
+        self._host = ScriptHost(host_argv or OSA_HOST_ARGV) if use_host else None
 
-    @staticmethod
-    def _osascript(script: str) -> bool:
+    def _osascript_once(self, script: str) -> tuple[bool, str]:
         try:
-            subprocess.run(["osascript", "-e", script], check=True,
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            return True
+            p = subprocess.run(["osascript", "-e", script], check=True, capture_output=True, text=True,
+                               timeout=action_timeout(self.timeout))
+            return True, p.stdout.strip()
         except Exception as e:
             print("[AppleScript ERROR]", e)
-            return False
+            return False, ""
+
+    def _run(self, scripts: list[str]) -> list[tuple[bool, str]]:
+        if self._host is not None and not self._host.failed:
+            try:
+                results = self._host.run_batch(scripts, action_timeout(self._host.timeout))
+            except HostError as e:
+                if e.sent:
+                    # The scripts may already have run (e.g. a toggle): don't run them twice
+                    print("[AppleScript host] request failed:", e)
+                    return [(False, "")] * len(scripts)
+                print("[AppleScript host] falling back to one-shot:", e)
+            else:
+                for ok, err in results:
+                    if not ok: print("[AppleScript ERROR]", err)
+                return [(ok, out if ok else "") for ok, out in results]
+        return [self._osascript_once(s) for s in scripts]
+
+    def run_scripts(self, scripts: list[str]) -> list[bool]:
+        """Run several AppleScripts, in one host round trip when the host is up."""
+        return [ok for ok, _ in self._run(scripts)]
+
+    def _osascript(self, script: str) -> bool:
+        return self._run([script])[0][0]
+
+    def _track_volume(self, result: tuple[bool, str]):
+        ok, out = result
+        try:
+            if ok: self.volume = int(float(out))
+        except ValueError:
+            pass
+
+    def close(self):
+        if self._host is not None:
+            self._host.close()
 
     # Volume
-    def volume_step(self, delta_percent: float):
+    def volume_step(self, delta_percent: float) -> int | None:
+        # Relative to the live level; returns the new level (None if it could not be read)
         script = f'''
         set ovol to output volume of (get volume settings)
         set nvol to ovol + ({delta_percent})
         if nvol > 100 then set nvol to 100
         if nvol < 0 then set nvol to 0
-        set volume output volume nvol'''
-        self._osascript(script)
+        set volume output volume nvol
+        return nvol'''
+        self._track_volume(self._run([script])[0])
+        return self.volume
+
+    def set_volume(self, percent):
+        """Absolute output volume (continuous control sends targets, not steps)."""
+        percent = max(0, min(100, int(round(float(percent)))))
+        if self._osascript(f"set volume output volume {percent}"):
+            self.volume = percent
+
+    def get_volume(self) -> int | None:
+        self._track_volume(self._run(["output volume of (get volume settings)"])[0])
+        return self.volume
 
     def volume_up(self):   self.volume_step(+self._vol_step)
     def volume_down(self): self.volume_step(-self._vol_step)
@@ -41,12 +144,12 @@ class MacActions:
     # Open App / system functions
     def _open_app(self, name: str, alt_paths=()):
         try:
-            subprocess.run(["open", "-a", name], check=True)
+            subprocess.run(["open", "-a", name], check=True, timeout=action_timeout(self.timeout))
             return True
         except subprocess.CalledProcessError:
             for p in alt_paths:
                 if os.path.exists(p):
-                    subprocess.run(["open", p], check=True)
+                    subprocess.run(["open", p], check=True, timeout=action_timeout(self.timeout))
                     return True
         except Exception as e:
             print(f"[Open App] {name} failed:", e)
@@ -63,32 +166,34 @@ class MacActions:
     def open_photos(self):     self._open_app("Photos", ["/System/Applications/Photos.app"])
     def open_music(self):      self._open_app("Music", ["/System/Applications/Music.app"])
     def open_launchpad(self):
-        try: subprocess.run(["open", "-a", "Launchpad"], check=True)
+        try: subprocess.run(["open", "-a", "Launchpad"], check=True, timeout=action_timeout(self.timeout))
         except Exception as e: print("[Launchpad] open failed:", e)
 
     def start_screensaver(self):
-        try: subprocess.run(["open", "-a", "ScreenSaverEngine"], check=True)
+        try: subprocess.run(["open", "-a", "ScreenSaverEngine"], check=True, timeout=action_timeout(self.timeout))
         except Exception as e: print("[Screensaver] start failed:", e)
 
     def display_sleep(self):
-        try: subprocess.run(["pmset", "displaysleepnow"], check=True)
+        try: subprocess.run(["pmset", "displaysleepnow"], check=True, timeout=action_timeout(self.timeout))
         except Exception as e: print("[DisplaySleep] failed:", e)
 
     def wifi_on(self, service="Wi-Fi"):
-        try: subprocess.run(["networksetup", "-setairportpower", service, "on"], check=True)
+        try: subprocess.run(["networksetup", "-setairportpower", service, "on"], check=True,
+                           timeout=action_timeout(self.slow_timeout))
         except Exception as e: print("[Wi-Fi ON] failed:", e)
 
     def wifi_off(self, service="Wi-Fi"):
-        try: subprocess.run(["networksetup", "-setairportpower", service, "off"], check=True)
+        try: subprocess.run(["networksetup", "-setairportpower", service, "off"], check=True,
+                           timeout=action_timeout(self.slow_timeout))
         except Exception as e: print("[Wi-Fi OFF] failed:", e)
 
     # Need `brew install blueutil`
     def bt_on(self):
-        try: subprocess.run(["blueutil", "--power", "1"], check=True)
+        try: subprocess.run(["blueutil", "--power", "1"], check=True, timeout=action_timeout(self.timeout))
         except Exception as e: print("[Bluetooth ON] failed (need blueutil?):", e)
 
     def bt_off(self):
-        try: subprocess.run(["blueutil", "--power", "0"], check=True)
+        try: subprocess.run(["blueutil", "--power", "0"], check=True, timeout=action_timeout(self.timeout))
         except Exception as e: print("[Bluetooth OFF] failed (need blueutil?):", e)
 
     def darkmode_toggle(self):
@@ -101,5 +206,5 @@ class MacActions:
         self._osascript(script)
 
     def open_url(self, url: str):
-        try: subprocess.run(["open", url], check=True)
+        try: subprocess.run(["open", url], check=True, timeout=action_timeout(self.timeout))
         except Exception as e: print("[Open URL] failed:", e)
@@ -0,0 +1,60 @@
+"""
+Action backends (one object implementing the SystemController methods per
+platform), picked once at startup instead of per call.
+
+    register_backend("kiosk", KioskActions, probe=lambda: os.path.exists("/etc/kiosk"))
+"""
+import platform
+
+# Methods every backend answers (missing ones fall back to StubActions)
+ACTION_METHODS = (
+    "volume_up", "volume_down", "mute_toggle", "set_volume",
+    "open_calculator", "open_clock", "open_notes", "open_calendar", "open_reminders",
+    "open_safari", "open_mail", "open_maps", "open_photos", "open_music", "open_launchpad",
+    "start_screensaver", "display_sleep", "wifi_on", "wifi_off", "bt_on", "bt_off",
+    "darkmode_toggle", "open_url",
+)
+
+class StubActions:
+    """Prints what would happen. Base class of partial backends: unimplemented actions stay stubs."""
+    volume = 50     # nominal, so continuous control has somewhere to start
+
+    def __getattr__(self, name):
+        if name in ACTION_METHODS:
+            return lambda *args: print(f"[{name}] stub", *args)
+        raise AttributeError(name)
+
+    def close(self):
+        pass
+
+def _os() -> str:
+    return platform.system().lower()
+
+def _mac():
+    from .actions_mac import MacActions
+    return MacActions()
+
+def _linux():
+    from .actions_linux import LinuxActions
+    return LinuxActions()
+
+# name -> (factory, probe); probed in insertion order, "stub" always matches
+BACKENDS: dict = {}
+
+def register_backend(name: str, factory, probe=lambda: False):
+    BACKENDS[name] = (factory, probe)
+
+register_backend("mac", _mac, lambda: "darwin" in _os() or "mac" in _os())
+register_backend("linux", _linux, lambda: "linux" in _os())
+register_backend("stub", StubActions, lambda: True)
+
+def select_backend(name: str | None = None):
+    """(name, backend instance): `name` if given, else the first backend whose probe matches."""
+    if name is not None:
+        if name not in BACKENDS:
+            raise ValueError(f"unknown backend: {name} (have {', '.join(BACKENDS)})")
+        return name, BACKENDS[name][0]()
+    for key, (factory, probe) in BACKENDS.items():
+        if probe():
+            return key, factory()
+    return "stub", StubActions()
@@ -0,0 +1,138 @@
+import threading
+import time
+from collections import deque
+
+from ..perf.stages import RollingHistogram
+
+_local = threading.local()
+
+def action_timeout(default: float) -> float:
+    """Time limit of the action running on this thread (set by ActionExecutor), else `default`."""
+    t = getattr(_local, "timeout", None)
+    return default if t is None else t
+
+class ActionExecutor:
+    """
+    Runs fired commands off the frame loop, on `workers` background threads.
+
+    submit() never blocks: the queue holds at most `max_pending` commands,
+    and a command that is already queued or running is coalesced (a held
+    gesture cannot stack up repeats behind a slow `osascript`). Commands
+    submitted with a `key` coalesce "latest wins" instead: a queued command
+    with the same key is replaced (absolute targets such as VOL_SET:<n>).
+    Actions run on the worker itself and their key stays busy until they
+    return. `timeout_for(cmd)` (the registry's Action.timeout) is handed to
+    the backend through action_timeout(): every child process or host call
+    the action makes is killed after it, so a hung `osascript` cannot outlive
+    its job. A run that still took longer is counted in `timeouts`.
+
+    perform(cmd) -> result runs the action; on_done(cmd, ok, result, trace,
+    start_t) is called on the worker thread afterwards (the Qt engine turns
+    it into a signal). stats() gives queue depth, drops and wait / run latency.
+    """
+    def __init__(self, perform, on_done=None, max_pending: int = 4, workers: int = 1,
+                 timeout_for=None, default_timeout: float = 5.0, window: int = 100):
+        self.perform = perform
+        self.on_done = on_done
+        self.max_pending = max_pending
+        self.timeout_for = timeout_for or (lambda cmd: default_timeout)
+        self._cond = threading.Condition()
+        self._q: deque = deque()            # [key, cmd, trace, submit_t]
+        self._queued: dict = {}             # key -> queue entry
+        self._running: set = set()
+        self._stop = False
+        self.wait_ms = RollingHistogram(window)
+        self.run_ms = RollingHistogram(window)
+        self.submitted = self.completed = self.failed = self.timeouts = 0
+        self.coalesced = self.dropped = self.max_depth = 0
+        self._threads = [threading.Thread(target=self._loop, daemon=True, name=f"action-{i}")
+                         for i in range(workers)]
+        for t in self._threads:
+            t.start()
+
+    def submit(self, cmd: str, trace=None, key=None) -> bool:
+        """Queue `cmd`; False if it was dropped as a duplicate or because the queue is full."""
+        with self._cond:
+            if key is not None and key in self._queued:
+                entry = self._queued[key]
+                entry[1], entry[2] = cmd, trace     # latest wins, keeps its place in the queue
+                self.coalesced += 1
+                return True
+            if key is None and (cmd in self._queued or cmd in self._running):
+                self.coalesced += 1
+                return False
+            if len(self._q) >= self.max_pending:
+                self.dropped += 1
+                return False
+            entry = [cmd if key is None else key, cmd, trace, time.perf_counter()]
+            self._q.append(entry)
+            self._queued[entry[0]] = entry
+            self.submitted += 1
+            self.max_depth = max(self.max_depth, len(self._q))
+            self._cond.notify()
+        return True
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._q and not self._stop:
+                    self._cond.wait()
+                if self._stop:
+                    return
+                key, cmd, trace, submit_t = self._q.popleft()
+                del self._queued[key]
+                self._running.add(key)
+            start_t = time.perf_counter()
+            self.wait_ms.add((start_t - submit_t) * 1000.0)
+            ok, result = self._run(cmd)
+            run_s = time.perf_counter() - start_t
+            self.run_ms.add(run_s * 1000.0)
+            with self._cond:
+                self._running.discard(key)
+                if ok: self.completed += 1
+                else: self.failed += 1
+                if run_s > self.timeout_for(cmd): self.timeouts += 1
+            if self.on_done:
+                try:
+                    self.on_done(cmd, ok, result, trace, start_t)
+                except Exception as e:
+                    print("[action] on_done failed:", e)
+
+    def _run(self, cmd: str):
+        """(ok, result) of perform(cmd), with its time limit visible to the backend."""
+        _local.timeout = self.timeout_for(cmd)
+        try:
+            return True, self.perform(cmd)
+        except Exception as e:
+            print("[perform ERROR]", e)
+            return False, None
+        finally:
+            _local.timeout = None
+
+    def busy(self, key) -> bool:
+        """True while `key` (a command, or a submit() key) is queued or running."""
+        with self._cond:
+            return key in self._queued or key in self._running
+
+    def depth(self) -> int:
+        with self._cond:
+            return len(self._q)
+
+    def stats(self) -> dict:
+        with self._cond:
+            counts = {"depth": len(self._q), "max_depth": self.max_depth, "submitted": self.submitted,
+                      "completed": self.completed, "failed": self.failed, "timeouts": self.timeouts,
+                      "coalesced": self.coalesced, "dropped": self.dropped}
+        w, r = self.wait_ms.summary(), self.run_ms.summary()
+        return {**counts, "wait_ms_p50": round(w["p50"], 2), "wait_ms_p95": round(w["p95"], 2),
+                "run_ms_p50": round(r["p50"], 2), "run_ms_p95": round(r["p95"], 2), "run_ms_max": round(r["max"], 2)}
+
+    def stop(self, timeout: float = 1.0):
+        """Stop the workers; queued commands are discarded, a running one is not waited for past `timeout`."""
+        with self._cond:
+            self._stop = True
+            self._q.clear()
+            self._queued.clear()
+            self._cond.notify_all()
+        for t in self._threads:
+            t.join(timeout)
@@ -0,0 +1,135 @@
+"""
+Declarative action registry: command id -> callable + HUD text + metadata.
+
+Both front-ends dispatch through an ActionDispatcher, which resolves every
+registered action against the SystemController once at startup, so a fired
+command costs one dict lookup however many actions exist. Commands may carry
+an argument after a colon ("OPEN_URL:YouTube"); the part before it is the id.
+
+New actions are plugins:
+
+    register("SAY_HI", "Hi", "👋", run=lambda d, arg: print("hi"))
+"""
+
+class Action:
+    """
+      id:         command id used in bindings
+      label/icon: HUD flash text ("<icon> <label>")
+      method:     SystemController method name (built-ins), or
+      run:        run(dispatcher, arg) for plugins; may return (message, duration)
+      repeatable: safe to fire again while the gesture is held (e.g. volume steps);
+                  only these are driven by continuous control while held
+      timeout:    seconds the action may take before it counts as hung
+      param:      takes an argument ("ID:<arg>"); hidden from the plain action list
+    """
+    __slots__ = ("id", "label", "icon", "method", "run", "repeatable", "timeout", "param")
+
+    def __init__(self, id, label, icon="", method=None, run=None,
+                 repeatable=False, timeout=5.0, param=False):
+        self.id, self.label, self.icon = id, label, icon
+        self.method, self.run = method, run
+        self.repeatable, self.timeout, self.param = repeatable, timeout, param
+
+    @property
+    def message(self) -> str:
+        return f"{self.icon} {self.label}".strip()
+
+ACTIONS: dict[str, Action] = {}
+
+def register(id, label, icon="", method=None, run=None, **meta) -> Action:
+    """Add (or replace) an action; either `method` or `run` must be given."""
+    if (method is None) == (run is None):
+        raise ValueError(f"action {id}: give exactly one of method / run")
+    action = ACTIONS[id] = Action(id, label, icon, method, run, **meta)
+    return action
+
+def action_choices() -> list[str]:
+    """Plain command ids for binding pickers (parametrized ones are added by the UI)."""
+    return [a.id for a in ACTIONS.values() if not a.param]
+
+def _open_url(d, name: str):
+    name = name.strip()
+    if not name:
+        d.sys.open_url(d.url_default)
+        return None
+    url = d.urls.get_url(name) if d.urls else None
+    if not url:
+        return f"⚠️ URL preset not found: {name}", 1.2
+    d.sys.open_url(url)
+    return f"🌐 Open URL: {name}", 0.7
+
+def _set_volume(d, arg: str):
+    percent = int(arg)
+    d.sys.set_volume(percent)
+    return f"🔊 Volume {percent}", 0.7
+
+# Built-ins (order = order in the GUI)
+for _id, _label, _icon, _method, _meta in [
+    ("VOL_UP",            "Volume +",      "🔊", "volume_up",         {"repeatable": True, "timeout": 2.0}),
+    ("VOL_DOWN",          "Volume −",      "🔉", "volume_down",       {"repeatable": True, "timeout": 2.0}),
+    ("MUTE_TOGGLE",       "Mute",          "🔇", "mute_toggle",       {"timeout": 2.0}),
+    ("OPEN_CALCULATOR",   "Calculator",    "🧮", "open_calculator",   {}),
+    ("OPEN_CLOCK",        "Clock",         "⏰", "open_clock",        {}),
+    ("OPEN_NOTES",        "Notes",         "📝", "open_notes",        {}),
+    ("OPEN_CALENDAR",     "Calendar",      "📅", "open_calendar",     {}),
+    ("OPEN_REMINDERS",    "Reminders",     "✅", "open_reminders",    {}),
+    ("OPEN_SAFARI",       "Safari",        "🧭", "open_safari",       {}),
+    ("OPEN_MAIL",         "Mail",          "✉️", "open_mail",         {}),
+    ("OPEN_MAPS",         "Maps",          "🗺", "open_maps",         {}),
+    ("OPEN_PHOTOS",       "Photos",        "🖼", "open_photos",       {}),
+    ("OPEN_MUSIC",        "Music",         "🎵", "open_music",        {}),
+    ("OPEN_LAUNCHPAD",    "Launchpad",     "🟦", "open_launchpad",    {}),
+    ("START_SCREENSAVER", "Screensaver",   "🛡", "start_screensaver", {}),
+    ("DISPLAY_SLEEP",     "Display sleep", "🌙", "display_sleep",     {}),
+    ("WIFI_ON",           "Wi-Fi ON",      "📶", "wifi_on",           {"timeout": 10.0}),
+    ("WIFI_OFF",          "Wi-Fi OFF",     "📶", "wifi_off",          {"timeout": 10.0}),
+    ("BT_ON",             "Bluetooth ON",  "🅱️", "bt_on",             {}),
+    ("BT_OFF",            "Bluetooth OFF", "🅱️", "bt_off",            {}),
+    ("DARKMODE_TOGGLE",   "Dark Mode",     "🌗", "darkmode_toggle",   {}),
+]:
+    register(_id, _label, _icon, method=_method, **_meta)
+register("OPEN_URL", "Open URL", "🌐", run=_open_url, param=True)
+# Continuous control target (VOL_SET:<0-100>), sent by the volume ramp
+register("VOL_SET", "Volume", "🔊", run=_set_volume, param=True, repeatable=True, timeout=2.0)
+
+class ActionDispatcher:
+    """
+    Registry resolved against one SystemController. perform(cmd) runs the
+    action and returns the HUD flash (message, duration).
+    urls: UrlStore (or anything with get_url(name)) for OPEN_URL:<name>;
+    url_default: target of a bare OPEN_URL.
+    """
+    def __init__(self, controller, urls=None, url_default: str = "https://www.google.com", registry=None):
+        self.sys, self.urls, self.url_default = controller, urls, url_default
+        self._table = {}
+        for a in (registry or ACTIONS).values():
+            if a.run is not None:
+                fn = self._plugin(a.run)
+            else:
+                fn = self._method(controller.resolve(a.method), a.param)
+            self._table[a.id] = (a, fn)
+
+    def _plugin(self, run):
+        return lambda arg: run(self, arg)
+
+    @staticmethod
+    def _method(f, param: bool):
+        def call(arg):
+            f(arg) if param else f()    # backend return values are not HUD messages
+        return call
+
+    def action(self, cmd: str) -> Action | None:
+        entry = self._table.get(cmd.partition(":")[0])
+        return entry[0] if entry else None
+
+    def repeatable(self, cmd: str | None) -> bool:
+        action = self.action(cmd) if cmd else None
+        return bool(action and action.repeatable)
+
+    def perform(self, cmd: str) -> tuple[str, float]:
+        head, _, arg = cmd.partition(":")
+        entry = self._table.get(head)
+        if entry is None:
+            return f"(noop) {cmd}", 0.4
+        action, fn = entry
+        return fn(arg) or (action.message, 0.7)
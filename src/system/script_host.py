@@ -0,0 +1,132 @@
+import json
+import queue
+import subprocess
+import threading
+
+class HostError(RuntimeError):
+    """`sent` is True when the request reached the host (its scripts may have run)."""
+    def __init__(self, msg: str, sent: bool = False):
+        super().__init__(msg)
+        self.sent = sent
+
+class ScriptHost:
+    """
+    One long-lived interpreter process that runs scripts sent over its stdin,
+    instead of a process start per script.
+
+    Protocol (one JSON object per line, UTF-8):
+      host -> us, once at start:   {"ready": true}
+      us -> host:                  {"id": 7, "scripts": ["...", "..."]}
+      host -> us:                  {"id": 7, "results": [{"ok": true, "out": "..."},
+                                                         {"ok": false, "error": "..."}]}
+    Several scripts in one request share a single round trip (run_batch).
+
+    A host that dies, hangs past `timeout` or talks garbage is killed and
+    restarted on the next call; after `max_restarts` consecutive failures the
+    host is given up (`.failed`), and callers fall back to one-shot mode.
+    """
+    def __init__(self, argv: list[str], timeout: float = 3.0, start_timeout: float = 5.0, max_restarts: int = 3):
+        self.argv = list(argv)
+        self.timeout = timeout
+        self.start_timeout = start_timeout
+        self.max_restarts = max_restarts
+        self._lock = threading.Lock()
+        self._proc = None
+        self._lines: queue.Queue = queue.Queue()
+        self._next_id = 0
+        self._failures = 0
+        self.starts = 0
+        self.round_trips = 0
+
+    @property
+    def failed(self) -> bool:
+        return self._failures > self.max_restarts
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def _start(self):
+        self._lines = queue.Queue()
+        self._proc = subprocess.Popen(self.argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                      stderr=subprocess.DEVNULL, text=True, encoding="utf-8", bufsize=1)
+        self.starts += 1
+        threading.Thread(target=self._pump, args=(self._proc, self._lines), daemon=True).start()
+        msg = self._read(self.start_timeout)
+        if not msg.get("ready"):
+            raise HostError(f"unexpected greeting: {msg}")
+
+    @staticmethod
+    def _pump(proc, lines):
+        # Reader thread: lets _read() time out instead of blocking on a hung host
+        for line in proc.stdout:
+            lines.put(line)
+        lines.put(None)
+
+    def _read(self, timeout: float) -> dict:
+        try:
+            line = self._lines.get(timeout=timeout)
+        except queue.Empty:
+            raise HostError(f"no reply within {timeout:.1f}s") from None
+        if line is None:
+            raise HostError("host exited")
+        try:
+            return json.loads(line)
+        except ValueError:
+            raise HostError(f"bad reply: {line[:80]!r}") from None
+
+    def _kill(self):
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.kill()
+            proc.wait(timeout=1.0)
+        except Exception:
+            pass
+
+    def run_batch(self, scripts: list[str], timeout: float | None = None) -> list[tuple[bool, str]]:
+        """Run `scripts` in one round trip (reply within `timeout`, default self.timeout); [(ok, output or error)] in order. Raises HostError."""
+        with self._lock:
+            if self.failed:
+                raise HostError("host disabled after repeated failures")
+            sent = False
+            try:
+                if not self.alive:
+                    self._start()
+                self._next_id += 1
+                self._proc.stdin.write(json.dumps({"id": self._next_id, "scripts": scripts}) + "\n")
+                self._proc.stdin.flush()
+                sent = True
+                while True:     # replies to earlier, timed-out requests are skipped
+                    msg = self._read(self.timeout if timeout is None else timeout)
+                    if msg.get("id") == self._next_id:
+                        break
+            except (HostError, OSError, ValueError) as e:
+                self._failures += 1
+                self._kill()
+                raise HostError(str(e), sent) from None
+            self._failures = 0
+            self.round_trips += 1
+        results = msg.get("results") or []
+        if len(results) != len(scripts):
+            raise HostError(f"expected {len(scripts)} results, got {len(results)}", sent=True)
+        return [(bool(r.get("ok")), r.get("out", "") if r.get("ok") else r.get("error", "")) for r in results]
+
+    def run(self, script: str, timeout: float | None = None) -> tuple[bool, str]:
+        return self.run_batch([script], timeout)[0]
+
+    def stats(self) -> dict:
+        return {"starts": self.starts, "round_trips": self.round_trips,
+                "alive": self.alive, "failed": self.failed}
+
+    def close(self):
+        with self._lock:
+            proc = self._proc
+            if proc is not None:
+                try:
+                    proc.stdin.close()      # EOF: the host exits on its own
+                    proc.wait(timeout=1.0)
+                except Exception:
+                    pass
+            self._kill()
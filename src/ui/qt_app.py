@@ -6,10 +6,24 @@ from PySide6 import QtCore, QtGui, QtWidgets
 import mediapipe as mp
 
 from ..paths import MODEL_PATH
-from ..logic.geometry import infer_pointing_direction
+from ..logic.choose import MIN_SCORE, choose_command
+from ..logic.handframe import HandFrame
+from ..logic.debounce import make_debouncer
+from ..logic.ramp import make_ramp
 from ..system.system_controller import SystemController
-from ..vision.draw import draw_hands, draw_hud
+from ..system.registry import ActionDispatcher
+from ..system.executor import ActionExecutor
+from ..vision.draw import HudLayer, draw_hands, draw_perf
+from ..vision.capture import make_reader
+from ..vision.sources import open_source
+from ..vision.inference import InferenceScheduler
+from ..vision.motion import make_gate
+from ..vision.roi import make_tracker
 from ..storage.db import UrlStore  # for default URL name and lookups
+from ..storage.journal import make_journal
+from ..replay.recording import make_recorder
+from ..perf.stages import StageTimer
+from ..perf.trace import Tracer
 
 # ===== MediaPipe aliases =====
 BaseOptions = mp.tasks.BaseOptions
@@ -18,11 +32,6 @@ GestureRecognizerOptions = mp.tasks.vision.GestureRecognizerOptions
 GestureRecognizerResult = mp.tasks.vision.GestureRecognizerResult
 VisionRunningMode = mp.tasks.vision.RunningMode
 
-# ===== Parameters =====
-MIN_SCORE = 0.60
-STABLE_FRAMES = 3
-COOLDOWN_SEC = 0.5
-
 # Available gestures (with geometric fallback for Pointing_Down)
 GESTURE_LABELS = [
     "Thumb_Up",
@@ -35,16 +44,9 @@ GESTURE_LABELS = [
     "ILoveYou",
 ]
 
-# Base actions (URL options are added in GUI as OPEN_URL:<Name>)
-ACTION_CHOICES = [
-    "VOL_UP", "VOL_DOWN", "MUTE_TOGGLE",
-    "OPEN_CALCULATOR", "OPEN_CLOCK", "OPEN_NOTES", "OPEN_CALENDAR",
-    "OPEN_REMINDERS", "OPEN_SAFARI", "OPEN_MAIL", "OPEN_MAPS",
-    "OPEN_PHOTOS", "OPEN_MUSIC", "OPEN_LAUNCHPAD",
-    "START_SCREENSAVER", "DISPLAY_SLEEP", "WIFI_ON", "WIFI_OFF",
-    "BT_ON", "BT_OFF", "DARKMODE_TOGGLE",
-    # do NOT include plain "OPEN_URL" here; GUI appends OPEN_URL:<Name>
-]
+# GestureEngine keyword arguments that may be persisted (UrlStore.set_engine_param / config.engine)
+ENGINE_OPTIONS = ("max_in_flight", "motion_gate", "roi", "fast_draw", "hud_fps_hz", "debounce",
+                  "max_pending_actions", "continuous", "backend", "perf_hud", "journal")
 
 # Default bindings (point ILoveYou to the seeded default URL name)
 DEFAULT_BINDINGS = {
@@ -61,51 +63,84 @@ DEFAULT_BINDINGS = {
 class GestureEngine(QtCore.QObject):
     """Encapsulates MediaPipe + bindings / debouncing / cooldown + system actions for GUI use."""
     hudChanged = QtCore.Signal(str, str)  # (label, hint)
-
-    def __init__(self, camera_index=0, bindings=None, url_store: UrlStore | None = None):
+    actionDone = QtCore.Signal(str, bool, str, float)  # (cmd, ok, message, duration); from the executor thread
+
+    def __init__(self, camera_index=0, bindings=None, url_store: UrlStore | None = None, source=None,
+                 render_rgb: bool = False, max_in_flight: int = 1, motion_gate=True,
+                 roi=False, perf_hud: bool = False, perf_dump: str | None = None,
+                 trace_log: str | None = None, fast_draw: bool = False, hud_fps_hz: float = 2.0,
+                 debounce: dict | None = None, max_pending_actions: int = 4,
+                 continuous=False, backend: str | None = None, thresholds: Dict[str, float] | None = None,
+                 journal=False, record: str | None = None):
         super().__init__()
         import os
         if not os.path.exists(MODEL_PATH):
             raise FileNotFoundError(f"Model not found: {MODEL_PATH}")
 
         self.camera_index = camera_index
-        self.bindings: Dict[str, str] = dict(bindings or DEFAULT_BINDINGS)
+        self.bindings: Dict[str, str] = dict(DEFAULT_BINDINGS if bindings is None else bindings)
+        self.thresholds: Dict[str, float] = dict(thresholds or {})   # per-gesture min score (default MIN_SCORE)
         self.active = False  # gesture control toggle (default off)
+        # Draw on the RGB buffer MediaPipe already needs, so step() hands out RGB (one conversion per frame)
+        self.render_rgb = render_rgb
+        self.fast_draw = fast_draw   # skeleton without anti-aliasing (quality/speed switch)
+        self.hud = HudLayer(fps_hz=hud_fps_hz)   # cached text sprites; FPS text refreshed at hud_fps_hz
 
-        self.sys = SystemController()
+        self.sys = SystemController(backend)   # platform backend picked once (mac / linux / stub)
         self.urls = url_store or UrlStore()   # named URLs (SQLite)
+        self.actions = ActionDispatcher(self.sys, urls=self.urls)   # registry resolved once
+        # Actions run off the Qt thread; results come back through actionDone (queued connection)
+        self.executor = ActionExecutor(self.actions.perform, on_done=self._action_done,
+                                       max_pending=max_pending_actions, timeout_for=self._action_timeout)
+        self.actionDone.connect(self._on_action_done)
 
-        self.last_result: GestureRecognizerResult | None = None
+        self.last_hands: HandFrame | None = None   # latest result, converted once in _on_result
         self.last_label: str | None = None
+
+        # Per-stage timings (API: self.perf.snapshot(); optional HUD overlay / JSON-lines dump)
+        self.perf = StageTimer(dump_path=perf_dump)
+        self.perf_hud = perf_hud
+        self._perf_snap, self._perf_snap_t = {}, 0.0
+        # Gesture -> action tracing (trace id = recognizer timestamp); see self.tracer.recent()
+        self.tracer = Tracer(log_path=trace_log)
+        self.last_ctx = None
         self.overlay_msg, self.overlay_until = None, 0.0
 
-        self.prev_cmd, self.same_count, self.none_count = None, 0, 0
-        self.armed, self.last_fire_ts = True, 0.0
-
-        base_options = BaseOptions(model_asset_path=MODEL_PATH)
-        options = GestureRecognizerOptions(
-            base_options=base_options,
-            running_mode=VisionRunningMode.LIVE_STREAM,
-            result_callback=self._on_result,
-            num_hands=2
-        )
-        self.recognizer = GestureRecognizer.create_from_options(options)
-
-        # Camera
-        self.cap = cv2.VideoCapture(self.camera_index)
-        if not self.cap.isOpened():
-            try:
-                self.cap.release()
-            except Exception:
-                pass
-            self.cap = cv2.VideoCapture(self.camera_index, cv2.CAP_AVFOUNDATION)
-
-        if not self.cap.isOpened():
-            self.recognizer.close()
-            raise RuntimeError("Cannot open camera")
+        # Hold / release / per-command cooldown over distinct results (GestureDebouncer kwargs)
+        self.debounce = make_debouncer(debounce)
+        # Continuous control: holding a fired volume gesture ramps the volume (True / False / VolumeRamp kwargs)
+        self.ramp = make_ramp(continuous)
+        # Gesture analytics: seen / near-miss / fire events, flushed in batches off-thread (True / path / kwargs)
+        self.journal = make_journal(journal)
+        # Optional: record every result (landmarks / labels / scores) for offline replay (.gcr path)
+        self.recorder = make_recorder(record)
 
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        # Threads / files started above (executor, store writer, journal, recorder) are stopped if this fails
+        try:
+            base_options = BaseOptions(model_asset_path=MODEL_PATH)
+            options = GestureRecognizerOptions(
+                base_options=base_options,
+                running_mode=VisionRunningMode.LIVE_STREAM,
+                result_callback=self._on_result,
+                num_hands=2
+            )
+            self.recognizer = GestureRecognizer.create_from_options(options)
+            # Skip frames instead of queueing them inside MediaPipe
+            self.infer = InferenceScheduler(self.recognizer, max_in_flight=max_in_flight)
+            # Drop to a low inference rate while the scene is static (True / False / MotionGate kwargs)
+            self.gate = make_gate(motion_gate)
+            # Optional: recognize on a crop around the tracked hands (True / False / RoiTracker kwargs)
+            self.roi = make_tracker(roi)
+
+            # Frame source (camera by default; video file / frames dir for replay)
+            self.source = open_source(source if source is not None else self.camera_index)
+
+            # Live capture runs on its own thread; step() only picks up the newest frame
+            self.reader = make_reader(self.source)
+        except Exception:
+            self.close()
+            raise
+        self._last_ts_ms = -1
 
         # FPS
         self.prev_t = time.perf_counter()
@@ -113,24 +148,32 @@ class GestureEngine(QtCore.QObject):
 
     # ---- Control interface ----
     def set_active(self, active: bool):
+        if active and not self.active:
+            self.debounce.reset()   # no hold time carried over from before the toggle
+            if self.ramp: self.ramp.reset()
         self.active = active
 
     def set_bindings(self, bindings: Dict[str, str]):
         self.bindings = dict(bindings)
 
+    def set_thresholds(self, thresholds: Dict[str, float]):
+        self.thresholds = dict(thresholds)
+
     # ---- MediaPipe callback ----
     def _on_result(self, result: GestureRecognizerResult, output_image: mp.Image, timestamp_ms: int):
-        self.last_result = result
-        label = None
-        if result and result.gestures:
-            for glist in result.gestures:
-                if not glist:
-                    continue
-                top = glist[0]
-                if top.score >= MIN_SCORE:
-                    label = f"{top.category_name} {top.score:.2f}"
-                    break
-        self.last_label = label
+        lat = self.infer.on_result(timestamp_ms)
+        if lat is not None:
+            self.perf.add("callback", lat)
+        hands = HandFrame.from_result(result, timestamp_ms)
+        if self.roi:
+            self.roi.map_frame(hands, timestamp_ms)
+        if self.recorder:
+            self.recorder.write(hands)
+        self.last_ctx = self.tracer.on_result(timestamp_ms)
+        self.last_hands = hands
+        self.last_label = hands.label(MIN_SCORE)
+        if self.journal:
+            self.journal.on_result(hands, self.bindings, self.thresholds, MIN_SCORE)
 
     # ---- HUD ----
     def _flash(self, msg, duration=0.7):
@@ -139,105 +182,98 @@ class GestureEngine(QtCore.QObject):
 
     # ---- Execute ----
     def _perform(self, cmd: str):
-        s = self.sys
-        if   cmd == "VOL_UP":               s.volume_up();            self._flash("🔊 Volume +")
-        elif cmd == "VOL_DOWN":             s.volume_down();          self._flash("🔉 Volume −")
-        elif cmd == "MUTE_TOGGLE":          s.mute_toggle();          self._flash("🔇 Mute")
-        elif cmd == "OPEN_CALCULATOR":      s.open_calculator();      self._flash("🧮 Calculator")
-        elif cmd == "OPEN_CLOCK":           s.open_clock();           self._flash("⏰ Clock")
-        elif cmd == "OPEN_NOTES":           s.open_notes();           self._flash("📝 Notes")
-        elif cmd == "OPEN_CALENDAR":        s.open_calendar();        self._flash("📅 Calendar")
-        elif cmd == "OPEN_REMINDERS":       s.open_reminders();       self._flash("✅ Reminders")
-        elif cmd == "OPEN_SAFARI":          s.open_safari();          self._flash("🧭 Safari")
-        elif cmd == "OPEN_MAIL":            s.open_mail();            self._flash("✉️ Mail")
-        elif cmd == "OPEN_MAPS":            s.open_maps();            self._flash("🗺 Maps")
-        elif cmd == "OPEN_PHOTOS":          s.open_photos();          self._flash("🖼 Photos")
-        elif cmd == "OPEN_MUSIC":           s.open_music();           self._flash("🎵 Music")
-        elif cmd == "OPEN_LAUNCHPAD":       s.open_launchpad();       self._flash("🟦 Launchpad")
-        elif cmd == "START_SCREENSAVER":    s.start_screensaver();    self._flash("🛡 Screensaver")
-        elif cmd == "DISPLAY_SLEEP":        s.display_sleep();        self._flash("🌙 Display sleep")
-        elif cmd == "WIFI_ON":              s.wifi_on();              self._flash("📶 Wi-Fi ON")
-        elif cmd == "WIFI_OFF":             s.wifi_off();             self._flash("📶 Wi-Fi OFF")
-        elif cmd == "BT_ON":                s.bt_on();                self._flash("🅱️ Bluetooth ON")
-        elif cmd == "BT_OFF":               s.bt_off();               self._flash("🅱️ Bluetooth OFF")
-        elif cmd == "DARKMODE_TOGGLE":      s.darkmode_toggle();      self._flash("🌗 Dark Mode")
-
-        elif cmd.startswith("OPEN_URL:"):
-            # Per-gesture named URL (e.g., OPEN_URL:YouTube)
-            name = cmd.split(":", 1)[1].strip()
-            url  = self.urls.get_url(name)
-            if url:
-                s.open_url(url)
-                self._flash(f"🌐 Open URL: {name}")
-            else:
-                self._flash(f"⚠️ URL preset not found: {name}", 1.2)
-
-        else:
-            self._flash(f"(noop) {cmd}", 0.4)
+        """Synchronous dispatch (scripting / tests); step() goes through the executor."""
+        self._flash(*self.actions.perform(cmd))
+
+    def _action_timeout(self, cmd: str) -> float:
+        action = self.actions.action(cmd)
+        return action.timeout if action else 5.0
+
+    def _action_done(self, cmd, ok, result, trace, start_t):
+        # Executor thread: record timings, hand the HUD update to the Qt thread
+        self.perf.lap("action", start_t)
+        self.tracer.performed(trace, start_t, ok)
+        msg, duration = result if ok and result else (f"⚠️ {cmd} failed", 1.2)
+        self.actionDone.emit(cmd, ok, msg, duration)
+
+    def _on_action_done(self, cmd: str, ok: bool, msg: str, duration: float):
+        self._flash(msg, duration)
 
     # ---- Choose command ----
-    def _choose_command(self, result: GestureRecognizerResult):
-        pd = infer_pointing_direction(result)
-        if pd == "Pointing_Down":
-            cmd = self.bindings.get("Pointing_Down")
-            if cmd:
-                return cmd
-
-        if not result or not result.gestures:
-            return None
-        best_cmd, best_score = None, 0.0
-        for glist in result.gestures:
-            if not glist:
-                continue
-            top = glist[0]
-            if top.score < MIN_SCORE:
-                continue
-            label = top.category_name
-            cmd = self.bindings.get(label)
-            if cmd and top.score > best_score:
-                best_cmd, best_score = cmd, top.score
-        return best_cmd
+    def _choose_command(self, hands: HandFrame | None):
+        return choose_command(hands, self.bindings, self.thresholds, MIN_SCORE)
 
     # ---- Step per frame ----
     def step(self):
-        ok, frame_bgr = self.cap.read()
-        if not ok:
+        """Returns (frame, fps); frame is RGB when render_rgb else BGR, or None if no new frame."""
+        t = time.perf_counter()
+        frame_bgr, cap_ts = self.reader.latest()
+        if frame_bgr is None:
             return None, 0.0
+        t = now = self.perf.lap("capture", t)
 
-        now = time.perf_counter()
         dt = now - self.prev_t
         self.prev_t = now
         if dt > 0:
             self.fps = 0.9 * self.fps + 0.1 * (1.0 / dt)
 
-        frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
-        ts_ms = int(time.perf_counter() * 1000)
-        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame_rgb)
-        self.recognizer.recognize_async(mp_image, ts_ms)
-
-        if self.active:
-            cmd = self._choose_command(self.last_result)
-            if cmd is None:
-                self.none_count += 1
-                if self.none_count >= STABLE_FRAMES:
-                    self.armed = True
-                self.prev_cmd, self.same_count = None, 0
-            else:
-                self.none_count = 0
-                self.same_count = self.same_count + 1 if cmd == self.prev_cmd else 1
-                self.prev_cmd = cmd
-                if self.armed and self.same_count >= STABLE_FRAMES and (time.time() - self.last_fire_ts) >= COOLDOWN_SEC:
-                    self._perform(cmd)
-                    self.last_fire_ts, self.armed = time.time(), False
-
-        if self.last_result:
-            draw_hands(frame_bgr, self.last_result)
+        frame_rgb = None
+        if self.render_rgb:     # one conversion shared by the recognizer and the preview
+            frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
+            t = self.perf.lap("convert", t)
+        hands = bool(self.last_hands and self.last_hands.n_hands)
+        if self.gate is None or self.gate.should_infer(frame_bgr, hands):
+            if frame_rgb is None:   # BGR preview: only frames handed to the recognizer need RGB
+                frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
+                t = self.perf.lap("convert", t)
+            # Timestamp = capture time (must be strictly increasing for LIVE_STREAM)
+            ts_ms = max(int(cap_ts * 1000), self._last_ts_ms + 1)
+            self._last_ts_ms = ts_ms
+            image = self.roi.crop(frame_rgb, self.last_hands, ts_ms) if self.roi else frame_rgb
+            self.tracer.on_submit(ts_ms, cap_ts if self.source.live else now)
+            if self.infer.submit(image, ts_ms, cap_ts if self.source.live else None) and self.roi:
+                self.roi.commit(ts_ms)
+        t = self.perf.lap("submit", t)
+
+        hands = self.last_hands
+        if self.active and hands is not None:
+            d = self.debounce
+            cmd = d.update(self._choose_command(hands), hands.ts_ms, hands.ts_ms)
+            if cmd is not None:
+                self.executor.submit(cmd, self.tracer.fire(cmd, self.last_ctx, d.first_seen_t))
+                if self.journal:
+                    self.journal.on_fire(cmd, hands, self.bindings)
+            if self.ramp:
+                # Start from the level the fired step leaves: wait until it has run
+                current = None if self.executor.busy(d.held_cmd) else self.sys.volume
+                held = d.held_cmd if self.actions.repeatable(d.held_cmd) else None
+                target = self.ramp.update(held, d.held_since_ms, hands.ts_ms, current)
+                if target is not None:
+                    self.executor.submit(f"VOL_SET:{target}", key="VOL_SET")
+            t = self.perf.lap("choose", t)
+
+        canvas = frame_rgb if self.render_rgb else frame_bgr
+        draw_hands(canvas, self.last_hands, rgb=self.render_rgb, aa=not self.fast_draw)
         hint = self.overlay_msg if time.time() <= self.overlay_until else None
-        draw_hud(frame_bgr, self.last_label, self.fps, hint)
+        self.hud.draw(canvas, self.last_label, self.fps, hint, rgb=self.render_rgb, now=now)
+        if self.perf_hud:
+            if now - self._perf_snap_t > 0.5:
+                self._perf_snap, self._perf_snap_t = self.perf.snapshot(), now
+            draw_perf(canvas, self._perf_snap, rgb=self.render_rgb)
+        self.perf.lap("draw", t)
+        self.perf.maybe_dump()
 
-        return frame_bgr, self.fps
+        return canvas, self.fps
 
     def close(self):
+        try:
+            self.reader.stop()
+        except Exception:
+            pass
+        try:
+            self.executor.stop()
+        except Exception:
+            pass
         try:
             self.recognizer.close()
         except Exception:
@@ -247,6 +283,18 @@ class GestureEngine(QtCore.QObject):
         except Exception:
             pass
         try:
-            self.cap.release()
+            if self.journal: self.journal.close()
+        except Exception:
+            pass
+        try:
+            if self.recorder: self.recorder.close()
+        except Exception:
+            pass
+        try:
+            self.sys.close()
+        except Exception:
+            pass
+        try:
+            self.source.release()
         except Exception:
             pass
@@ -0,0 +1,112 @@
+import threading
+import time
+
+class LatestFrameGrabber:
+    """
+    Reads frames from a FrameSource on a background thread into a single
+    "latest frame" slot.
+
+    Consumers always get the newest frame together with its capture timestamp
+    (the source's ts, seconds). A frame that is overwritten before anyone
+    took it is counted in `dropped`; nothing is ever queued.
+    """
+    def __init__(self, source, name: str = "capture"):
+        self.source = source
+        self._cond = threading.Condition()
+        self._frame = None
+        self._ts = 0.0
+        self._seq = 0        # bumped for every captured frame
+        self._taken = 0      # seq of the last frame handed to a consumer
+        self.captured = 0
+        self.dropped = 0
+        self._stop = threading.Event()
+        self._done = False   # producer exited (source exhausted)
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.is_set():
+            ok, frame, ts = self.source.read()
+            if not ok:
+                if self.source.eof:
+                    break
+                time.sleep(0.005)
+                continue
+            with self._cond:
+                if self._seq != self._taken:
+                    self.dropped += 1
+                self._frame, self._ts = frame, ts
+                self._seq += 1
+                self.captured += 1
+                self._cond.notify_all()
+        with self._cond:
+            self._done = True
+            self._cond.notify_all()
+
+    def latest(self, timeout: float = 0.0):
+        """
+        Take the newest frame not yet handed out.
+        Returns (frame, capture_ts) or (None, 0.0) if nothing new arrived within `timeout` seconds.
+        """
+        with self._cond:
+            if self._seq == self._taken and timeout > 0:
+                self._cond.wait_for(lambda: self._seq != self._taken or self.finished, timeout)
+            if self._seq == self._taken:
+                return None, 0.0
+            self._taken = self._seq
+            return self._frame, self._ts
+
+    @property
+    def finished(self) -> bool:
+        """True once the source is exhausted (or stopped) and the last frame was taken."""
+        return (self._done or self._stop.is_set()) and self._seq == self._taken
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {"captured": self.captured, "dropped": self.dropped}
+
+    def stop(self):
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+
+class DirectReader:
+    """
+    Same interface as LatestFrameGrabber, but reads synchronously and never
+    drops. Used for unpaced replay sources so every frame is processed and
+    throughput is measured, not the skip rate.
+    """
+    def __init__(self, source):
+        self.source = source
+        self.captured = 0
+        self.dropped = 0
+        self.finished = False
+
+    def start(self):
+        return self
+
+    def latest(self, timeout: float = 0.0):
+        if self.finished:
+            return None, 0.0
+        ok, frame, ts = self.source.read()
+        if not ok:
+            self.finished = self.source.eof
+            return None, 0.0
+        self.captured += 1
+        return frame, ts
+
+    def stats(self) -> dict:
+        return {"captured": self.captured, "dropped": self.dropped}
+
+    def stop(self):
+        pass
+
+def make_reader(source):
+    """Threaded latest-frame grabber for paced sources, direct reads for unpaced replay."""
+    reader = LatestFrameGrabber(source) if source.paced else DirectReader(source)
+    return reader.start()
@@ -1,29 +1,137 @@
 import time
+from collections import OrderedDict
 import cv2
+import numpy as np
 from mediapipe import solutions as mp_solutions
 from ..paths import C_LINE, C_PT
 
 HAND_CONNECTIONS = mp_solutions.hands.HAND_CONNECTIONS
+_EDGES = np.array(sorted(HAND_CONNECTIONS), dtype=np.intp)   # (E, 2) landmark index pairs
+PT_RADIUS = 3
 FONT = cv2.FONT_HERSHEY_SIMPLEX
 
-def draw_hands(frame_bgr, result):
-    if not result or not result.hand_landmarks:
+C_FPS  = (200, 255, 200)
+C_HINT = (0, 220, 255)
+
+def _c(color, rgb: bool):
+    """Colors are defined as BGR; flip them when drawing on an RGB buffer."""
+    return color[::-1] if rgb else color
+
+def draw_hands(frame_bgr, hands, rgb: bool = False, aa: bool = True):
+    """
+    hands: HandFrame. All hands are projected in one NumPy op and every
+    skeleton edge is drawn by a single cv2.polylines call.
+    aa=False trades anti-aliasing for speed: the joints then also go through
+    one polylines call (zero-length segments with round caps = filled dots).
+    With aa=True they stay cv2.circle calls, which rasterize faster than
+    anti-aliased thick segments.
+    """
+    if hands is None or not hands.n_hands:
         return
     h, w = frame_bgr.shape[:2]
-    for landmarks in result.hand_landmarks:
-        pts = [(int(lm.x * w), int(lm.y * h)) for lm in landmarks]
-        for a, b in HAND_CONNECTIONS:
-            if 0 <= a < len(pts) and 0 <= b < len(pts):
-                cv2.line(frame_bgr, pts[a], pts[b], C_LINE, 2, cv2.LINE_AA)
-        for (x, y) in pts:
-            cv2.circle(frame_bgr, (x, y), 3, C_PT, -1, cv2.LINE_AA)
-
-def draw_hud(frame_bgr, label: str | None, fps: float, hint: str | None = None):
+    pts = (hands.landmarks[:, :, :2] * (w, h)).astype(np.int32)          # (H, 21, 2)
+    c_pt = _c(C_PT, rgb)
+    if aa:
+        cv2.polylines(frame_bgr, pts[:, _EDGES].reshape(-1, 2, 2), False, _c(C_LINE, rgb), 2, cv2.LINE_AA)
+        for pt in map(tuple, pts.reshape(-1, 2).tolist()):
+            cv2.circle(frame_bgr, pt, PT_RADIUS, c_pt, -1, cv2.LINE_AA)
+    else:
+        cv2.polylines(frame_bgr, pts[:, _EDGES].reshape(-1, 2, 2), False, _c(C_LINE, rgb), 2, cv2.LINE_8)
+        dots = pts.reshape(-1, 1, 2).repeat(2, axis=1)
+        cv2.polylines(frame_bgr, dots, False, c_pt, 2 * PT_RADIUS, cv2.LINE_8)
+
+def draw_hud(frame_bgr, label: str | None, fps: float, hint: str | None = None, rgb: bool = False):
     if label:
         (tw, th), _ = cv2.getTextSize(label, FONT, 0.8, 2)
         pad = 8; x, y = 12, 40
         cv2.rectangle(frame_bgr, (x - pad, y - th - pad), (x + tw + pad, y + pad), (0, 0, 0), -1)
         cv2.putText(frame_bgr, label, (x, y), FONT, 0.8, (255, 255, 255), 2, cv2.LINE_AA)
-    cv2.putText(frame_bgr, f"{fps:.1f} FPS", (12, 70), FONT, 0.6, (200, 255, 200), 2, cv2.LINE_AA)
+    cv2.putText(frame_bgr, f"{fps:.1f} FPS", (12, 70), FONT, 0.6, _c(C_FPS, rgb), 2, cv2.LINE_AA)
     if hint:
-        cv2.putText(frame_bgr, hint, (12, 100), FONT, 0.7, (0, 220, 255), 2, cv2.LINE_AA)
+        cv2.putText(frame_bgr, hint, (12, 100), FONT, 0.7, _c(C_HINT, rgb), 2, cv2.LINE_AA)
+
+class HudLayer:
+    """
+    draw_hud() with each distinct text element rendered once into a small
+    sprite (color patch + alpha coverage) kept in a bounded LRU; per frame the
+    sprites are only blended onto the frame. The FPS text is re-rendered at
+    most `fps_hz` times per second (it would otherwise be a new sprite every frame).
+    """
+    def __init__(self, max_sprites: int = 64, fps_hz: float = 2.0):
+        self.max_sprites = max_sprites
+        self.fps_period = 1.0 / fps_hz if fps_hz > 0 else 0.0
+        self._sprites: OrderedDict = OrderedDict()
+        self._fps_text, self._fps_t = "", float("-inf")
+        self.hits = self.misses = 0
+
+    def _sprite(self, text: str, scale: float, color, thick: int, box_pad: int = 0):
+        key = (text, scale, color, thick, box_pad)
+        spr = self._sprites.get(key)
+        if spr is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return spr
+        self.misses += 1
+        (tw, th), base = cv2.getTextSize(text, FONT, scale, thick)
+        # Origin inside the patch; the margin keeps AA edges / the box padding
+        m = max(box_pad, thick + 1)
+        h, w = th + base + 2 * m + 1, tw + 2 * m + 1
+        alpha = np.zeros((h, w), np.uint8)
+        cv2.putText(alpha, text, (m, m + th), FONT, scale, 255, thick, cv2.LINE_AA)
+        color_img = np.empty((h, w, 3), np.uint8)
+        color_img[:] = color
+        if box_pad:
+            # Opaque black badge behind the text, same extent as draw_hud()'s rectangle
+            y1 = min(h, m + th + box_pad + 1)
+            box = np.s_[m - box_pad:y1, m - box_pad:m + tw + box_pad + 1]
+            color_img[box] = (color_img[box].astype(np.uint16) * alpha[box][..., None] // 255).astype(np.uint8)
+            alpha[box] = 255
+        # Premultiplied color + inverse alpha: blending is then two saturating cv2 ops
+        a3 = cv2.merge([alpha] * 3)
+        spr = (cv2.multiply(color_img, a3, scale=1 / 255), 255 - a3, m, m + th)
+        self._sprites[key] = spr
+        if len(self._sprites) > self.max_sprites:
+            self._sprites.popitem(last=False)
+        return spr
+
+    @staticmethod
+    def _blend(frame, spr, x: int, y: int):
+        """Alpha-blend a sprite whose text origin lands on (x, y); clipped to the frame."""
+        pre, inv, ox, oy = spr
+        x0, y0 = x - ox, y - oy
+        fx0, fy0 = max(0, x0), max(0, y0)
+        fx1, fy1 = min(frame.shape[1], x0 + pre.shape[1]), min(frame.shape[0], y0 + pre.shape[0])
+        if fx1 <= fx0 or fy1 <= fy0:
+            return
+        sl = np.s_[fy0 - y0:fy1 - y0, fx0 - x0:fx1 - x0]
+        roi = frame[fy0:fy1, fx0:fx1]
+        roi[:] = cv2.add(cv2.multiply(roi, inv[sl], scale=1 / 255), pre[sl])
+
+    def fps_text(self, fps: float, now: float | None = None) -> str:
+        now = time.perf_counter() if now is None else now
+        if now - self._fps_t >= self.fps_period:
+            self._fps_text, self._fps_t = f"{fps:.1f} FPS", now
+        return self._fps_text
+
+    def draw(self, frame_bgr, label: str | None, fps: float, hint: str | None = None,
+             rgb: bool = False, now: float | None = None):
+        """Same output as draw_hud()."""
+        if label:
+            self._blend(frame_bgr, self._sprite(label, 0.8, (255, 255, 255), 2, box_pad=8), 12, 40)
+        self._blend(frame_bgr, self._sprite(self.fps_text(fps, now), 0.6, _c(C_FPS, rgb), 2), 12, 70)
+        if hint:
+            self._blend(frame_bgr, self._sprite(hint, 0.7, _c(C_HINT, rgb), 2), 12, 100)
+
+    def stats(self) -> dict:
+        return {"sprites": len(self._sprites), "hits": self.hits, "misses": self.misses}
+
+C_PERF = (220, 220, 220)
+
+def draw_perf(frame_bgr, snapshot: dict, rgb: bool = False):
+    """Per-stage p50 / p95 in ms (StageTimer.snapshot()) in the top-right corner."""
+    x, y = frame_bgr.shape[1] - 210, 22
+    cv2.putText(frame_bgr, "stage      p50    p95", (x, y), FONT, 0.45, _c(C_PERF, rgb), 1, cv2.LINE_AA)
+    for stage, s in snapshot.items():
+        y += 18
+        cv2.putText(frame_bgr, f"{stage:<8} {s['p50']:6.1f} {s['p95']:6.1f}", (x, y),
+                    FONT, 0.45, _c(C_PERF, rgb), 1, cv2.LINE_AA)
@@ -0,0 +1,89 @@
+import threading
+import time
+from collections import deque
+
+import mediapipe as mp
+
+class InferenceScheduler:
+    """
+    Backpressure in front of recognizer.recognize_async().
+
+    At most `max_in_flight` frames are submitted without a matching result
+    callback; frames arriving while the cap is reached are skipped instead of
+    queueing inside MediaPipe. Unpaced replay passes `wait` so every frame is
+    recognized: submit() then blocks until a slot frees up. A submission that never gets a callback (the
+    graph may drop frames) is expired after `stale_after` seconds.
+
+    Latency is measured from `t_ref` (perf_counter seconds, e.g. the capture
+    time of a live frame; defaults to the submit time) to the callback.
+    """
+    def __init__(self, recognizer, max_in_flight: int = 1, stale_after: float = 1.0, window: int = 240):
+        self.recognizer = recognizer
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.stale_after = stale_after
+        self._lock = threading.Condition()
+        self._pending: dict[int, float] = {}   # ts_ms -> t_ref
+        self._lat_ms: deque[float] = deque(maxlen=window)
+        self.submitted = 0
+        self.completed = 0
+        self.skipped = 0
+        self.expired = 0
+
+    def _expire(self, now: float):
+        for ts, t_ref in list(self._pending.items()):
+            if now - t_ref > self.stale_after:
+                del self._pending[ts]
+                self.expired += 1
+
+    def submit(self, frame_rgb, ts_ms: int, t_ref: float | None = None, wait: bool = False) -> bool:
+        """Submit an RGB frame unless the in-flight cap is reached (wait=True: wait for a slot). True if submitted."""
+        now = time.perf_counter()
+        with self._lock:
+            if len(self._pending) >= self.max_in_flight:
+                self._expire(now)
+            while wait and len(self._pending) >= self.max_in_flight:
+                self._lock.wait(self.stale_after)
+                now = time.perf_counter()
+                self._expire(now)
+            if len(self._pending) >= self.max_in_flight:
+                self.skipped += 1
+                return False
+            self._pending[ts_ms] = now if t_ref is None else t_ref
+            self.submitted += 1
+        try:
+            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame_rgb)
+            self.recognizer.recognize_async(mp_image, ts_ms)
+        except Exception:
+            with self._lock:
+                self._pending.pop(ts_ms, None)
+                self.submitted -= 1
+            raise
+        return True
+
+    def on_result(self, ts_ms: int) -> float | None:
+        """Call from the result callback. Returns the latency in ms, or None for an unknown/expired ts."""
+        now = time.perf_counter()
+        with self._lock:
+            t_ref = self._pending.pop(ts_ms, None)
+            if t_ref is None:
+                return None
+            self._lock.notify()
+            self.completed += 1
+            lat = (now - t_ref) * 1000.0
+            self._lat_ms.append(lat)
+            return lat
+
+    def stats(self) -> dict:
+        with self._lock:
+            lat = sorted(self._lat_ms)
+            n = len(lat)
+            return {
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "skipped": self.skipped,
+                "expired": self.expired,
+                "in_flight": len(self._pending),
+                "latency_ms_p50": lat[n // 2] if n else 0.0,
+                "latency_ms_p95": lat[min(n - 1, int(n * 0.95))] if n else 0.0,
+                "latency_ms_max": lat[-1] if n else 0.0,
+            }
@@ -0,0 +1,69 @@
+import time
+import cv2
+
+class MotionGate:
+    """
+    Cheap pre-filter in front of the recognizer.
+
+    Each frame is shrunk to a `width`-pixel-wide grayscale thumbnail and diffed
+    against the previous one. While there is motion (or hands were seen in the
+    last result) every frame is let through; once the scene has been static
+    for `hold_sec`, inference drops to `idle_hz`. Motion re-enables full rate
+    on the very next frame.
+    """
+    def __init__(self, width: int = 80, diff_thresh: int = 12, motion_ratio: float = 0.01,
+                 idle_hz: float = 2.0, hold_sec: float = 1.0):
+        self.width = width
+        self.diff_thresh = diff_thresh      # per-pixel gray-level change counted as motion
+        self.motion_ratio = motion_ratio    # fraction of changed pixels that means "motion"
+        self.idle_hz = idle_hz
+        self.hold_sec = hold_sec
+        self._prev = None
+        self._last_active = 0.0
+        self._last_pass = 0.0
+        self.frames = 0
+        self.passed = 0
+        self.gated = 0
+        self.motion_frames = 0
+
+    def _has_motion(self, frame_bgr) -> bool:
+        h, w = frame_bgr.shape[:2]
+        small = cv2.resize(frame_bgr, (self.width, max(1, h * self.width // w)), interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        prev, self._prev = self._prev, gray
+        if prev is None or prev.shape != gray.shape:
+            return True
+        diff = cv2.absdiff(gray, prev)
+        changed = cv2.countNonZero(cv2.threshold(diff, self.diff_thresh, 255, cv2.THRESH_BINARY)[1])
+        return changed >= self.motion_ratio * gray.size
+
+    def should_infer(self, frame_bgr, hands_present: bool = False, now: float | None = None) -> bool:
+        now = time.perf_counter() if now is None else now
+        self.frames += 1
+        if self._has_motion(frame_bgr):
+            self.motion_frames += 1
+            self._last_active = now
+        elif hands_present:
+            self._last_active = now
+        idle = now - self._last_active > self.hold_sec
+        if idle and now - self._last_pass < 1.0 / self.idle_hz:
+            self.gated += 1
+            return False
+        self._last_pass = now
+        self.passed += 1
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "frames": self.frames,
+            "passed": self.passed,
+            "gated": self.gated,
+            "motion_frames": self.motion_frames,
+            "saved_ratio": self.gated / self.frames if self.frames else 0.0,
+        }
+
+def make_gate(cfg=True) -> MotionGate | None:
+    """cfg: True -> defaults, False/None -> disabled, dict -> MotionGate kwargs."""
+    if isinstance(cfg, dict):
+        return MotionGate(**cfg)
+    return MotionGate() if cfg else None
@@ -0,0 +1,129 @@
+import threading
+import cv2
+import numpy as np
+
+class RoiTracker:
+    """
+    Runs recognition on a padded crop around the hands of the previous result.
+
+    crop() returns the image to submit: a resized crop while hands are being
+    tracked, the full frame otherwise (first frame, or tracking lost because
+    the last HandFrame had no hands). The crop box stays put while the hands
+    move inside it, so the recognizer sees a stable view at a fixed scale;
+    it is re-fitted only when the hands come within `edge` (fraction of the
+    box side) of a border or shrink well inside it. map_frame() moves landmarks computed on
+    a crop back to full-frame normalized coordinates, in place, so everything
+    downstream (draw_hands, infer_pointing_direction, ...) is unchanged.
+
+    Call commit(ts_ms) once the image was actually submitted: only committed
+    frames are counted, and the box of a skipped frame is forgotten.
+    """
+    def __init__(self, pad: float = 0.35, min_size: int = 160, infer_size: int = 320, keep: int = 16,
+                 edge: float = 0.1):
+        self.pad = pad                  # padding added on each side, as a fraction of the box size
+        self.min_size = min_size        # minimum crop side in pixels
+        self.infer_size = infer_size    # long side of the image handed to the recognizer
+        self.keep = keep                # pending ts -> roi entries kept for the callback
+        self.edge = edge                # re-fit when the hands get this close to a border (fraction of the side)
+        self._lock = threading.Lock()
+        self._rois: dict[int, tuple] = {}
+        self._cur = None                # current box (x0, y0, x1, y1) in pixels
+        self._last = None               # (ts_ms, cropped) of the last crop() not yet committed
+        self.roi_frames = 0
+        self.full_frames = 0
+        self.moves = 0
+
+    @staticmethod
+    def _extent(hands, w: int, h: int):
+        xy = hands.landmarks[:, :, :2].reshape(-1, 2)
+        (x0, y0), (x1, y1) = (xy.min(axis=0) * (w, h)).tolist(), (xy.max(axis=0) * (w, h)).tolist()
+        return x0, y0, x1, y1
+
+    def _fits(self, ext, w: int, h: int) -> bool:
+        """The current box still holds the hands clear of its borders (image borders don't count)."""
+        if self._cur is None:
+            return False
+        bx0, by0, bx1, by1 = self._cur
+        x0, y0, x1, y1 = ext
+        m = self.edge * max(bx1 - bx0, by1 - by0)
+        if ((x0 < bx0 + m and bx0 > 0) or (y0 < by0 + m and by0 > 0)
+                or (x1 > bx1 - m and bx1 < w) or (y1 > by1 - m and by1 < h)):
+            return False
+        # Hands much smaller than the box (moved away from the camera): tighten it
+        side = max(self.min_size, max(x1 - x0, y1 - y0) * (1.0 + 2.0 * self.pad))
+        return side > 0.6 * max(bx1 - bx0, by1 - by0)
+
+    def _box(self, ext, w: int, h: int):
+        x0, y0, x1, y1 = ext
+        side = max(x1 - x0, y1 - y0)
+        side = max(self.min_size, side * (1.0 + 2.0 * self.pad))
+        cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+        bx0 = int(max(0, min(w - 1, cx - side / 2)))
+        by0 = int(max(0, min(h - 1, cy - side / 2)))
+        bx1 = int(max(bx0 + 1, min(w, cx + side / 2)))
+        by1 = int(max(by0 + 1, min(h, cy + side / 2)))
+        return bx0, by0, bx1, by1
+
+    def crop(self, frame_rgb, hands, ts_ms: int):
+        """Returns the RGB image to submit for `ts_ms`; `hands` is the last HandFrame."""
+        h, w = frame_rgb.shape[:2]
+        if self._last is not None:      # previous frame was skipped: its callback never comes
+            with self._lock:
+                self._rois.pop(self._last[0], None)
+        self._last = (ts_ms, False)
+        if hands is None or not hands.n_hands:
+            self._cur = None
+            return frame_rgb
+        ext = self._extent(hands, w, h)
+        if not self._fits(ext, w, h):
+            self._cur = self._box(ext, w, h)
+            self.moves += 1
+        x0, y0, x1, y1 = self._cur
+        if (x1 - x0) * (y1 - y0) >= 0.8 * w * h:
+            return frame_rgb
+        img = frame_rgb[y0:y1, x0:x1]
+        scale = self.infer_size / max(x1 - x0, y1 - y0)
+        if scale < 1.0:
+            img = cv2.resize(img, (max(1, int((x1 - x0) * scale)), max(1, int((y1 - y0) * scale))),
+                             interpolation=cv2.INTER_AREA)
+        else:
+            img = np.ascontiguousarray(img)
+        with self._lock:
+            self._rois[ts_ms] = (x0 / w, y0 / h, (x1 - x0) / w, (y1 - y0) / h)
+            if len(self._rois) > self.keep:
+                for ts in sorted(self._rois)[:-self.keep]:
+                    del self._rois[ts]
+        self._last = (ts_ms, True)
+        return img
+
+    def commit(self, ts_ms: int):
+        """The image crop() returned for `ts_ms` was submitted; count it."""
+        if self._last is None or self._last[0] != ts_ms:
+            return
+        if self._last[1]:
+            self.roi_frames += 1
+        else:
+            self.full_frames += 1
+        self._last = None
+
+    def map_frame(self, hands, ts_ms: int):
+        """Map a HandFrame computed on a crop back to full-frame coordinates (no-op for full frames)."""
+        with self._lock:
+            roi = self._rois.pop(ts_ms, None)
+        if roi is None or not hands.n_hands:
+            return hands
+        ox, oy, sw, sh = roi
+        lm = hands.landmarks
+        lm *= (sw, sh, sw)      # z is scaled like x (relative to image width)
+        lm[..., 0] += ox
+        lm[..., 1] += oy
+        return hands
+
+    def stats(self) -> dict:
+        return {"roi_frames": self.roi_frames, "full_frames": self.full_frames, "moves": self.moves}
+
+def make_tracker(cfg=False) -> RoiTracker | None:
+    """cfg: True -> defaults, False/None -> disabled, dict -> RoiTracker kwargs."""
+    if isinstance(cfg, dict):
+        return RoiTracker(**cfg)
+    return RoiTracker() if cfg else None
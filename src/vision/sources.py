@@ -0,0 +1,152 @@
+import os
+import time
+import cv2
+
+IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".bmp")
+
+class FrameSource:
+    """
+    Where frames come from.
+
+    read() -> (ok, frame_bgr, ts) with ts in seconds. Live sources stamp
+    time.perf_counter(); replay sources stamp media time (index / fps), so a
+    replay always produces the same timestamps.
+    `paced` is True when read() itself runs at capture rate (camera, or replay
+    with realtime=True); unpaced sources deliver frames as fast as possible.
+    `live` is True when ts is a perf_counter time (usable for latency).
+    """
+    paced = True
+    live = False
+    eof = False
+
+    def open(self) -> "FrameSource":
+        return self
+
+    def read(self):
+        raise NotImplementedError
+
+    def release(self):
+        pass
+
+class CameraSource(FrameSource):
+    """Live camera via cv2.VideoCapture (falls back to AVFoundation on macOS)."""
+    live = True
+
+    def __init__(self, index: int = 0, width: int = 640, height: int = 480):
+        self.index, self.width, self.height = index, width, height
+        self.cap = None
+
+    def open(self):
+        self.cap = cv2.VideoCapture(self.index)
+        if not self.cap.isOpened():
+            try:
+                self.cap.release()
+            except Exception:
+                pass
+            self.cap = cv2.VideoCapture(self.index, cv2.CAP_AVFOUNDATION)
+        if not self.cap.isOpened():
+            raise RuntimeError("Cannot open camera")
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        return self
+
+    def read(self):
+        ok, frame = self.cap.read()
+        return ok, frame, time.perf_counter()
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+
+class _ReplaySource(FrameSource):
+    """Shared pacing for file-based sources: frame i has ts = i / fps."""
+    def __init__(self, fps: float = 30.0, realtime: bool = False):
+        self.fps = fps
+        self.paced = realtime
+        self.index = 0
+        self._t0 = None
+
+    def _next(self):
+        raise NotImplementedError
+
+    def read(self):
+        frame = None if self.eof else self._next()
+        if frame is None:
+            self.eof = True
+            return False, None, 0.0
+        ts = self.index / self.fps
+        self.index += 1
+        if self.paced:
+            if self._t0 is None:
+                self._t0 = time.perf_counter()
+            delay = self._t0 + ts - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        return True, frame, ts
+
+class VideoFileSource(_ReplaySource):
+    """Replay a video file; fps comes from the container unless given."""
+    def __init__(self, path: str, fps: float | None = None, realtime: bool = False):
+        super().__init__(fps or 30.0, realtime)
+        self.path = path
+        self._fps_override = fps
+        self.cap = None
+
+    def open(self):
+        self.cap = cv2.VideoCapture(self.path)
+        if not self.cap.isOpened():
+            raise RuntimeError(f"Cannot open video: {self.path}")
+        if not self._fps_override:
+            self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+        return self
+
+    def _next(self):
+        ok, frame = self.cap.read()
+        return frame if ok else None
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+
+class ImageDirSource(_ReplaySource):
+    """Replay a directory of frames in filename order."""
+    def __init__(self, path: str, fps: float = 30.0, realtime: bool = False):
+        super().__init__(fps, realtime)
+        self.path = path
+        self.files: list[str] = []
+
+    def open(self):
+        if not os.path.isdir(self.path):
+            raise RuntimeError(f"Not a directory: {self.path}")
+        self.files = sorted(
+            os.path.join(self.path, f) for f in os.listdir(self.path)
+            if f.lower().endswith(IMAGE_EXTS)
+        )
+        if not self.files:
+            raise RuntimeError(f"No frames found in: {self.path}")
+        return self
+
+    def _next(self):
+        while self.index < len(self.files):
+            frame = cv2.imread(self.files[self.index])
+            if frame is not None:
+                return frame
+            print("[ImageDirSource] skip unreadable:", self.files[self.index])
+            self.files.pop(self.index)
+        return None
+
+def make_source(spec=0, realtime: bool = False) -> FrameSource:
+    """
+    Build (without opening) a source from a spec:
+      int / digit string -> camera index, directory -> frames, anything else -> video file.
+    """
+    if isinstance(spec, FrameSource):
+        return spec
+    if isinstance(spec, int) or (isinstance(spec, str) and spec.isdigit()):
+        return CameraSource(int(spec))
+    if os.path.isdir(spec):
+        return ImageDirSource(spec, realtime=realtime)
+    return VideoFileSource(spec, realtime=realtime)
+
+def open_source(spec=0, realtime: bool = False) -> FrameSource:
+    return make_source(spec, realtime).open()
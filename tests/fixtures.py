@@ -0,0 +1,48 @@
+"""
+Synthetic GestureRecognizerResult-shaped fixtures (no model or camera needed),
+shared by the tests and the benchmarks.
+"""
+import numpy as np
+from mediapipe.tasks.python.components.containers.category import Category
+from mediapipe.tasks.python.components.containers.landmark import NormalizedLandmark
+from mediapipe.tasks.python.vision import GestureRecognizerResult
+
+from src.logic.handframe import HandFrame
+
+FRAME_W, FRAME_H = 640, 480
+
+def hand_landmarks(cx=0.5, cy=0.6, index_dir=(0.0, -1.0), seg=0.05):
+    """21 landmarks: wrist, thumb to the side, four fingers along `index_dir` (image coords)."""
+    dx, dy = index_dir
+    pts = [(cx, cy, 0.0)]
+    pts += [(cx - 0.04 * k, cy - 0.02 * k, 0.0) for k in range(1, 5)]          # thumb 1..4
+    for f in range(4):                                                        # index..pinky
+        bx, by = cx - 0.03 + 0.03 * f, cy - 0.08
+        pts += [(bx + dx * seg * k, by + dy * seg * k, 0.0) for k in range(4)]
+    return [NormalizedLandmark(x=x, y=y, z=z) for x, y, z in pts]
+
+def make_result(n_hands=1, label="Thumb_Up", score=0.9, index_dir=(0.0, -1.0), seed=None):
+    """Build a result with `n_hands` hands; extra hands get jittered positions and lower scores."""
+    rng = np.random.default_rng(seed)
+    gestures, handedness, lms = [], [], []
+    for i in range(n_hands):
+        s = max(0.0, score - 0.2 * i)
+        gestures.append([
+            Category(index=0, score=s, display_name="", category_name=label),
+            Category(index=1, score=1.0 - s, display_name="", category_name="None"),
+        ])
+        handedness.append([Category(index=i % 2, score=0.95, display_name="", category_name=("Right", "Left")[i % 2])])
+        cx, cy = 0.35 + 0.3 * i + rng.uniform(-0.02, 0.02), 0.6 + rng.uniform(-0.02, 0.02)
+        lms.append(hand_landmarks(cx, cy, index_dir))
+    return GestureRecognizerResult(gestures=gestures, handedness=handedness,
+                                   hand_landmarks=lms, hand_world_landmarks=[])
+
+def make_hands(*args, **kwargs) -> HandFrame:
+    """make_result(...) converted to the HandFrame the pipeline actually consumes."""
+    return HandFrame.from_result(make_result(*args, **kwargs))
+
+def empty_result():
+    return GestureRecognizerResult(gestures=[], handedness=[], hand_landmarks=[], hand_world_landmarks=[])
+
+def make_frame(w=FRAME_W, h=FRAME_H, seed=0):
+    return np.random.default_rng(seed).integers(0, 256, (h, w, 3), dtype=np.uint8)
@@ -0,0 +1,33 @@
+"""
+Stand-in Linux tools for the backend tests and benchmarks: shell scripts
+that act like pactl / xdg-open / xset without an audio server or desktop.
+"""
+import os
+import stat
+
+# pactl stand-in: keeps the volume in a file so get/set round-trip like the real thing
+# (relative "+N%" / "-N%" values are not capped at 100, as with the real pactl)
+FAKE_PACTL = """#!/bin/sh
+state="$(dirname "$0")/volume"
+cur="$(cat "$state" 2>/dev/null || echo 50)"
+case "$1" in
+  get-sink-volume) echo "Volume: front-left: 0 /  $cur% / 0 dB";;
+  set-sink-volume)
+    v="${3%\\%}"
+    case "$v" in +*|-*) v=$((cur + v)); [ "$v" -lt 0 ] && v=0;; esac
+    echo "$v" > "$state";;
+  set-sink-mute) ;;
+  *) exit 1;;
+esac
+"""
+FAKE_NOOP = "#!/bin/sh\nexit 0\n"
+
+def make_tools(d):
+    tools = {}
+    for name, body in (("pactl", FAKE_PACTL), ("xdg-open", FAKE_NOOP), ("xset", FAKE_NOOP)):
+        path = os.path.join(d, name)
+        with open(path, "w") as f:
+            f.write(body)
+        os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+        tools[name] = path
+    return tools
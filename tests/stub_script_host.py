@@ -0,0 +1,43 @@
+"""
+Stand-in for the osascript host: speaks ScriptHost's JSON-lines protocol so
+the protocol layer can be exercised on any OS. Scripts are tiny commands:
+
+    echo <text>     -> ok, out = text
+    sleep <sec>     -> ok after sleeping (timeouts)
+    fail <text>     -> error = text
+    crash           -> the host exits mid-request (restart path)
+
+    python tests/stub_script_host.py            # host mode (stdin/stdout)
+    python tests/stub_script_host.py --once CMD # one-shot, like `osascript -e`
+"""
+import json
+import sys
+import time
+
+def run_script(src: str) -> dict:
+    op, _, arg = src.partition(" ")
+    if op == "echo":
+        return {"ok": True, "out": arg}
+    if op == "sleep":
+        time.sleep(float(arg or 0))
+        return {"ok": True, "out": ""}
+    if op == "crash":
+        sys.exit(3)
+    return {"ok": False, "error": arg or f"unknown script: {src}"}
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--once":
+        r = run_script(sys.argv[2])
+        print(r.get("out", ""))
+        sys.exit(0 if r["ok"] else 1)
+    out = sys.stdout
+    out.write(json.dumps({"ready": True}) + "\n"); out.flush()
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        req = json.loads(line)
+        out.write(json.dumps({"id": req["id"], "results": [run_script(s) for s in req["scripts"]]}) + "\n")
+        out.flush()
+
+if __name__ == "__main__":
+    main()
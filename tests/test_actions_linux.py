@@ -0,0 +1,115 @@
+import os
+import stat
+import subprocess
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.system import actions_linux
+from src.system.actions_linux import LinuxActions
+from .linux_tools import make_tools
+
+@pytest.fixture
+def tools(tmp_path):
+    return make_tools(str(tmp_path))
+
+def _set_level(tools, level):
+    # Volume changed behind the backend's back (keyboard keys, another app)
+    with open(os.path.join(os.path.dirname(tools["pactl"]), "volume"), "w") as f:
+        f.write(f"{level}\n")
+
+def test_volume_steps_are_relative_to_the_live_level(tools):
+    act = LinuxActions(tools=tools, use_pulse=False)
+    assert act.volume == 50                  # read once at startup
+    act.set_volume(40)
+    act.volume_up()
+    assert act.volume == 46 and act.get_volume() == 46
+    _set_level(tools, 20)
+    act.volume_up()
+    assert act.get_volume() == 26
+    _set_level(tools, 98)
+    act.get_volume()
+    act.volume_up()                          # capped: never boosted past 100%
+    assert act.volume == 100 and act.get_volume() == 100
+    act.volume_step(-200)
+    assert act.get_volume() == 0
+    act.close()
+
+def test_volume_step_is_one_process(tools, monkeypatch):
+    act = LinuxActions(tools=tools, use_pulse=False)
+    calls = []
+    run = subprocess.run
+    monkeypatch.setattr(actions_linux.subprocess, "run", lambda argv, **kw: calls.append(argv) or run(argv, **kw))
+    act.volume_up()
+    act.volume_down()
+    assert [argv[1:] for argv in calls] == [["set-sink-volume", "@DEFAULT_SINK@", "+6%"],
+                                            ["set-sink-volume", "@DEFAULT_SINK@", "-6%"]]
+    act.close()
+
+def test_hung_tool_is_killed_after_the_timeout(tmp_path, tools):
+    hung = tmp_path / "hung"
+    hung.write_text("#!/bin/sh\nsleep 5\n")
+    hung.chmod(hung.stat().st_mode | stat.S_IEXEC)
+    act = LinuxActions(tools=dict(tools, pactl=str(hung)), use_pulse=False, timeout=0.3)
+    t0 = time.perf_counter()
+    act.volume_up()
+    assert time.perf_counter() - t0 < 2.0
+    assert act.volume is None
+    act.close()
+
+def test_launchers_are_detached(tmp_path, tools):
+    slow = tmp_path / "xdg-open"
+    slow.write_text("#!/bin/sh\nsleep 1\n")
+    slow.chmod(slow.stat().st_mode | stat.S_IEXEC)
+    act = LinuxActions(tools=dict(tools, **{"xdg-open": str(slow)}), use_pulse=False)
+    t0 = time.perf_counter()
+    act.open_url("https://example.com")
+    assert time.perf_counter() - t0 < 0.5      # returns without waiting for the launcher
+    assert len(act._children) == 1
+    act.close()
+
+class FakePulse:
+    """The slice of pulsectl.Pulse that _PulseVolume uses."""
+    def __init__(self, name):
+        self.sink = SimpleNamespace(name="sink0", volume=0.5, mute=False)
+        self.closed = False
+
+    def server_info(self):
+        return SimpleNamespace(default_sink_name="sink0")
+
+    def get_sink_by_name(self, name):
+        assert name == "sink0"
+        return self.sink
+
+    def volume_get_all_chans(self, sink):
+        return sink.volume
+
+    def volume_set_all_chans(self, sink, value):
+        sink.volume = value
+
+    def mute(self, sink, mute):
+        sink.mute = mute
+
+    def close(self):
+        self.closed = True
+
+def test_pulsectl_backend_runs_in_process(monkeypatch):
+    monkeypatch.setattr(actions_linux, "pulsectl", SimpleNamespace(Pulse=FakePulse))
+    monkeypatch.setattr(actions_linux.subprocess, "run", None)      # any process start would fail
+    act = LinuxActions()
+    pulse = act._vol._pulse
+    assert isinstance(act._vol, actions_linux._PulseVolume) and act.volume == 50
+    pulse.sink.volume = 0.2                  # changed by another app
+    act.volume_up()
+    assert act.volume == 26 and pulse.sink.volume == pytest.approx(0.26)
+    pulse.sink.volume = 0.97
+    act.volume_up()
+    assert act.get_volume() == 100
+    act.set_volume(30)
+    act.volume_down()
+    assert pulse.sink.volume == pytest.approx(0.24)
+    act.mute_toggle()
+    assert pulse.sink.mute
+    act.close()
+    assert pulse.closed
@@ -0,0 +1,95 @@
+import cv2
+import numpy as np
+import pytest
+
+from src.replay.batch import _output_base, _seek, merge, plan_chunks, recognize_chunk
+from src.replay.recording import Recording
+from .fixtures import make_result
+
+FPS, N = 30.0, 120
+
+@pytest.fixture(scope="module")
+def clip(tmp_path_factory):
+    """MJPG clip whose frame i is a flat image of value 2 * i."""
+    path = str(tmp_path_factory.mktemp("batch") / "clip.avi")
+    w = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), FPS, (64, 48))
+    assert w.isOpened()
+    for i in range(N):
+        w.write(np.full((48, 64, 3), 2 * i, np.uint8))
+    w.release()
+    return path
+
+def _index(frame):
+    return int(round(frame.mean() / 2))
+
+class SeekingCap:
+    """VideoCapture stand-in over N frames whose container seek lands `off` frames away."""
+    def __init__(self, off):
+        self.off, self.pos = off, 0
+
+    def set(self, prop, value):
+        self.pos = max(0, int(value) + self.off) if value else 0
+
+    def grab(self):
+        self.pos += 1
+        return self.pos <= N
+
+    def get(self, prop):
+        assert prop == cv2.CAP_PROP_POS_MSEC
+        return (self.pos - 1) * 1000.0 / FPS
+
+    def retrieve(self):
+        return True, np.full((2, 2, 3), 2 * (self.pos - 1), np.uint8)
+
+@pytest.mark.parametrize("frame", [0, 1, 45, N - 1])
+def test_seek_decodes_the_target_frame(clip, frame):
+    cap = cv2.VideoCapture(clip)
+    assert _index(_seek(cap, frame, FPS)) == frame
+    ok, nxt = cap.read()
+    assert _index(nxt) == frame + 1 if frame + 1 < N else not ok
+    cap.release()
+
+@pytest.mark.parametrize("off", [-7, 0, 5])
+def test_seek_does_not_trust_the_container(off):
+    for frame in (0, 30, 100):
+        assert _index(_seek(SeekingCap(off), frame, FPS)) == frame
+    assert _seek(SeekingCap(off), N + 3, FPS) is None
+
+class FakeRecognizer:
+    def __init__(self, model_path, num_hands):
+        self.open = True
+
+    def recognize_for_video(self, image, ts_ms):
+        i = _index(image.numpy_view())
+        return make_result(1 + i % 2, label="Thumb_Up" if i % 3 else "Victory", seed=i)
+
+    def close(self):
+        self.open = False
+
+def test_chunks_merge_in_order(clip, tmp_path):
+    chunks = plan_chunks(N, FPS, chunk_s=1.0, overlap_s=0.5)
+    assert chunks[0] == (0, 0, 30) and chunks[1] == (15, 30, 60) and chunks[-1][2] is None
+    parts = [recognize_chunk(clip, FPS, w, s, e, str(tmp_path / f"{j}.gcr"), "", 2, FakeRecognizer)
+             for j, (w, s, e) in reversed(list(enumerate(chunks)))][::-1]      # finishing order is irrelevant
+    assert [n for _, n in parts] == [30, 30, 30, 30]
+    whole = recognize_chunk(clip, FPS, 0, 0, None, str(tmp_path / "whole.gcr"), "", 2, FakeRecognizer)[0]
+    assert merge([p for p, _ in parts], str(tmp_path / "merged.gcr")) == N
+
+    merged, ref = Recording(str(tmp_path / "merged.gcr")), Recording(whole)
+    assert merged.ts_ms.tolist() == ref.ts_ms.tolist() == [int(round(i * 1000 / FPS)) for i in range(N)]
+    for a, b in zip(merged, ref):
+        assert a.labels == b.labels and a.n_hands == b.n_hands
+        np.testing.assert_array_equal(a.landmarks, b.landmarks)
+    merged.close()
+    ref.close()
+
+def test_merge_drops_overlapping_frames(clip, tmp_path):
+    a = recognize_chunk(clip, FPS, 0, 0, 40, str(tmp_path / "a.gcr"), "", 2, FakeRecognizer)[0]
+    b = recognize_chunk(clip, FPS, 20, 30, None, str(tmp_path / "b.gcr"), "", 2, FakeRecognizer)[0]
+    assert merge([a, b], str(tmp_path / "m.gcr")) == N
+    assert Recording(str(tmp_path / "m.gcr")).ts_ms.tolist() == [int(round(i * 1000 / FPS)) for i in range(N)]
+
+def test_output_names_are_unique():
+    used = set()
+    names = [_output_base(p, used) for p in ("x/a.mp4", "y/a.mp4", "a_1.mp4", "z/a.mov", "b.mp4")]
+    assert names == ["a", "a_1", "a_1_1", "a_2", "b"]
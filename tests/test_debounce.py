@@ -0,0 +1,30 @@
+import pytest
+
+from src.logic.debounce import GestureDebouncer
+
+def stream(fps, hold_sec=1.0, gap_sec=0.5, cycles=3, ticks=1, **kw):
+    """`cycles` x (hold VOL_UP `hold_sec`, no hand `gap_sec`); fire times in ms from each pose start."""
+    deb, fired = GestureDebouncer(**kw), []
+    period, t, seq = 1000.0 / fps, 0.0, 0
+    for _ in range(cycles):
+        start = t
+        for cmd, dur in (("VOL_UP", hold_sec), (None, gap_sec)):
+            end = t + dur * 1000
+            while t < end:
+                for _ in range(ticks):      # a UI timer polling the same result again
+                    if deb.update(cmd, seq, t) is not None:
+                        fired.append(t - start)
+                seq += 1
+                t += period
+    return fired
+
+@pytest.mark.parametrize("fps", [15, 24, 30, 60, 120])
+def test_hold_time_does_not_depend_on_fps(fps):
+    fired = stream(fps, hold_ms=100.0)
+    assert len(fired) == 3                  # once per held pose, re-armed by the gap
+    for t in fired:
+        assert 100.0 - 1e-6 <= t <= 100.0 + 1000.0 / fps + 1e-6
+
+@pytest.mark.parametrize("fps", [15, 60])
+def test_repolling_a_stale_result_changes_nothing(fps):
+    assert stream(fps, ticks=3) == stream(fps, ticks=1)
@@ -0,0 +1,52 @@
+import stat
+import threading
+import time
+
+from src.system.actions_linux import LinuxActions
+from src.system.executor import ActionExecutor, action_timeout
+
+def _wait(pred, timeout=2.0):
+    end = time.perf_counter() + timeout
+    while not pred() and time.perf_counter() < end:
+        time.sleep(0.005)
+    return pred()
+
+def test_key_stays_busy_until_the_action_ends():
+    release = threading.Event()
+    ex = ActionExecutor(lambda cmd: release.wait(2.0), max_pending=1)
+    assert ex.submit("A")
+    assert _wait(lambda: ex.depth() == 0)        # picked up by the worker
+    assert ex.busy("A") and not ex.submit("A")   # running: coalesced, not started twice
+    assert ex.submit("B") and not ex.submit("C") # queue full: dropped and counted
+    release.set()
+    assert _wait(lambda: not ex.busy("A") and not ex.busy("B"))
+    stats = ex.stats()
+    assert stats["completed"] == 2 and stats["coalesced"] == 1 and stats["dropped"] == 1
+    ex.stop()
+
+def test_action_timeout_is_visible_to_the_backend():
+    seen = []
+    ex = ActionExecutor(lambda cmd: seen.append(action_timeout(9.0)),
+                        timeout_for=lambda cmd: 0.25 if cmd == "FAST" else 4.0)
+    ex.submit("FAST")
+    ex.submit("SLOW")
+    assert _wait(lambda: len(seen) == 2)
+    assert seen == [0.25, 4.0]
+    assert action_timeout(9.0) == 9.0            # outside an action: the caller's default
+    ex.stop()
+
+def test_registry_timeout_kills_a_hung_backend_tool(tmp_path):
+    hung = tmp_path / "pactl"
+    hung.write_text("#!/bin/sh\nsleep 5\n")
+    hung.chmod(hung.stat().st_mode | stat.S_IEXEC)
+    act = LinuxActions(tools={"pactl": str(hung)}, use_pulse=False, timeout=0.2)
+    act._vol.timeout = 30.0                      # backend default far above the action's limit
+    done = []
+    ex = ActionExecutor(lambda cmd: act.volume_down(), on_done=lambda *a: done.append(a[1]),
+                        timeout_for=lambda cmd: 0.3)
+    t0 = time.perf_counter()
+    ex.submit("VOL_DOWN")
+    assert _wait(lambda: done, timeout=3.0)
+    assert time.perf_counter() - t0 < 2.0
+    ex.stop()
+    act.close()
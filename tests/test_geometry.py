@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from src.logic.geometry import (DIR_DOWN, DIR_NONE, DIR_RIGHT, DIR_UP, frame_geometry, hand_geometry, index_is_straight,
+                                infer_pointing_direction)
+from .fixtures import make_hands
+
+def _curl(hf, hand=0):
+    # Fold the index DIP and tip back towards the palm
+    lm = hf.landmarks[hand]
+    mcp, pip = lm[5, :2].copy(), lm[6, :2].copy()
+    lm[7, :2] = pip + (pip - mcp) * 0.3 + np.float32([0.04, 0.0])
+    lm[8, :2] = mcp + np.float32([0.04, 0.0])
+    return hf
+
+def _both_paths(hf):
+    """infer_pointing_direction() via the scalar path and via cached bulk geometry."""
+    hf.geom = None
+    scalar = infer_pointing_direction(hf)
+    frame_geometry(hf)
+    return scalar, infer_pointing_direction(hf)
+
+@pytest.mark.parametrize("n_hands", [1, 2])
+def test_straight_pointing_down(n_hands):
+    hf = make_hands(n_hands, label="None", index_dir=(0.0, 1.0), seed=1)
+    assert index_is_straight(hf.landmarks[0])
+    assert _both_paths(hf) == ("Pointing_Down", "Pointing_Down")
+    assert hf.geom.extended[:, 1].all() and (hf.geom.direction[:, 1] == DIR_DOWN).all()
+
+def test_straight_pointing_up():
+    assert _both_paths(make_hands(1, index_dir=(0.0, -1.0), seed=2)) == ("Pointing_Up", "Pointing_Up")
+
+def test_curled_pointing_down_is_not_pointing():
+    hf = _curl(make_hands(1, label="None", index_dir=(0.0, 1.0), seed=3))
+    assert not index_is_straight(hf.landmarks[0])
+    assert _both_paths(hf) == (None, None)
+    assert not hf.geom.extended[0, 1] and hf.geom.direction[0, 1] == DIR_NONE
+
+def test_curled_first_hand_falls_through_to_second():
+    hf = _curl(make_hands(2, label="None", index_dir=(0.0, 1.0), seed=4))
+    assert _both_paths(hf) == ("Pointing_Down", "Pointing_Down")
+
+def test_sideways_and_empty():
+    assert _both_paths(make_hands(1, index_dir=(1.0, 0.0), seed=5)) == (None, None)
+    assert infer_pointing_direction(make_hands(0)) is None and infer_pointing_direction(None) is None
+
+def test_bulk_matches_per_frame():
+    frames = [make_hands(2, index_dir=d, seed=i) for i, d in enumerate([(0.0, 1.0), (0.0, -1.0), (1.0, 0.0)])]
+    _curl(frames[0], hand=1)
+    stacked = hand_geometry(np.stack([hf.landmarks for hf in frames]))
+    for i, hf in enumerate(frames):
+        g = hand_geometry(hf.landmarks)
+        np.testing.assert_allclose(stacked.cos[i], g.cos, atol=1e-6)
+        np.testing.assert_array_equal(stacked.direction[i], g.direction)
+        assert [bool(index_is_straight(lm)) for lm in hf.landmarks] == g.extended[:, 1].tolist()
+    assert stacked.direction[:, :, 1].tolist() == [[DIR_DOWN, DIR_NONE], [DIR_UP, DIR_UP], [DIR_RIGHT, DIR_RIGHT]]
@@ -0,0 +1,34 @@
+import numpy as np
+
+from src.logic.handframe import N_LANDMARKS, HandFrame
+from .fixtures import empty_result, make_result
+
+def test_from_result_shape_and_labels():
+    res = make_result(2, label="Thumb_Up", score=0.9, seed=0)
+    hf = HandFrame.from_result(res, ts_ms=1234)
+    assert hf.ts_ms == 1234 and hf.n_hands == 2
+    assert hf.landmarks.shape == (2, N_LANDMARKS, 3) and hf.landmarks.dtype == np.float32
+    assert hf.scores.shape == (2, 3) and hf.scores.dtype == np.float32
+    assert hf.handedness == ("Right", "Left")
+    assert hf.labels == (("Thumb_Up", "None", ""), ("Thumb_Up", "None", ""))
+    np.testing.assert_allclose(hf.scores, [[0.9, 0.1, 0.0], [0.7, 0.3, 0.0]], atol=1e-6)
+    assert [name for name, _ in hf.top] == ["Thumb_Up", "Thumb_Up"] and isinstance(hf.top[0][1], float)
+    lm = res.hand_landmarks[1][8]
+    np.testing.assert_allclose(hf.landmarks[1, 8], (lm.x, lm.y, lm.z), atol=1e-6)
+    assert hf.geom is None
+
+def test_top_k_truncates_and_label_picks_the_first_clearing_hand():
+    hf = HandFrame.from_result(make_result(2, label="Victory", score=0.6, seed=1), top_k=1)
+    assert hf.labels == (("Victory",), ("Victory",)) and hf.scores.shape == (2, 1)
+    assert hf.label(0.5) == "Victory 0.60" and hf.label(0.65) is None
+
+def test_partial_and_empty_results():
+    res = make_result(2, seed=2)
+    res.hand_landmarks[0] = res.hand_landmarks[0][:10]       # incomplete hand is skipped
+    del res.gestures[1:], res.handedness[1:]                  # the remaining hand has no categories
+    hf = HandFrame.from_result(res)
+    assert hf.n_hands == 1 and hf.labels == (("", "", ""),) and hf.handedness == ("",)
+    assert not hf.scores.any()
+    for hf in (HandFrame.from_result(empty_result()), HandFrame.from_result(None), HandFrame.empty(5)):
+        assert hf.n_hands == 0 and hf.landmarks.shape == (0, N_LANDMARKS, 3) and hf.top == ()
+        assert hf.label(0.0) is None
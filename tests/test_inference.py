@@ -0,0 +1,71 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from src.vision.inference import InferenceScheduler
+
+FRAME = np.zeros((48, 64, 3), dtype=np.uint8)
+
+class FakeRecognizer:
+    """recognize_async() stand-in; answers after `delay` seconds unless `drop` is set."""
+    def __init__(self, delay=None, drop=False):
+        self.delay, self.drop, self.calls, self.sched = delay, drop, [], None
+
+    def recognize_async(self, image, ts_ms):
+        assert image.numpy_view().shape == FRAME.shape
+        self.calls.append(ts_ms)
+        if self.delay is not None and not self.drop:
+            threading.Timer(self.delay, self.sched.on_result, (ts_ms,)).start()
+
+def _sched(rec, **kw):
+    s = InferenceScheduler(rec, **kw)
+    rec.sched = s
+    return s
+
+def test_in_flight_cap_skips_frames():
+    rec = FakeRecognizer()
+    s = _sched(rec, max_in_flight=2, stale_after=10.0)
+    assert [s.submit(FRAME, ts) for ts in range(5)] == [True, True, False, False, False]
+    assert rec.calls == [0, 1]
+    assert s.on_result(0) is not None and s.on_result(0) is None        # second callback is unknown
+    assert s.submit(FRAME, 5) and not s.submit(FRAME, 6)
+    st = s.stats()
+    assert (st["submitted"], st["completed"], st["skipped"], st["in_flight"]) == (3, 1, 4, 2)
+
+def test_missing_callbacks_expire():
+    rec = FakeRecognizer(drop=True)
+    s = _sched(rec, max_in_flight=1, stale_after=0.05)
+    assert s.submit(FRAME, 0) and not s.submit(FRAME, 1)
+    time.sleep(0.08)
+    assert s.submit(FRAME, 2)                     # the lost submission no longer holds the slot
+    assert s.on_result(0) is None                 # late callback of an expired ts is ignored
+    st = s.stats()
+    assert st["expired"] == 1 and st["skipped"] == 1 and st["in_flight"] == 1
+
+def test_t_ref_sets_latency_origin():
+    s = _sched(FakeRecognizer(), stale_after=10.0)
+    s.submit(FRAME, 0, t_ref=time.perf_counter() - 0.5)
+    assert s.on_result(0) >= 500.0
+
+def test_wait_does_not_drop_frames():
+    n = 40
+    rec = FakeRecognizer(delay=0.002)
+    s = _sched(rec, max_in_flight=1, stale_after=5.0)
+    assert all(s.submit(FRAME, ts, wait=True) for ts in range(n))
+    assert rec.calls == list(range(n))
+    end = time.perf_counter() + 2.0
+    while s.stats()["in_flight"] and time.perf_counter() < end:
+        time.sleep(0.005)
+    st = s.stats()
+    assert st["completed"] == n and st["skipped"] == 0 and st["expired"] == 0
+
+def test_failed_submit_releases_the_slot():
+    class Broken(FakeRecognizer):
+        def recognize_async(self, image, ts_ms):
+            raise RuntimeError("graph closed")
+    s = _sched(Broken(), max_in_flight=1)
+    with pytest.raises(RuntimeError):
+        s.submit(FRAME, 0)
+    assert s.stats()["in_flight"] == 0 and s.stats()["submitted"] == 0
@@ -0,0 +1,74 @@
+import sqlite3
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src.storage.journal import EventJournal
+
+@pytest.fixture
+def journal(tmp_path):
+    j = EventJournal(str(tmp_path / "events.db"), flush_ms=10_000)
+    yield j
+    j.close()
+
+def test_stalled_writer_drops_instead_of_growing(tmp_path):
+    j = EventJournal(str(tmp_path / "slow.db"), max_buffer=500, flush_ms=5, batch=50)
+    gate = threading.Event()
+    j._writer.submit(lambda c: gate.wait(5.0))       # disk stalls
+    for i in range(5000):
+        j.record("seen", "Victory", None, 0.9, t_ms=i)
+        assert len(j._buf) <= j.max_buffer
+        assert j._inflight <= 1                      # one insert at a time
+    stalled = j.stats()
+    assert stalled["dropped"] > 0 and stalled["recorded"] + stalled["dropped"] == 5000
+    assert stalled["written"] == 0
+    gate.set()
+    j.flush().result(5.0)
+    done = j.stats()
+    assert done["written"] == done["recorded"] and done["buffered"] == 0
+    j.close()
+
+def test_flush_makes_every_recorded_event_durable(journal):
+    for i in range(3000):
+        journal.record(("seen", "near", "fire")[i % 3], "Thumb_Up", "VOL_UP", 0.7, t_ms=1000 + i)
+    journal.flush().result(5.0)
+    rows = journal.summary().result(5.0)
+    assert sum(r["n"] for r in rows) == 3000
+    assert {r["kind"]: r["n"] for r in rows} == {"seen": 1000, "near": 1000, "fire": 1000}
+    conn = sqlite3.connect(journal.path)         # on disk, not just in the writer's connection
+    assert conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 3000
+    conn.close()
+
+def _hands(*top):
+    return SimpleNamespace(top=tuple(top))
+
+def test_near_miss_classification(journal):
+    bindings = {"Victory": "MUTE_TOGGLE", "Thumb_Up": "VOL_UP"}
+    thresholds = {"Victory": 0.8}
+    journal.on_result(_hands(("Victory", 0.85)), bindings, thresholds, 0.6)       # seen
+    journal.on_result(_hands(("Victory", 0.70)), bindings, thresholds, 0.6)       # near (within 0.15)
+    journal.on_result(_hands(("Victory", 0.60)), bindings, thresholds, 0.6)       # too far below
+    journal.on_result(_hands(("Thumb_Up", 0.50)), bindings, thresholds, 0.6)      # near (default min)
+    journal.on_result(_hands(("Open_Palm", 0.50)), bindings, thresholds, 0.6)     # unbound: ignored
+    journal.on_result(_hands(), bindings, thresholds, 0.6)                        # no hand
+    journal.flush().result(5.0)
+    rates = {r["label"]: (r["seen"], r["near"], r["near_rate"]) for r in journal.near_misses().result(5.0)}
+    assert rates == {"Victory": (1, 1, 0.5), "Thumb_Up": (0, 1, 1.0)}
+
+def test_fire_is_logged_with_the_triggering_gesture(journal):
+    bindings = {"Thumb_Up": "VOL_UP", "Pointing_Down": "VOL_DOWN"}
+    journal.on_fire("VOL_UP", _hands(("Thumb_Up", 0.7), ("Thumb_Up", 0.9)), bindings)
+    journal.on_fire("VOL_DOWN", _hands(("None", 0.9)), bindings)
+    journal.flush().result(5.0)
+    rows = {(r["label"], r["cmd"]): r["avg_score"] for r in journal.summary().result(5.0)}
+    assert rows[("Thumb_Up", "VOL_UP")] == pytest.approx(0.9)
+    assert rows[("Pointing_Down", "VOL_DOWN")] is None
+
+def test_timeline_buckets(journal):
+    for t in (0, 10, 999, 1000, 2500):
+        journal.record("fire", "Victory", "MUTE_TOGGLE", 0.9, t_ms=t)
+    journal.flush().result(5.0)
+    rows = journal.timeline(bucket_ms=1000).result(5.0)
+    assert [(r["bucket_ms"], r["n"]) for r in rows] == [(0, 3), (1000, 1), (2000, 1)]
+    assert journal.timeline(since_ms=1000, until_ms=2000, bucket_ms=1000).result(5.0)[0]["n"] == 1
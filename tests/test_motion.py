@@ -0,0 +1,44 @@
+import numpy as np
+
+from src.vision.motion import MotionGate, make_gate
+from .fixtures import make_frame
+
+FPS = 30.0
+
+def _run(gate, frames, t0=0.0, hands=False):
+    return [gate.should_infer(f, hands, now=t0 + i / FPS) for i, f in enumerate(frames)]
+
+def _moving(n, seed=0):
+    frame = make_frame(seed=seed)
+    return [np.roll(frame, 8 * i, axis=1) for i in range(n)]
+
+def test_static_scene_idles_at_idle_hz():
+    gate = MotionGate(idle_hz=2.0, hold_sec=1.0)
+    passed = _run(gate, [make_frame()] * int(4 * FPS))
+    assert all(passed[:int(FPS) + 1])                        # full rate until hold_sec has passed
+    assert 5 <= sum(passed[int(FPS) + 1:]) <= 7              # ~2 Hz for the remaining 3 s
+    st = gate.stats()
+    assert st["motion_frames"] == 1 and st["gated"] == st["frames"] - st["passed"] and st["saved_ratio"] >= 0.65
+
+def test_motion_wakes_on_the_next_frame():
+    gate = MotionGate()
+    static = _run(gate, [make_frame()] * 60)
+    assert not static[-1]
+    woke = _run(gate, _moving(10, seed=1), t0=60 / FPS)
+    assert all(woke) and gate.stats()["motion_frames"] == 11
+
+def test_hands_keep_the_gate_open():
+    gate = MotionGate()
+    assert all(_run(gate, [make_frame()] * 90, hands=True))
+    assert gate.stats()["gated"] == 0
+
+def test_small_changes_are_not_motion():
+    gate = MotionGate()
+    base = make_frame()
+    noisy = [np.clip(base.astype(np.int16) + (i % 3), 0, 255).astype(np.uint8) for i in range(90)]
+    assert not all(_run(gate, noisy))
+
+def test_make_gate():
+    assert make_gate(False) is None and make_gate(None) is None
+    assert isinstance(make_gate(True), MotionGate)
+    assert make_gate({"idle_hz": 5.0}).idle_hz == 5.0
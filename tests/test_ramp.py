@@ -0,0 +1,36 @@
+import pytest
+
+from src.logic.debounce import GestureDebouncer
+from src.logic.ramp import VolumeRamp
+
+def ramp_stream(fps, hold_sec=2.0, start=50, **kw):
+    """Hold VOL_UP for `hold_sec`, then release; returns the VOL_SET targets sent."""
+    deb, ramp, sent = GestureDebouncer(), VolumeRamp(**kw), []
+    period, t, seq = 1000.0 / fps, 0.0, 0
+    for cmd, dur in (("VOL_UP", hold_sec), (None, 0.3)):
+        end = t + dur * 1000
+        while t < end:
+            if deb.update(cmd, seq, t):
+                start = min(100, start + 6)         # the single step that fired
+            target = ramp.update(deb.held_cmd, deb.held_since_ms, t, start)
+            if target is not None:
+                sent.append(target)
+            seq += 1
+            t += period
+    return sent
+
+@pytest.mark.parametrize("fps", [15, 30, 60, 120])
+def test_ramp_is_rate_limited_and_fps_independent(fps):
+    sent = ramp_stream(fps, rate=40.0, max_hz=5.0)
+    assert sent[-1] == 100
+    assert len(sent) <= 2.0 * 5.0 + 1
+    assert sent == sorted(sent) and sent[0] > 56     # starts past the fired step, never moves back
+
+def test_short_gesture_stays_a_single_step():
+    assert ramp_stream(30, hold_sec=0.3, delay_ms=350.0) == []
+
+def test_ramp_waits_for_a_known_level():
+    ramp = VolumeRamp(delay_ms=0.0)
+    assert ramp.update("VOL_UP", 0, 100, None) is None      # step still running: no level yet
+    assert ramp.update("VOL_UP", 0, 200, 56) is None        # starts here
+    assert ramp.update("VOL_UP", 0, 500, None) == 68        # 40 %/s over 300 ms
@@ -0,0 +1,97 @@
+import os
+import random
+
+import numpy as np
+import pytest
+
+from src.logic.choose import choose_command
+from src.logic.debounce import make_debouncer
+from src.logic.handframe import HandFrame
+from src.replay.recording import HEADER_SIZE, Recorder, Recording
+from src.replay.replay import replay
+from .fixtures import make_hands
+
+BINDINGS = {"Thumb_Up": "VOL_UP", "Thumb_Down": "VOL_DOWN", "Closed_Fist": "MUTE_TOGGLE",
+            "Victory": "OPEN_URL", "Pointing_Down": "VOL_DOWN"}
+
+def _at(ts, pose):
+    if pose is None:
+        return HandFrame.empty(ts)
+    return HandFrame(ts, pose.landmarks.copy(), pose.handedness, pose.labels, pose.scores)
+
+def _write(path, frames):
+    rec = Recorder(path)
+    for hf in frames:
+        rec.write(hf)
+    return rec
+
+def test_round_trip(tmp_path):
+    frames = [_at(10, make_hands(1, label="Thumb_Up", score=0.9, seed=1)), HandFrame.empty(43),
+              _at(76, make_hands(2, label="My_Custom_Sign", score=0.8, seed=2))]
+    path = str(tmp_path / "s.gcr")
+    _write(path, frames).close()
+    rec = Recording(path)
+    assert len(rec) == 3 and rec.ts_ms.tolist() == [10, 43, 76]
+    for want, got in zip(frames, rec):
+        assert got.ts_ms == want.ts_ms and got.n_hands == want.n_hands
+        assert got.handedness == want.handedness
+        assert got.labels == tuple(tuple(lab[:3]) for lab in want.labels)
+        np.testing.assert_array_equal(got.landmarks, want.landmarks)
+        np.testing.assert_allclose(got.scores, want.scores[:, :3])
+        assert got.top == want.top
+    assert rec.frame(2).labels[0][0] == "My_Custom_Sign"      # extra label via the label table
+    rec.close()
+
+def test_torn_last_record_is_ignored(tmp_path):
+    path = str(tmp_path / "crash.gcr")
+    rec = _write(path, [_at(t, make_hands(1, seed=t)) for t in range(5)] + [_at(9, make_hands(2, seed=9))])
+    rec._f.flush()                      # crash: no close(), no label table
+    size = os.path.getsize(path)
+    one = rec.dtype.itemsize
+    torn = str(tmp_path / "torn.gcr")
+    with open(path, "rb") as f:
+        data = f.read()
+    for cut, frames in ((size - one // 2, 5),           # half a record written
+                        (size - one, 5),                # 2-hand frame with only its first hand
+                        (size - 2 * one - 7, 4)):       # torn record of an earlier frame
+        with open(torn, "wb") as f:
+            f.write(data[:cut])
+        r = Recording(torn)
+        assert len(r) == frames and [hf.ts_ms for hf in r] == list(range(frames))
+        assert r.frame(0).labels[0][0] == "Thumb_Up"    # built-in labels work without the table
+    rec.close()
+    assert (size - HEADER_SIZE) % one == 0
+
+def _session(n, seed=0):
+    poses = [make_hands(1, label=lab, score=sc, seed=i)
+             for i, (lab, sc) in enumerate([("Thumb_Up", 0.9), ("Thumb_Down", 0.8), ("Victory", 0.55),
+                                            ("Open_Palm", 0.7)])]
+    poses += [make_hands(2, label="Closed_Fist", score=0.85, seed=9),
+              make_hands(1, label="None", index_dir=(0.0, 1.0), seed=10)]       # geometric Pointing_Down
+    rnd, ts, out = random.Random(seed), 0, []
+    while len(out) < n:
+        pose = rnd.choice(poses + [None])
+        for _ in range(rnd.randint(3, 40)):
+            ts += rnd.randint(28, 40)
+            out.append(_at(ts, pose))
+    return out[:n]
+
+@pytest.mark.parametrize("thresholds", [None, {"Victory": 0.5}])
+def test_replay_matches_the_live_path(tmp_path, thresholds):
+    live = _session(3000)
+    path = str(tmp_path / "s.gcr")
+    _write(path, live).close()
+
+    chosen_live = [choose_command(hf, BINDINGS, thresholds) for hf in live]
+    rec = Recording(path)
+    assert [choose_command(hf, BINDINGS, thresholds) for hf in rec] == chosen_live
+    assert "VOL_DOWN" in chosen_live and "MUTE_TOGGLE" in chosen_live
+
+    d, fires = make_debouncer(), []
+    for hf, cmd in zip(live, chosen_live):
+        fired = d.update(cmd, hf.ts_ms, hf.ts_ms)
+        if fired is not None:
+            fires.append((hf.ts_ms, fired))
+    out = replay(rec, BINDINGS, thresholds)
+    assert fires and [(ts, cmd) for ts, cmd, _ in out["fires"]] == fires and out["frames"] == 3000
+    rec.close()
@@ -0,0 +1,79 @@
+import numpy as np
+
+from src.vision.roi import RoiTracker, make_tracker
+from .fixtures import FRAME_H, FRAME_W, make_frame, make_hands
+
+def _shift(hf, dx=0.0, dy=0.0):
+    hf.landmarks[..., 0] += dx
+    hf.landmarks[..., 1] += dy
+    return hf
+
+def _on_crop(hf, roi):
+    """The landmarks the recognizer would report for `hf` seen through crop box `roi`."""
+    x0, y0, x1, y1 = roi
+    ox, oy, sw, sh = x0 / FRAME_W, y0 / FRAME_H, (x1 - x0) / FRAME_W, (y1 - y0) / FRAME_H
+    out = make_hands(hf.n_hands)
+    out.landmarks[:] = hf.landmarks
+    out.landmarks[..., 0] = (out.landmarks[..., 0] - ox) / sw
+    out.landmarks[..., 1] = (out.landmarks[..., 1] - oy) / sh
+    out.landmarks[..., 2] /= sw
+    return out
+
+def test_crop_map_round_trip():
+    rt, frame, hands = RoiTracker(infer_size=128), make_frame(), make_hands(1, seed=0)
+    img = rt.crop(frame, hands, 100)
+    x0, y0, x1, y1 = rt._cur
+    assert max(img.shape[:2]) == 128 and abs(img.shape[1] / img.shape[0] - (x1 - x0) / (y1 - y0)) < 0.02
+    rt.commit(100)
+    seen = _on_crop(hands, rt._cur)
+    assert rt.map_frame(seen, 100) is seen
+    np.testing.assert_allclose(seen.landmarks, hands.landmarks, atol=1e-5)
+    other = make_hands(1, seed=1)
+    before = other.landmarks.copy()
+    rt.map_frame(other, 100)                                 # roi consumed: later callbacks are untouched
+    np.testing.assert_array_equal(other.landmarks, before)
+
+def test_no_hands_submits_the_full_frame():
+    rt, frame = RoiTracker(), make_frame()
+    assert rt.crop(frame, None, 1) is frame and rt.crop(frame, make_hands(0), 2) is frame
+    rt.commit(2)
+    assert rt.stats() == {"roi_frames": 0, "full_frames": 1, "moves": 0}
+
+def test_box_stays_put_then_refits_near_an_edge():
+    rt, frame, hands = RoiTracker(), make_frame(), make_hands(1, seed=0)
+    rt.crop(frame, hands, 1)
+    box = rt._cur
+    rt.crop(frame, _shift(hands, dx=0.01), 2)               # small move inside the box
+    assert rt._cur == box and rt.moves == 1
+    bx0, _, bx1, _ = box
+    step = (bx1 - bx0) * 0.2 / FRAME_W
+    rt.crop(frame, _shift(hands, dx=step), 3)               # hands reach the right border zone
+    assert rt._cur != box and rt.moves == 2
+    x0, y0, x1, y1 = RoiTracker._extent(hands, FRAME_W, FRAME_H)
+    nx0, ny0, nx1, ny1 = rt._cur
+    m = rt.edge * max(nx1 - nx0, ny1 - ny0)
+    assert nx0 + m <= x0 and x1 <= nx1 - m and ny0 + m <= y0 and y1 <= ny1 - m
+
+def test_box_is_clamped_to_the_image():
+    rt, frame = RoiTracker(), make_frame()
+    hands = _shift(make_hands(1, seed=0), dx=0.6)           # hand partly off the right side
+    img = rt.crop(frame, hands, 1)
+    x0, y0, x1, y1 = rt._cur
+    assert 0 <= x0 < x1 == FRAME_W and 0 <= y0 < y1 <= FRAME_H and img.size
+    rt.crop(frame, _shift(hands, dx=0.02), 2)               # image border does not force a re-fit
+    assert rt.moves == 1
+
+def test_only_committed_frames_are_counted():
+    rt, frame, hands = RoiTracker(keep=4), make_frame(), make_hands(1, seed=0)
+    for ts in range(10):
+        rt.crop(frame, hands, ts)
+        if ts % 3 == 0:
+            rt.commit(ts)
+    assert rt.stats()["roi_frames"] == 4 and rt.stats()["full_frames"] == 0
+    assert sorted(rt._rois) == [0, 3, 6, 9]                 # skipped frames left nothing behind
+    rt.commit(5)                                             # stale commit: ignored
+    assert rt.stats()["roi_frames"] == 4
+
+def test_make_tracker():
+    assert make_tracker(False) is None and isinstance(make_tracker(True), RoiTracker)
+    assert make_tracker({"infer_size": 256}).infer_size == 256
@@ -0,0 +1,57 @@
+import os
+import sys
+import time
+
+import pytest
+
+from src.system.actions_mac import MacActions
+from src.system.script_host import HostError, ScriptHost
+
+# Stand-in host speaking the JSON-lines protocol (echo / sleep / fail / crash scripts)
+STUB = [sys.executable, os.path.join(os.path.dirname(__file__), "stub_script_host.py")]
+
+@pytest.fixture
+def host():
+    h = ScriptHost(STUB, timeout=0.3, max_restarts=2)
+    yield h
+    h.close()
+
+def test_round_trip(host):
+    assert host.run("echo hi") == (True, "hi")
+    assert host.run("fail nope") == (False, "nope")
+    assert host.run_batch(["echo a", "fail b", "echo c"]) == [(True, "a"), (False, "b"), (True, "c")]
+    assert host.starts == 1
+
+@pytest.mark.parametrize("script", ["crash", "sleep 1"])
+def test_dead_or_hung_host_is_restarted(host, script):
+    t0 = time.perf_counter()
+    with pytest.raises(HostError) as e:
+        host.run(script)
+    assert e.value.sent                      # may have run: callers must not retry it
+    assert time.perf_counter() - t0 < 1.0    # a hung host is killed after `timeout`
+    assert host.run("echo back") == (True, "back")
+    assert host.starts == 2
+
+def test_host_is_given_up_after_repeated_failures(host):
+    for _ in range(host.max_restarts + 1):
+        with pytest.raises(HostError):
+            host.run("crash")
+    assert host.failed
+
+def test_mac_actions_batch_through_the_host():
+    mac = MacActions(host_argv=STUB)
+    try:
+        assert mac.run_scripts(["echo 1", "fail x"]) == [True, False]
+        assert mac._host.round_trips == 1
+    finally:
+        mac.close()
+
+def test_mac_volume_step_returns_the_new_level(monkeypatch):
+    mac = MacActions(host_argv=STUB)
+    try:
+        monkeypatch.setattr(mac, "_run", lambda scripts: [(True, "56")])
+        assert mac.volume_step(+6) == 56 and mac.volume == 56
+        monkeypatch.setattr(mac, "_run", lambda scripts: [(False, "")])
+        assert mac.volume_step(+6) == 56             # failed step: last known level
+    finally:
+        mac.close()
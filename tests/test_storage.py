@@ -0,0 +1,99 @@
+import random
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from src.storage.db import UrlStore
+
+@pytest.fixture
+def store(tmp_path):
+    s = UrlStore(str(tmp_path / "gesture.db"))
+    yield s
+    s.close()
+
+def _db_rows(path):
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    try:
+        return [dict(r) for r in conn.execute("SELECT id,name,url FROM urls ORDER BY id ASC")]
+    finally:
+        conn.close()
+
+def test_concurrent_readers_and_writers(tmp_path):
+    path = str(tmp_path / "gesture.db")
+    store = UrlStore(path)
+    stop, errors = threading.Event(), []
+
+    def writer(seed):
+        rnd = random.Random(seed)
+        while not stop.is_set():
+            names = store.list_names()
+            name = f"n{rnd.randrange(20)}"
+            op = rnd.random()
+            try:
+                if op < 0.4:
+                    store.add_url(name, f"https://{name}.example")
+                elif op < 0.6 and names:
+                    store.update_url(rnd.choice(names), name, f"https://{name}.example/r")
+                elif op < 0.8 and names:
+                    store.delete_url(rnd.choice(names))
+                elif names:
+                    store.set_active_name(rnd.choice(names))
+            except (ValueError, sqlite3.IntegrityError):
+                pass     # LIMIT reached, duplicate or already deleted name
+            except Exception as e:
+                errors.append(repr(e))
+
+    def reader():
+        n = 0
+        while not stop.is_set():
+            store.get_active_url()
+            if len(store.list_names()) > store.LIMIT:
+                errors.append("snapshot count > LIMIT")
+            n += 1
+            if n % 50 == 0 and store.query("SELECT COUNT(*) AS c FROM urls").result()[0]["c"] > store.LIMIT:
+                errors.append("pool count > LIMIT")
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(4)]
+    threads += [threading.Thread(target=reader) for _ in range(4)]
+    for t in threads:
+        t.start()
+    time.sleep(1.0)
+    stop.set()
+    for t in threads:
+        t.join()
+
+    rows, active = store.list_urls(), store.get_active_name()
+    store.close()
+    assert not errors, sorted(set(errors))[:10]
+    assert _db_rows(path) == rows
+    assert not rows or active in {r["name"] for r in rows}
+
+def test_limit(store):
+    for i in range(store.LIMIT - store.count()):
+        store.add_url(f"u{i}", f"https://u{i}.example")
+    with pytest.raises(ValueError):
+        store.add_url("one-more", "https://x.example")
+    assert store.count() == store.LIMIT
+
+def test_config_setters_are_debounced_and_persisted(tmp_path):
+    path = str(tmp_path / "gesture.db")
+    store = UrlStore(path, save_delay=60.0)
+    store.set_binding("Victory", "MUTE_TOGGLE")
+    store.set_threshold("Victory", 0.8)
+    store.set_camera(2)
+    store.set_engine_param("fast_draw", True)
+    assert "Victory" not in store.config.bindings     # staged, not written yet
+    store.flush(wait=True)
+    cfg = store.config
+    assert cfg.bindings["Victory"] == "MUTE_TOGGLE" and cfg.thresholds["Victory"] == 0.8
+    store.close()
+
+    store = UrlStore(path)
+    cfg = store.config
+    store.close()
+    assert cfg.bindings["Victory"] == "MUTE_TOGGLE"
+    assert cfg.thresholds["Victory"] == pytest.approx(0.8)
+    assert cfg.camera_index == 2 and cfg.engine["fast_draw"] is True